@@ -4,6 +4,11 @@ Provides functions to load data from various sources including databases,
 files (CSV, Excel, JSON), and more.
 """
 import os
+import io
+import asyncio
+import hashlib
+import functools
+import threading
 import pandas as pd
 import numpy as np
 import json
@@ -13,9 +18,87 @@ import sqlalchemy as db
 from sqlalchemy.engine import Engine, Connection
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.json as paj
+    HAS_PYARROW = True
+except ImportError:
+    pa = pacsv = paj = None
+    HAS_PYARROW = False
+
+try:
+    import python_calamine  # noqa: F401
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
 
 logger = logging.getLogger(__name__)
 
+# SQLAlchemy engines (and their connection pools) shared across loads, keyed
+# by a hash of the connection string
+_ENGINE_CACHE: Dict[str, Engine] = {}
+_ENGINE_CACHE_LOCK = threading.Lock()
+
+# Connection string templates by database type; missing parameters render as
+# "None", as the driver will then report
+_CONNECTION_TEMPLATES = {
+    'postgres': "postgresql://{username}:{password}@{host}:{port}/{database}",
+    'mysql': "mysql+pymysql://{username}:{password}@{host}:{port}/{database}",
+    'sqlite': "sqlite:///{database}",
+    'mssql': "mssql+pyodbc://{username}:{password}@{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server",
+    'oracle': "oracle+cx_oracle://{username}:{password}@{dsn}",
+}
+_DB_TYPE_ALIASES = {'postgresql': 'postgres', 'sqlserver': 'mssql'}
+_DEFAULT_PORTS = {'postgres': 5432, 'mysql': 3306, 'mssql': 1433, 'oracle': 1521}
+
+
+class _ConnectionParams(dict):
+    """Connection parameters that format missing keys as None."""
+    
+    def __missing__(self, key: str) -> None:
+        return None
+
+# Files at least this large are memory-mapped and handed to pyarrow directly
+MMAP_THRESHOLD_BYTES = 64 << 20
+# Parse block size for pyarrow readers and buffer size for pandas C-engine reads
+READ_BLOCK_SIZE_BYTES = 32 << 20
+FILE_BUFFER_BYTES = 8 << 20
+# API responses at least this large are parsed incrementally from the socket
+STREAM_THRESHOLD_BYTES = 16 << 20
+
+# Keep-alive HTTP session shared by API loads so repeat requests skip the
+# TCP/TLS handshake
+DEFAULT_API_TIMEOUT = (5, 60)  # (connect, read) seconds
+_SESSION = requests.Session()
+_SESSION_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount("https://", _SESSION_ADAPTER)
+_SESSION.mount("http://", _SESSION_ADAPTER)
+
 class DataLoader:
     """
     Loads data from various sources into pandas DataFrames for BI visualization.
@@ -23,7 +106,8 @@ class DataLoader:
     """
     
     @staticmethod
-    def load_from_database(connection_params: Dict[str, Any], query: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    def load_from_database(connection_params: Dict[str, Any], query: str,
+                           compress: bool = False, use_arrow_dtypes: bool = True) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
         Load data from database using SQL query
         
@@ -35,29 +119,51 @@ class DataLoader:
                 - username: Database username (if applicable)
                 - password: Database password (if applicable)
                 - database: Database name or path
+                - partition_on: Numeric column used to split the query across
+                  parallel connections (connectorx only, optional)
+                - partition_num: Number of partitions (connectorx only, default 4)
+                - use_copy: Stream PostgreSQL results with COPY ... TO STDOUT as CSV
+                  (default True)
+                - yield_per: Rows per server-side cursor fetch (default 50000)
+                - chunksize: Rows per fetch when falling back to pd.read_sql (optional)
             query: SQL query to execute
+            compress: Whether to downcast numeric and low-cardinality string columns
+            use_arrow_dtypes: Whether to return Arrow-backed (dtype_backend="pyarrow") columns
             
         Returns:
             Tuple of (DataFrame with query results, metadata)
         """
         try:
-            engine = DataLoader._create_db_engine(connection_params)
             db_type = connection_params.get('type', '').lower()
             
             logger.info(f"Executing query on {db_type} database")
             
             # Execute the query and return results as DataFrame
-            df = pd.read_sql(query, engine)
+            use_arrow_dtypes = use_arrow_dtypes and HAS_PYARROW
+            df = DataLoader._read_sql_arrow(connection_params, query, use_arrow_dtypes) if cx is not None else None
+            if df is None:
+                engine = DataLoader._create_db_engine(connection_params)
+                chunksize = connection_params.get('chunksize')
+                if db_type in ('postgres', 'postgresql') and connection_params.get('use_copy', True):
+                    df = DataLoader._read_sql_copy(engine, query, use_arrow_dtypes)
+                if df is None and HAS_PYARROW:
+                    yield_per = connection_params.get('yield_per') or chunksize or 50_000
+                    df = DataLoader._read_sql_streaming(engine, query, yield_per, use_arrow_dtypes)
+                sql_kwargs = {"dtype_backend": "pyarrow"} if use_arrow_dtypes else {}
+                if df is None and chunksize:
+                    chunks = list(pd.read_sql(query, engine, chunksize=chunksize, **sql_kwargs))
+                    df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+                elif df is None:
+                    df = pd.read_sql(query, engine, **sql_kwargs)
+            if compress:
+                df = DataLoader._compress(df)
             
             # Create metadata about the dataset
             metadata = {
                 "source_type": "database",
                 "database_type": db_type,
                 "database_name": connection_params.get('database'),
-                "row_count": len(df),
-                "column_count": len(df.columns),
-                "columns": list(df.columns),
-                "dtypes": {col: str(df[col].dtype) for col in df.columns},
+                **DataLoader._frame_metadata(df, compress),
                 "query": query
             }
             
@@ -69,36 +175,81 @@ class DataLoader:
             raise
     
     @staticmethod
-    def load_from_csv(file_path: str, **kwargs) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    def load_from_csv(file_path: str, compress: bool = False, use_arrow_dtypes: bool = True,
+                      **kwargs) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
         Load data from CSV file
         
         Args:
             file_path: Path to CSV file
-            **kwargs: Additional parameters for pd.read_csv (e.g. encoding, delimiter)
+            compress: Whether to downcast numeric and low-cardinality string columns
+            use_arrow_dtypes: Whether to return Arrow-backed (dtype_backend="pyarrow") columns
+            **kwargs: Additional parameters for pd.read_csv (e.g. encoding, delimiter).
+                Passing chunksize streams the file in chunks to bound peak memory;
+                block_size sets the pyarrow parse block size in bytes.
             
         Returns:
             Tuple of (DataFrame with loaded data, metadata)
         """
         try:
             logger.info(f"Loading data from CSV: {file_path}")
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"CSV file not found: {file_path}")
-                
+            file_stats = os.stat(file_path)
+            
             # Read the CSV file
-            df = pd.read_csv(file_path, **kwargs)
+            read_kwargs = dict(kwargs)
+            chunksize = read_kwargs.pop('chunksize', None)
+            block_size = read_kwargs.pop('block_size', READ_BLOCK_SIZE_BYTES)
+            direct_arrow = not read_kwargs and not chunksize and HAS_PYARROW
+            use_arrow_dtypes = use_arrow_dtypes and HAS_PYARROW
+            if use_arrow_dtypes:
+                read_kwargs.setdefault('dtype_backend', 'pyarrow')
+            
+            if direct_arrow:
+                # Default options: parse directly with pyarrow using large blocks,
+                # memory-mapping big files so they are read from the page cache
+                read_options = pacsv.ReadOptions(block_size=block_size, use_threads=True)
+                convert_options = DataLoader._pandas_compatible_convert_options(file_path)
+                if file_stats.st_size >= MMAP_THRESHOLD_BYTES:
+                    with pa.memory_map(file_path, 'r') as source:
+                        table = pacsv.read_csv(source, read_options=read_options, convert_options=convert_options)
+                else:
+                    table = pacsv.read_csv(file_path, read_options=read_options, convert_options=convert_options)
+                df = DataLoader._table_to_pandas(table, use_arrow_dtypes)
+            elif chunksize:
+                # The pyarrow engine cannot stream, so chunked reads use the C engine
+                if read_kwargs.get('engine') == 'pyarrow':
+                    read_kwargs.pop('engine')
+                row_count = 0
+                chunks = []
+                with open(file_path, 'rb', buffering=FILE_BUFFER_BYTES) as f, \
+                        pd.read_csv(f, chunksize=chunksize, **read_kwargs) as reader:
+                    for chunk in reader:
+                        row_count += len(chunk)
+                        chunks.append(chunk)
+                df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+                logger.info(f"Read {row_count} rows from CSV in {len(chunks)} chunks of {chunksize}")
+            elif 'engine' not in read_kwargs and HAS_PYARROW:
+                # Prefer the multithreaded pyarrow parser, falling back to the
+                # C engine for options it does not support
+                try:
+                    df = pd.read_csv(file_path, engine='pyarrow', **read_kwargs)
+                except (ImportError, ValueError) as e:
+                    logger.debug(f"pyarrow CSV engine unavailable ({e}), using C engine")
+                    df = DataLoader._read_csv_buffered(file_path, read_kwargs)
+            else:
+                df = DataLoader._read_csv_buffered(file_path, read_kwargs)
+            
+            if compress:
+                df = DataLoader._compress(df)
             
             # Create metadata
-            file_stats = os.stat(file_path)
             metadata = {
                 "source_type": "file",
                 "file_type": "csv",
                 "file_path": file_path,
                 "file_size_bytes": file_stats.st_size,
-                "row_count": len(df),
-                "column_count": len(df.columns),
-                "columns": list(df.columns),
-                "dtypes": {col: str(df[col].dtype) for col in df.columns},
+                **DataLoader._frame_metadata(df, compress),
+                "block_size": block_size,
                 "read_params": kwargs
             }
             
@@ -110,36 +261,138 @@ class DataLoader:
             raise
     
     @staticmethod
-    def load_from_excel(file_path: str, sheet_name: Optional[str] = None, **kwargs) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    def _pandas_compatible_convert_options(file_path: str) -> "pacsv.ConvertOptions":
+        """
+        Build pyarrow CSV convert options that parse like pd.read_csv defaults
+        
+        Empty fields of string columns become null instead of '', and columns
+        pyarrow would infer as dates or timestamps stay strings, as pandas
+        only parses dates when asked to.
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            Convert options for pacsv.read_csv
+        """
+        # Peek at the types pyarrow infers from the start of the file
+        with pacsv.open_csv(file_path, read_options=pacsv.ReadOptions(block_size=1 << 20)) as reader:
+            schema = reader.schema
+        temporal = {
+            field.name: pa.string() for field in schema
+            if pa.types.is_date(field.type) or pa.types.is_timestamp(field.type) or pa.types.is_time(field.type)
+        }
+        return pacsv.ConvertOptions(strings_can_be_null=True, column_types=temporal)
+    
+    @staticmethod
+    def preview_csv(file_path: str, preview_rows: int = 5, delimiter: str = ",",
+                    use_arrow_dtypes: bool = True) -> Tuple[int, pd.DataFrame]:
+        """
+        Count the rows of a CSV file and read its first rows without loading it
+        
+        The count streams the file one block at a time, parsing only the first
+        column as strings, so memory stays bounded by the block size.
+        
+        Args:
+            file_path: Path to CSV file
+            preview_rows: Number of rows to read for the preview
+            delimiter: Field delimiter
+            use_arrow_dtypes: Whether to return Arrow-backed (dtype_backend="pyarrow") columns
+            
+        Returns:
+            Tuple of (row count, DataFrame with the first preview_rows rows)
+        """
+        read_kwargs = {'sep': delimiter, 'nrows': preview_rows}
+        if use_arrow_dtypes and HAS_PYARROW:
+            read_kwargs['dtype_backend'] = 'pyarrow'
+        preview = DataLoader._read_csv_buffered(file_path, read_kwargs)
+        if len(preview.columns) == 0:
+            return 0, preview
+        
+        if HAS_PYARROW:
+            # pyarrow names columns itself (e.g. an empty header stays ''),
+            # so take the first column's name from its own schema
+            parse_options = pacsv.ParseOptions(delimiter=delimiter)
+            with pacsv.open_csv(file_path, read_options=pacsv.ReadOptions(block_size=1 << 20),
+                                parse_options=parse_options) as header_reader:
+                first_column = header_reader.schema.names[0]
+            reader = pacsv.open_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(block_size=READ_BLOCK_SIZE_BYTES),
+                parse_options=parse_options,
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=[first_column], column_types={first_column: pa.string()}
+                )
+            )
+            row_count = sum(batch.num_rows for batch in reader)
+        else:
+            row_count = 0
+            with open(file_path, 'rb', buffering=FILE_BUFFER_BYTES) as f, \
+                    pd.read_csv(f, sep=delimiter, usecols=[0], dtype=str, chunksize=100_000) as reader:
+                for chunk in reader:
+                    row_count += len(chunk)
+        
+        logger.info(f"Previewed CSV {file_path}: {row_count} rows")
+        return row_count, preview
+    
+    @staticmethod
+    def _read_csv_buffered(file_path: str, read_kwargs: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Read a CSV through a file handle with a large read buffer
+        
+        Args:
+            file_path: Path to CSV file
+            read_kwargs: Parameters for pd.read_csv
+            
+        Returns:
+            DataFrame with loaded data
+        """
+        if read_kwargs.get('engine') == 'pyarrow':
+            return pd.read_csv(file_path, **read_kwargs)
+        with open(file_path, 'rb', buffering=FILE_BUFFER_BYTES) as f:
+            return pd.read_csv(f, **read_kwargs)
+    
+    @staticmethod
+    def load_from_excel(file_path: str, sheet_name: Optional[str] = None,
+                        compress: bool = False, use_arrow_dtypes: bool = True,
+                        **kwargs) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
         Load data from Excel file
         
         Args:
             file_path: Path to Excel file
             sheet_name: Sheet name or index (optional)
-            **kwargs: Additional parameters for pd.read_excel
+            compress: Whether to downcast numeric and low-cardinality string columns
+            use_arrow_dtypes: Whether to return Arrow-backed (dtype_backend="pyarrow") columns
+            **kwargs: Additional parameters for pd.read_excel. The Rust-based
+                calamine engine is used by default when python-calamine is installed
             
         Returns:
             Tuple of (DataFrame with loaded data, metadata)
         """
         try:
             logger.info(f"Loading data from Excel: {file_path}")
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Excel file not found: {file_path}")
-                
-            # Read the Excel file
-            df = pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
             
-            # Handle case where multiple sheets are returned
-            if isinstance(df, dict):
+            # Read the Excel file, opening the workbook once and parsing only the needed sheet
+            engine = kwargs.pop('engine', None) or ('calamine' if HAS_CALAMINE else None)
+            parse_kwargs = dict(kwargs)
+            if use_arrow_dtypes and HAS_PYARROW:
+                parse_kwargs.setdefault('dtype_backend', 'pyarrow')
+            with pd.ExcelFile(file_path, engine=engine) as excel_file:
+                engine = excel_file.engine
                 if sheet_name is None:
                     # If no specific sheet was requested, use the first sheet
-                    sheet_name = list(df.keys())[0]
-                    df = df[sheet_name]
-                    logger.info(f"Multiple sheets found, using sheet: {sheet_name}")
-                else:
-                    # This shouldn't happen normally, but handle it anyway
-                    raise ValueError(f"Multiple sheets returned when specific sheet '{sheet_name}' was requested")
+                    sheet_name = excel_file.sheet_names[0]
+                    logger.info(f"No sheet specified, using sheet: {sheet_name}")
+                df = excel_file.parse(sheet_name, **parse_kwargs)
+            
+            # Handle case where multiple sheets are returned
+            if isinstance(df, dict):
+                # This shouldn't happen normally, but handle it anyway
+                raise ValueError(f"Multiple sheets returned when specific sheet '{sheet_name}' was requested")
+            
+            if compress:
+                df = DataLoader._compress(df)
             
             # Create metadata
             file_stats = os.stat(file_path)
@@ -148,11 +401,9 @@ class DataLoader:
                 "file_type": "excel",
                 "file_path": file_path,
                 "sheet_name": sheet_name,
+                "engine": engine,
                 "file_size_bytes": file_stats.st_size,
-                "row_count": len(df),
-                "column_count": len(df.columns),
-                "columns": list(df.columns),
-                "dtypes": {col: str(df[col].dtype) for col in df.columns},
+                **DataLoader._frame_metadata(df, compress),
                 "read_params": kwargs
             }
             
@@ -164,35 +415,69 @@ class DataLoader:
             raise
     
     @staticmethod
-    def load_from_json(json_data: Union[str, Dict, List]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    def get_excel_sheet_names(file_path: str) -> List[str]:
+        """
+        List the sheet names of an Excel file without parsing any sheet data
+        
+        Args:
+            file_path: Path to Excel file
+            
+        Returns:
+            Sheet names in workbook order
+        """
+        engine = 'calamine' if HAS_CALAMINE else None
+        with pd.ExcelFile(file_path, engine=engine) as excel_file:
+            return excel_file.sheet_names
+    
+    @staticmethod
+    def load_from_json(json_data: Union[str, Dict, List], compress: bool = False,
+                       use_arrow_dtypes: bool = True) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
         Load data from JSON
         
         Args:
-            json_data: JSON string, file path, or Python dict/list
+            json_data: JSON string, file path, or Python dict/list. Newline-delimited
+                JSON (one record per line) is parsed directly into columnar Arrow
+                buffers when pyarrow is available
+            compress: Whether to downcast numeric and low-cardinality string columns
+            use_arrow_dtypes: Whether to return Arrow-backed (dtype_backend="pyarrow") columns
             
         Returns:
             Tuple of (DataFrame with loaded data, metadata)
         """
         try:
             source_info = {}
+            df = None
+            use_arrow_dtypes = use_arrow_dtypes and HAS_PYARROW
+            
+            # A single stat both detects a file path and gives its size
+            file_stats = None
+            if isinstance(json_data, str):
+                try:
+                    file_stats = os.stat(json_data)
+                except (OSError, ValueError):
+                    pass
             
             # If json_data is a file path
-            if isinstance(json_data, str) and os.path.exists(json_data):
+            if file_stats is not None:
                 logger.info(f"Loading data from JSON file: {json_data}")
-                with open(json_data, 'r') as f:
-                    data = json.load(f)
+                df = DataLoader._read_json_arrow(json_data, use_arrow_dtypes)
+                if df is None:
+                    with open(json_data, 'rb') as f:
+                        data = _json_loads(f.read())
                 source_info = {
                     "source_type": "file",
                     "file_type": "json",
                     "file_path": json_data,
-                    "file_size_bytes": os.stat(json_data).st_size
+                    "file_size_bytes": file_stats.st_size
                 }
             
             # If json_data is a JSON string
             elif isinstance(json_data, str):
                 logger.info("Parsing JSON string")
-                data = json.loads(json_data)
+                df = DataLoader._read_json_arrow(json_data.encode(), use_arrow_dtypes)
+                if df is None:
+                    data = _json_loads(json_data)
                 source_info = {
                     "source_type": "string",
                     "string_length": len(json_data)
@@ -207,17 +492,25 @@ class DataLoader:
                     "object_type": type(data).__name__
                 }
             
-            # Convert to DataFrame
-            if isinstance(data, list):
-                if all(isinstance(item, dict) for item in data):
-                    # List of dictionaries
-                    df = pd.json_normalize(data)
+            # Convert to DataFrame, unless the Arrow fast path already did
+            parser = "arrow" if df is not None else "python"
+            if df is not None:
+                pass
+            elif isinstance(data, list):
+                if all(isinstance(item, dict) for item in DataLoader._sample_items(data)):
+                    # List of dictionaries - build columns in Arrow when the
+                    # records share one schema, else flatten them in Python
+                    df = DataLoader._records_to_arrow(data, use_arrow_dtypes)
+                    if df is not None:
+                        parser = "arrow"
+                    else:
+                        df = pd.json_normalize(data)
                 else:
                     # Simple list - convert to single column DataFrame
                     df = pd.DataFrame(data, columns=['value'])
             elif isinstance(data, dict):
                 # Convert dict to DataFrame
-                if all(isinstance(data[k], list) for k in data):
+                if all(isinstance(value, list) for value in DataLoader._sample_items(list(data.values()))):
                     # Dict of lists - each key becomes a column
                     df = pd.DataFrame(data)
                 else:
@@ -226,13 +519,17 @@ class DataLoader:
             else:
                 raise ValueError(f"Unsupported JSON data structure of type {type(data)}")
             
+            if use_arrow_dtypes and parser == "python":
+                df = df.convert_dtypes(dtype_backend="pyarrow")
+            
+            if compress:
+                df = DataLoader._compress(df)
+            
             # Create metadata
             metadata = {
                 **source_info,
-                "row_count": len(df),
-                "column_count": len(df.columns),
-                "columns": list(df.columns),
-                "dtypes": {col: str(df[col].dtype) for col in df.columns}
+                **DataLoader._frame_metadata(df, compress),
+                "parser": parser
             }
             
             logger.info(f"Loaded {len(df)} rows from JSON")
@@ -242,12 +539,126 @@ class DataLoader:
             logger.error(f"JSON loading error: {str(e)}")
             raise
     
+    @staticmethod
+    def _read_json_arrow(source: Union[str, bytes], use_arrow_dtypes: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Parse newline-delimited JSON with pyarrow's multithreaded reader
+        
+        Nested objects are flattened into dotted column names, matching
+        pd.json_normalize.
+        
+        Args:
+            source: File path or raw JSON bytes
+            use_arrow_dtypes: Whether to keep Arrow-backed columns
+            
+        Returns:
+            DataFrame, or None if pyarrow is unavailable or the input is not
+            newline-delimited JSON with more than one record
+        """
+        if not HAS_PYARROW:
+            return None
+        
+        # JSON arrays and pretty-printed documents are not line-delimited
+        if isinstance(source, bytes):
+            if source[:64].lstrip()[:1] != b'{':
+                return None
+            reader = pa.BufferReader(source)
+        else:
+            with open(source, 'rb') as f:
+                head = f.read(64)
+                size = os.fstat(f.fileno()).st_size
+            if head.lstrip()[:1] != b'{':
+                return None
+            # Large files are memory-mapped so the parser reads the page cache in place
+            reader = pa.memory_map(source, 'r') if size >= MMAP_THRESHOLD_BYTES else source
+        
+        try:
+            table = paj.read_json(reader, read_options=paj.ReadOptions(block_size=READ_BLOCK_SIZE_BYTES))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return None
+        finally:
+            if isinstance(reader, pa.NativeFile):
+                reader.close()
+        
+        # A single record may be a dict of lists, which the Python path handles
+        if table.num_rows < 2:
+            return None
+        
+        while any(pa.types.is_struct(field.type) for field in table.schema):
+            table = table.flatten()
+        
+        return DataLoader._table_to_pandas(table, use_arrow_dtypes)
+    
+    @staticmethod
+    def _sample_items(items: List[Any], samples: int = 32) -> List[Any]:
+        """
+        Pick a strided sample of a list, always including its last element,
+        for cheap structural checks on large JSON arrays
+        
+        Args:
+            items: List to sample
+            samples: Approximate number of elements to return
+            
+        Returns:
+            Sampled elements
+        """
+        if len(items) <= samples:
+            return items
+        step = len(items) // samples
+        return items[::step] + [items[-1]]
+    
+    @staticmethod
+    def _records_to_arrow(records: List[Dict[str, Any]], use_arrow_dtypes: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Convert a list of same-keyed records to a DataFrame through Arrow's
+        columnar builder
+        
+        Nested objects are flattened into dotted column names, matching
+        pd.json_normalize.
+        
+        Args:
+            records: Parsed JSON records
+            use_arrow_dtypes: Whether to keep Arrow-backed columns
+            
+        Returns:
+            DataFrame, or None if pyarrow is unavailable, the records do not all
+            share the same keys, or a column has mixed value types or list values
+        """
+        if not HAS_PYARROW or not records:
+            return None
+        
+        # pyarrow infers the schema from the first record's keys
+        keys = records[0].keys()
+        try:
+            if any(record.keys() != keys for record in records):
+                return None
+        except AttributeError:
+            # A non-dict element slipped past the sampled type check
+            return None
+        
+        try:
+            table = pa.Table.from_pylist(records)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return None
+        
+        while any(pa.types.is_struct(field.type) for field in table.schema):
+            table = table.flatten()
+        
+        # Arrow would turn list values into NumPy arrays; keep them as Python lists
+        if any(pa.types.is_list(field.type) or pa.types.is_large_list(field.type) for field in table.schema):
+            return None
+        
+        return DataLoader._table_to_pandas(table, use_arrow_dtypes)
+    
     @staticmethod
     def load_from_api(url: str, method: str = "GET", 
                      headers: Optional[Dict[str, str]] = None,
                      params: Optional[Dict[str, Any]] = None,
                      data: Optional[Any] = None,
-                     json_path: Optional[str] = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+                     json_path: Optional[str] = None,
+                     compress: bool = False,
+                     use_arrow_dtypes: bool = True,
+                     timeout: Tuple[float, float] = DEFAULT_API_TIMEOUT) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
         Load data from a REST API
         
@@ -258,6 +669,9 @@ class DataLoader:
             params: URL parameters
             data: Request body data
             json_path: Path to extract from JSON response (e.g. "results.data")
+            compress: Whether to downcast numeric and low-cardinality string columns
+            use_arrow_dtypes: Whether to return Arrow-backed (dtype_backend="pyarrow") columns
+            timeout: (connect, read) timeouts in seconds
             
         Returns:
             Tuple of (DataFrame with loaded data, metadata)
@@ -265,44 +679,45 @@ class DataLoader:
         try:
             logger.info(f"Loading data from API: {url}")
             
-            # Make the request
-            response = requests.request(
+            # Make the request on the shared keep-alive session
+            response = _SESSION.request(
                 method=method,
                 url=url,
                 headers=headers,
                 params=params,
-                json=data if data else None
+                json=data if data else None,
+                stream=True,
+                timeout=timeout
             )
             
-            # Check for successful response
-            response.raise_for_status()
-            
-            # Parse JSON response
-            json_data = response.json()
-            
-            # Extract data from specified path if provided
-            if json_path:
-                parts = json_path.split('.')
-                for part in parts:
-                    json_data = json_data[part]
-            
-            # Convert to DataFrame using json loader
-            df, json_metadata = DataLoader.load_from_json(json_data)
-            
-            # Create API-specific metadata
-            parsed_url = urlparse(url)
-            api_metadata = {
-                "source_type": "api",
-                "url": url,
-                "method": method,
-                "domain": parsed_url.netloc,
-                "status_code": response.status_code,
-                "response_time_ms": response.elapsed.total_seconds() * 1000,
-                "json_path": json_path
-            }
+            with response:
+                # Check for successful response
+                response.raise_for_status()
+                
+                # Parse JSON response
+                content_type = response.headers.get('Content-Type', '')
+                content_length = int(response.headers.get('Content-Length') or 0)
+                path_applied = False
+                
+                if not json_path and ('ndjson' in content_type or 'jsonl' in content_type):
+                    # Newline-delimited records go to the Arrow JSON reader
+                    json_data = response.text
+                elif ijson is not None and content_length >= STREAM_THRESHOLD_BYTES and \
+                        DataLoader._is_streamable_json_path(json_path):
+                    # Large body: build only the value at json_path while reading the socket
+                    logger.info(f"Streaming {content_length} byte API response")
+                    response.raw.decode_content = True
+                    json_data = next(ijson.items(response.raw, json_path or '', use_float=True), None)
+                    if json_data is None:
+                        raise KeyError(f"JSON path '{json_path}' not found in API response")
+                    path_applied = True
+                else:
+                    json_data = _json_loads(response.content)
             
-            # Combine metadata
-            metadata = {**api_metadata, **{k:v for k,v in json_metadata.items() if k not in ["source_type"]}}
+            df, metadata = DataLoader._api_response_to_dataframe(
+                url, method, response.status_code, response.elapsed, json_data, json_path, compress,
+                path_applied=path_applied, use_arrow_dtypes=use_arrow_dtypes
+            )
             
             logger.info(f"API request returned {len(df)} rows with {len(df.columns)} columns")
             return df, metadata
@@ -312,44 +727,596 @@ class DataLoader:
             raise
     
     @staticmethod
-    def _create_db_engine(connection_params: Dict[str, Any]) -> Engine:
+    def get_api_validator(url: str, headers: Optional[Dict[str, str]] = None,
+                          timeout: Tuple[float, float] = DEFAULT_API_TIMEOUT) -> Optional[str]:
         """
-        Create a SQLAlchemy engine from connection parameters
+        Get the cache validator of an API resource with a HEAD request
+        
+        Args:
+            url: API endpoint URL
+            headers: HTTP headers
+            timeout: (connect, read) timeouts in seconds
+            
+        Returns:
+            The ETag or, failing that, Last-Modified header of the resource, or
+            None if the server sends neither or does not answer HEAD requests
+        """
+        try:
+            response = _SESSION.head(url, headers=headers, timeout=timeout, allow_redirects=True)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.debug(f"No cache validator for {url}: {str(e)}")
+            return None
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            return f"etag:{etag}"
+        last_modified = response.headers.get('Last-Modified')
+        return f"last-modified:{last_modified}" if last_modified else None
+    
+    @staticmethod
+    async def load_from_database_async(connection_params: Dict[str, Any], query: str,
+                                       **kwargs) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Run load_from_database in a worker thread so the event loop stays responsive
+        
+        Database drivers and pyarrow release the GIL while fetching and converting,
+        so concurrent loads overlap.
+        
+        Args:
+            connection_params: Database connection parameters (see load_from_database)
+            query: SQL query to execute
+            **kwargs: Additional parameters for load_from_database
+            
+        Returns:
+            Tuple of (DataFrame with query results, metadata)
+        """
+        return await asyncio.to_thread(DataLoader.load_from_database, connection_params, query, **kwargs)
+    
+    @staticmethod
+    async def load_from_csv_async(file_path: str, **kwargs) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Run load_from_csv in a worker thread so the event loop stays responsive
+        
+        Both the pandas C engine and pyarrow release the GIL while parsing, so
+        concurrent loads run in parallel.
+        
+        Args:
+            file_path: Path to CSV file
+            **kwargs: Additional parameters for load_from_csv
+            
+        Returns:
+            Tuple of (DataFrame with loaded data, metadata)
+        """
+        return await asyncio.to_thread(DataLoader.load_from_csv, file_path, **kwargs)
+    
+    @staticmethod
+    async def load_from_excel_async(file_path: str, sheet_name: Optional[str] = None,
+                                    **kwargs) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Run load_from_excel in a worker thread so the event loop stays responsive
+        
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Sheet name or index (optional)
+            **kwargs: Additional parameters for load_from_excel
+            
+        Returns:
+            Tuple of (DataFrame with loaded data, metadata)
+        """
+        return await asyncio.to_thread(DataLoader.load_from_excel, file_path, sheet_name, **kwargs)
+    
+    @staticmethod
+    async def load_from_json_async(json_data: Union[str, Dict, List],
+                                   **kwargs) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Run load_from_json in a worker thread so the event loop stays responsive
+        
+        Args:
+            json_data: JSON string, file path, or Python dict/list
+            **kwargs: Additional parameters for load_from_json
+            
+        Returns:
+            Tuple of (DataFrame with loaded data, metadata)
+        """
+        return await asyncio.to_thread(DataLoader.load_from_json, json_data, **kwargs)
+    
+    @staticmethod
+    async def load_from_api_async(url: str, **kwargs) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Run load_from_api in a worker thread so the event loop stays responsive
+        
+        Args:
+            url: API endpoint URL
+            **kwargs: Additional parameters for load_from_api
+            
+        Returns:
+            Tuple of (DataFrame with loaded data, metadata)
+        """
+        return await asyncio.to_thread(DataLoader.load_from_api, url, **kwargs)
+    
+    @staticmethod
+    def load_from_apis(specs: List[Dict[str, Any]], compress: bool = False,
+                       max_connections: int = 32, use_arrow_dtypes: bool = True) -> List[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """
+        Load data from several REST APIs concurrently
+        
+        Args:
+            specs: List of request specs, each with the keyword arguments accepted
+                by load_from_api (url, method, headers, params, data, json_path)
+            compress: Whether to downcast numeric and low-cardinality string columns
+            max_connections: Maximum number of simultaneous connections
+            use_arrow_dtypes: Whether to return Arrow-backed (dtype_backend="pyarrow") columns
+            
+        Returns:
+            List of (DataFrame, metadata) tuples in the same order as specs
+        """
+        return asyncio.run(DataLoader.load_from_apis_async(specs, compress, max_connections, use_arrow_dtypes))
+    
+    @staticmethod
+    async def load_from_apis_async(specs: List[Dict[str, Any]], compress: bool = False,
+                                   max_connections: int = 32,
+                                   use_arrow_dtypes: bool = True) -> List[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """
+        Coroutine version of load_from_apis for callers already inside an event loop
+        
+        Args:
+            specs: List of request specs (see load_from_apis)
+            compress: Whether to downcast numeric and low-cardinality string columns
+            max_connections: Maximum number of simultaneous connections
+            use_arrow_dtypes: Whether to return Arrow-backed (dtype_backend="pyarrow") columns
+            
+        Returns:
+            List of (DataFrame, metadata) tuples in the same order as specs
+        """
+        logger.info(f"Loading data from {len(specs)} APIs concurrently")
+        
+        limits = httpx.Limits(max_connections=max_connections)
+        async with httpx.AsyncClient(limits=limits) as client:
+            responses = await asyncio.gather(
+                *(DataLoader._fetch_api(client, spec) for spec in specs),
+                return_exceptions=True
+            )
+        
+        errors = [r for r in responses if isinstance(r, BaseException)]
+        if errors:
+            for error in errors:
+                logger.error(f"API loading error: {str(error)}")
+            raise errors[0]
+        
+        return [
+            DataLoader._api_response_to_dataframe(
+                spec['url'], spec.get('method', 'GET'), response.status_code, response.elapsed,
+                _json_loads(response.content), spec.get('json_path'), compress,
+                use_arrow_dtypes=use_arrow_dtypes
+            )
+            for spec, response in zip(specs, responses)
+        ]
+    
+    @staticmethod
+    async def _fetch_api(client: httpx.AsyncClient, spec: Dict[str, Any]) -> httpx.Response:
+        """
+        Issue a single API request described by spec on a shared client
+        
+        Args:
+            client: Shared async HTTP client
+            spec: Request spec (url, method, headers, params, data)
+            
+        Returns:
+            HTTP response with a successful status
+        """
+        data = spec.get('data')
+        response = await client.request(
+            method=spec.get('method', 'GET'),
+            url=spec['url'],
+            headers=spec.get('headers'),
+            params=spec.get('params'),
+            json=data if data else None
+        )
+        response.raise_for_status()
+        return response
+    
+    @staticmethod
+    def _api_response_to_dataframe(url: str, method: str, status_code: int, elapsed: Any,
+                                   json_data: Any, json_path: Optional[str],
+                                   compress: bool, path_applied: bool = False,
+                                   use_arrow_dtypes: bool = True) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Convert a parsed API response into a DataFrame with API metadata
+        
+        Args:
+            url: Requested URL
+            method: HTTP method used
+            status_code: HTTP status code of the response
+            elapsed: Response time as a timedelta
+            json_data: Parsed JSON response body
+            json_path: Path to extract from the JSON response (optional)
+            compress: Whether to downcast numeric and low-cardinality string columns
+            path_applied: Whether json_data was already extracted at json_path
+            use_arrow_dtypes: Whether to return Arrow-backed (dtype_backend="pyarrow") columns
+            
+        Returns:
+            Tuple of (DataFrame with loaded data, metadata)
+        """
+        # Extract data from specified path if provided
+        if json_path and not path_applied:
+            json_data = DataLoader._extract_json_path(json_data, DataLoader._compile_json_path(json_path))
+        
+        # Convert to DataFrame using json loader
+        df, json_metadata = DataLoader.load_from_json(json_data, compress=compress,
+                                                      use_arrow_dtypes=use_arrow_dtypes)
+        
+        # Create API-specific metadata
+        parsed_url = urlparse(url)
+        api_metadata = {
+            "source_type": "api",
+            "url": url,
+            "method": method,
+            "domain": parsed_url.netloc,
+            "status_code": status_code,
+            "response_time_ms": elapsed.total_seconds() * 1000,
+            "json_path": json_path
+        }
+        
+        # Combine metadata
+        metadata = {**api_metadata, **{k:v for k,v in json_metadata.items() if k not in ["source_type"]}}
+        return df, metadata
+    
+    @staticmethod
+    def _table_to_pandas(table: Any, use_arrow_dtypes: bool) -> pd.DataFrame:
+        """
+        Convert a pyarrow Table to a DataFrame, releasing Arrow buffers as
+        columns are converted
+        
+        Args:
+            table: pyarrow Table
+            use_arrow_dtypes: Whether to keep the columns Arrow-backed instead of
+                converting them to NumPy
+            
+        Returns:
+            DataFrame
+        """
+        types_mapper = pd.ArrowDtype if use_arrow_dtypes else None
+        return table.to_pandas(split_blocks=False, self_destruct=True, types_mapper=types_mapper)
+    
+    @staticmethod
+    def _frame_metadata(df: pd.DataFrame, compress: bool) -> Dict[str, Any]:
+        """
+        Describe the shape and schema of a loaded DataFrame
+        
+        Args:
+            df: Loaded DataFrame
+            compress: Whether the DataFrame was compressed
+            
+        Returns:
+            Metadata fields shared by all loaders
+        """
+        n_rows, n_cols = df.shape
+        return {
+            "row_count": n_rows,
+            "column_count": n_cols,
+            "columns": df.columns.tolist(),
+            "dtypes": df.dtypes.astype(str).to_dict(),
+            "compressed": compress,
+            "dtype_backend": "pyarrow" if any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes) else "numpy",
+            "memory_bytes": int(df.memory_usage(deep=True).sum())
+        }
+    
+    @staticmethod
+    def _compress(df: pd.DataFrame, category_threshold: float = 0.5) -> pd.DataFrame:
+        """
+        Shrink a DataFrame's memory footprint by downcasting its columns
+        
+        Integers are cast to the narrowest signed/unsigned width that holds their
+        range, floats to float32 when that is lossless, and object/string columns
+        with few distinct values to category. Loaders only compress when asked:
+        narrowed integers overflow in later arithmetic and categories reject
+        values they do not already hold.
+        
+        Args:
+            df: DataFrame to compress
+            category_threshold: Maximum ratio of unique values to rows for a
+                string column to be converted to category
+            
+        Returns:
+            Compressed DataFrame
+        """
+        if df.empty:
+            return df
+        
+        def downcast(cols: List[str], dtype: Any) -> None:
+            # Arrow-backed columns stay Arrow-backed at the narrower width
+            arrow_cols = [col for col in cols if isinstance(df[col].dtype, pd.ArrowDtype)]
+            numpy_cols = [col for col in cols if col not in arrow_cols]
+            if arrow_cols:
+                df[arrow_cols] = df[arrow_cols].astype(pd.ArrowDtype(pa.from_numpy_dtype(dtype)))
+            if numpy_cols:
+                df[numpy_cols] = df[numpy_cols].astype(dtype)
+        
+        # Integers: compute the column ranges once, then pick the narrowest type
+        ints = df.select_dtypes(include=['integer'])
+        if not ints.empty:
+            c_min, c_max = ints.min(), ints.max()
+            remaining = pd.Series(True, index=ints.columns)
+            for dtype in (np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32):
+                info = np.iinfo(dtype)
+                fits = remaining & ((c_min >= info.min) & (c_max <= info.max)).fillna(False).astype(bool)
+                cols = list(fits[fits].index)
+                if cols:
+                    downcast(cols, dtype)
+                    remaining &= ~fits
+        
+        # Floats: only downcast columns that round-trip through float32 exactly
+        floats = df.select_dtypes(include=['floating'])
+        floats = floats[[col for col in floats.columns if str(floats[col].dtype) in ('float64', 'double[pyarrow]')]]
+        if not floats.empty:
+            values = floats.to_numpy(dtype=np.float64, na_value=np.nan)
+            lossless = ((values.astype(np.float32).astype(np.float64) == values) | np.isnan(values)).all(axis=0)
+            cols = list(floats.columns[lossless])
+            if cols:
+                downcast(cols, np.float32)
+        
+        # Strings: low-cardinality columns become categoricals
+        row_count = len(df)
+        for col in df.select_dtypes(include=['object', 'string']).columns:
+            try:
+                if df[col].nunique() / row_count < category_threshold:
+                    df[col] = df[col].astype('category')
+            except TypeError:
+                # Unhashable values (nested lists/dicts) cannot be categorized
+                continue
+        
+        return df
+    
+    @staticmethod
+    def _read_sql_arrow(connection_params: Dict[str, Any], query: str,
+                        use_arrow_dtypes: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Run a query through connectorx, which fetches and parses rows in Rust
+        straight into Arrow buffers
         
         Args:
             connection_params: Database connection parameters
+            query: SQL query to execute
+            use_arrow_dtypes: Whether to keep Arrow-backed columns
+            
+        Returns:
+            DataFrame with query results, or None if connectorx could not run the query
+        """
+        conn_str = DataLoader._build_connection_string(connection_params)
+        # connectorx takes plain URIs without SQLAlchemy driver suffixes
+        scheme, rest = conn_str.split('://', 1)
+        cx_uri = f"{scheme.split('+', 1)[0]}://{rest}"
+        
+        partition_on = connection_params.get('partition_on')
+        cx_kwargs = {"return_type": "arrow"}
+        if partition_on:
+            cx_kwargs["partition_on"] = partition_on
+            cx_kwargs["partition_num"] = connection_params.get('partition_num', 4)
+        
+        try:
+            table = cx.read_sql(cx_uri, query, **cx_kwargs)
+        except Exception as e:
+            logger.warning(f"connectorx query failed ({e}), falling back to pd.read_sql")
+            return None
+        
+        return DataLoader._table_to_pandas(table, use_arrow_dtypes)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_json_path(json_path: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+        """
+        Split a dotted JSON path into (key, list index) steps, cached per path
+        
+        Args:
+            json_path: Dotted path such as "results.data", "items.0.rows" or
+                "pages.[*].rows" ("*" maps the rest of the path over a list)
+            
+        Returns:
+            Tuple of (key, index) pairs; index is None for non-numeric keys
+        """
+        steps = []
+        for part in json_path.split('.'):
+            if part == '[*]':
+                part = '*'
+            steps.append((part, int(part) if part.isdigit() else None))
+        return tuple(steps)
+    
+    @staticmethod
+    def _is_streamable_json_path(json_path: Optional[str]) -> bool:
+        """
+        Check whether a json_path can be expressed as an ijson prefix
+        
+        Args:
+            json_path: Dotted JSON path, or None for the whole document
+            
+        Returns:
+            True if the path only contains object keys
+        """
+        if not json_path:
+            return True
+        return all(key != '*' and index is None for key, index in DataLoader._compile_json_path(json_path))
+    
+    @staticmethod
+    def _extract_json_path(json_data: Any, steps: Tuple[Tuple[str, Optional[int]], ...]) -> Any:
+        """
+        Walk parsed JSON along compiled path steps
+        
+        Args:
+            json_data: Parsed JSON document
+            steps: Steps from _compile_json_path
+            
+        Returns:
+            The value at the path; wildcard steps yield a flattened list
+        """
+        for position, (key, index) in enumerate(steps):
+            if key == '*':
+                rest = steps[position + 1:]
+                result = []
+                for item in json_data:
+                    value = DataLoader._extract_json_path(item, rest)
+                    if isinstance(value, list):
+                        result.extend(value)
+                    else:
+                        result.append(value)
+                return result
+            if index is not None and isinstance(json_data, list):
+                json_data = json_data[index]
+            else:
+                json_data = json_data[key]
+        return json_data
+    
+    @staticmethod
+    def close() -> None:
+        """Close pooled HTTP connections held by the shared API session."""
+        _SESSION.close()
+        logger.info("Closed pooled API session")
+    
+    @staticmethod
+    def _read_sql_copy(engine: Engine, query: str, use_arrow_dtypes: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Export a PostgreSQL query with COPY ... TO STDOUT as CSV and parse it
+        directly, bypassing per-row DB-API conversion
+        
+        Args:
+            engine: SQLAlchemy engine for a PostgreSQL database
+            query: SQL query to execute
+            use_arrow_dtypes: Whether to return Arrow-backed columns
+            
+        Returns:
+            DataFrame with query results, or None if COPY failed
+        """
+        copy_sql = f"COPY ({query.strip().rstrip(';')}) TO STDOUT WITH (FORMAT CSV, HEADER)"
+        buf = io.BytesIO()
+        
+        raw_conn = engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            if hasattr(cursor, 'copy_expert'):
+                # psycopg2
+                cursor.copy_expert(copy_sql, buf)
+            else:
+                # psycopg 3
+                with cursor.copy(copy_sql) as copy:
+                    for block in copy:
+                        buf.write(block)
+            cursor.close()
+        except Exception as e:
+            logger.warning(f"COPY export failed ({e}), falling back to cursor fetch")
+            raw_conn.rollback()
+            return None
+        finally:
+            raw_conn.close()
+        
+        buf.seek(0)
+        if use_arrow_dtypes:
+            return pd.read_csv(buf, engine='pyarrow', dtype_backend='pyarrow')
+        return pd.read_csv(buf, engine='pyarrow' if HAS_PYARROW else 'c')
+    
+    @staticmethod
+    def _read_sql_streaming(engine: Engine, query: str, yield_per: int,
+                            use_arrow_dtypes: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Run a query on a server-side cursor, converting each fetched batch of
+        rows into Arrow columns so only one batch of Python row tuples is alive
+        at a time
+        
+        Args:
+            engine: SQLAlchemy engine
+            query: SQL query to execute
+            yield_per: Number of rows fetched per batch
+            use_arrow_dtypes: Whether to keep Arrow-backed columns
+            
+        Returns:
+            DataFrame with query results, or None if a batch could not be
+            converted to Arrow (e.g. mixed value types in a column)
+        """
+        with engine.connect().execution_options(stream_results=True, yield_per=yield_per) as conn:
+            result = conn.execute(db.text(query))
+            names = list(result.keys())
+            tables = []
+            try:
+                for rows in result.partitions(yield_per):
+                    columns = [pa.array(column) for column in zip(*rows)]
+                    tables.append(pa.Table.from_arrays(columns, names=names))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                logger.debug(f"Arrow conversion of query results failed ({e}), using pd.read_sql")
+                return None
+        
+        if not tables:
+            return pd.DataFrame(columns=names)
+        
+        # Batches whose columns were all NULL infer the null type; promote them
+        table = pa.concat_tables(tables, promote_options="permissive")
+        return DataLoader._table_to_pandas(table, use_arrow_dtypes)
+    
+    @staticmethod
+    def _create_db_engine(connection_params: Dict[str, Any]) -> Engine:
+        """
+        Get a SQLAlchemy engine for the connection parameters, reusing a cached
+        engine and its connection pool when one exists
+        
+        Args:
+            connection_params: Database connection parameters, optionally
+                including pool_size
             
         Returns:
             SQLAlchemy engine
         """
-        db_type = connection_params.get('type', '').lower()
+        conn_str = DataLoader._build_connection_string(connection_params)
+        pool_size = connection_params.get('pool_size')
+        key = hashlib.blake2b(f"{conn_str}|{pool_size}".encode(), digest_size=16).hexdigest()
         
-        if db_type == 'postgres' or db_type == 'postgresql':
-            conn_str = (f"postgresql://{connection_params.get('username')}:{connection_params.get('password')}"
-                     f"@{connection_params.get('host')}:{connection_params.get('port', 5432)}"
-                     f"/{connection_params.get('database')}")
-                     
-        elif db_type == 'mysql':
-            conn_str = (f"mysql+pymysql://{connection_params.get('username')}:{connection_params.get('password')}"
-                     f"@{connection_params.get('host')}:{connection_params.get('port', 3306)}"
-                     f"/{connection_params.get('database')}")
-                     
-        elif db_type == 'sqlite':
-            db_path = connection_params.get('database')
-            conn_str = f"sqlite:///{db_path}"
-            
-        elif db_type == 'mssql' or db_type == 'sqlserver':
-            conn_str = (f"mssql+pyodbc://{connection_params.get('username')}:{connection_params.get('password')}"
-                     f"@{connection_params.get('host')}:{connection_params.get('port', 1433)}"
-                     f"/{connection_params.get('database')}?driver=ODBC+Driver+17+for+SQL+Server")
-                     
-        elif db_type == 'oracle':
-            dsn = connection_params.get('dsn', 
-                f"{connection_params.get('host')}:{connection_params.get('port', 1521)}/{connection_params.get('service_name')}")
-            conn_str = (f"oracle+cx_oracle://{connection_params.get('username')}:{connection_params.get('password')}"
-                     f"@{dsn}")
+        with _ENGINE_CACHE_LOCK:
+            engine = _ENGINE_CACHE.get(key)
+            if engine is None:
+                engine_kwargs = {"pool_pre_ping": True}
+                if pool_size:
+                    engine_kwargs["pool_size"] = pool_size
+                engine = db.create_engine(conn_str, **engine_kwargs)
+                _ENGINE_CACHE[key] = engine
+            return engine
+    
+    @staticmethod
+    def dispose_engines() -> int:
+        """
+        Dispose all cached database engines and close their pooled connections
+        
+        Returns:
+            Number of engines disposed
+        """
+        with _ENGINE_CACHE_LOCK:
+            engines = list(_ENGINE_CACHE.values())
+            _ENGINE_CACHE.clear()
+        
+        for engine in engines:
+            engine.dispose()
+        
+        logger.info(f"Disposed {len(engines)} cached database engines")
+        return len(engines)
+    
+    @staticmethod
+    def _build_connection_string(connection_params: Dict[str, Any]) -> str:
+        """
+        Build a SQLAlchemy connection string from connection parameters
+        
+        Args:
+            connection_params: Database connection parameters
             
-        else:
+        Returns:
+            Connection string
+        """
+        db_type = connection_params.get('type', '').lower()
+        db_type = _DB_TYPE_ALIASES.get(db_type, db_type)
+        
+        template = _CONNECTION_TEMPLATES.get(db_type)
+        if template is None:
             raise ValueError(f"Unsupported database type: {db_type}")
-            
-        return db.create_engine(conn_str)
+        
+        params = _ConnectionParams(connection_params)
+        if db_type in _DEFAULT_PORTS:
+            params.setdefault('port', _DEFAULT_PORTS[db_type])
+        if db_type == 'oracle':
+            params.setdefault('dsn', "{host}:{port}/{service_name}".format_map(params))
+        
+        return template.format_map(params)
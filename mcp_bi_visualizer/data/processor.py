@@ -3,13 +3,430 @@ Data processor module for MCP BI Visualizer.
 Provides functions for data transformation, cleaning, and preparation
 before visualization.
 """
+import functools
+import json
+import math
+import os
+import re
+import time
 import pandas as pd
 import numpy as np
 import logging
 from typing import Dict, Any, List, Union, Optional, Callable, Tuple
 
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+try:
+    import numexpr
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 logger = logging.getLogger(__name__)
 
+# Chains of math transforms on frames at least this long run as one compiled pass
+NUMBA_MIN_ROWS = 100_000
+
+# Compiled group-by reductions keep one partial result per thread and group,
+# so they are limited to this many groups
+NUMBA_MAX_GROUPS = 65_536
+
+# Numeric filters with at least this many comparisons are evaluated by numexpr in one pass
+NUMEXPR_MIN_COMPARISONS = 2
+
+# Default engine for aggregate/join/pivot when the caller does not pick one
+USE_POLARS = os.environ.get("MCP_BI_USE_POLARS", "").lower() in ("1", "true", "yes")
+
+
+def _as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def _numeric_values(series: pd.Series) -> Optional[np.ndarray]:
+    # NumPy values of a numeric column for the compiled / vectorized paths:
+    # NumPy int and float columns as they are, Arrow-backed ones when they
+    # hold no nulls; None for everything else
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        return series.to_numpy(copy=False) if dtype.kind in 'iuf' else None
+    if isinstance(dtype, pd.ArrowDtype) and dtype.kind in 'iuf' and not series.hasnans:
+        return series.to_numpy(dtype=dtype.numpy_dtype)
+    return None
+
+
+def _numeric_result(values: np.ndarray, like: pd.Series) -> Any:
+    # Wrap computed values back into the backend of the column they came from
+    if isinstance(like.dtype, pd.ArrowDtype):
+        return pd.array(values, dtype=pd.ArrowDtype(pa.from_numpy_dtype(values.dtype)))
+    return values
+
+
+# 'in' filters with more values than this probe a cached hash index
+ISIN_INDEX_MIN_VALUES = 1000
+
+
+@functools.lru_cache(maxsize=64)
+def _membership_index(values: Tuple[Any, ...], dtype: Any) -> pd.Index:
+    # Unique index over the non-missing filter values; string values probing
+    # a string column take the column's dtype so lookups avoid object comparisons
+    index = pd.Index(values).dropna().unique()
+    if (index.dtype == object and pd.api.types.is_string_dtype(dtype)
+            and pd.api.types.infer_dtype(index, skipna=True) == 'string'):
+        index = index.astype(dtype).unique()
+    return index
+
+
+def _isin(series: pd.Series, value: Any) -> Any:
+    values = _as_list(value)
+    if len(values) > ISIN_INDEX_MIN_VALUES:
+        try:
+            mask = _membership_index(tuple(values), series.dtype).get_indexer(series) >= 0
+            # Missing values in the list match exactly as isin would match them
+            missing = [item for item in values if pd.api.types.is_scalar(item) and pd.isna(item)]
+            if missing:
+                mask |= series.isin(missing).to_numpy(dtype=bool, na_value=False)
+            return mask
+        except TypeError:
+            # Unhashable values cannot key the cache
+            pass
+    return series.isin(values)
+
+
+def _between(series: pd.Series, value: Any) -> pd.Series:
+    if not isinstance(value, list) or len(value) != 2:
+        raise ValueError("Between operator requires a list of two values [min, max]")
+    return (series >= value[0]) & (series <= value[1])
+
+
+def _arrow_strings(series: pd.Series) -> Optional[Any]:
+    # Arrow array behind a pyarrow-backed string column, None for anything else
+    if not HAS_PYARROW:
+        return None
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        if not (pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)):
+            return None
+    elif not (isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'):
+        return None
+    return pa.array(series.array)
+
+
+# Compiled regex patterns shared by the contains filter and the extract transform
+_compile_pattern = functools.lru_cache(maxsize=256)(re.compile)
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _string_match(kernel: Callable[[str], str], fallback: Callable[[Any, str], pd.Series]) -> Callable[[pd.Series, Any], Any]:
+    # Run Arrow-backed string columns through the pyarrow.compute kernel picked
+    # for the pattern; other columns, and patterns RE2 cannot compile, use the
+    # pandas string method
+    def match(series: pd.Series, value: Any) -> Any:
+        pattern = str(value)
+        arr = _arrow_strings(series)
+        if arr is not None:
+            try:
+                return getattr(pc, kernel(pattern))(arr, pattern).fill_null(False).to_numpy(zero_copy_only=False)
+            except pa.ArrowInvalid:
+                pass
+        return fallback(series.astype(str).str, pattern)
+    return match
+
+
+def _is_literal(pattern: str) -> bool:
+    return not _REGEX_METACHARACTERS.intersection(pattern)
+
+
+def _contains_fallback(strings: Any, pattern: str) -> pd.Series:
+    # Plain substrings skip the regex engine; real patterns are compiled once
+    if _is_literal(pattern):
+        return strings.contains(pattern, regex=False, na=False)
+    return strings.contains(_compile_pattern(pattern), na=False)
+
+
+_contains = _string_match(
+    lambda pattern: 'match_substring' if _is_literal(pattern) else 'match_substring_regex',
+    _contains_fallback
+)
+
+
+# Filter operators (lower-cased) mapped to functions building a boolean condition
+_FILTER_OPS: Dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+    '=': lambda s, v: s == v,
+    '==': lambda s, v: s == v,
+    '!=': lambda s, v: s != v,
+    '>': lambda s, v: s > v,
+    '<': lambda s, v: s < v,
+    '>=': lambda s, v: s >= v,
+    '<=': lambda s, v: s <= v,
+    'contains': _contains,
+    'notcontains': lambda s, v: ~_contains(s, v),
+    'startswith': _string_match(lambda pattern: 'starts_with', lambda s, v: s.startswith(v, na=False)),
+    'endswith': _string_match(lambda pattern: 'ends_with', lambda s, v: s.endswith(v, na=False)),
+    'in': _isin,
+    'notin': lambda s, v: ~_isin(s, v),
+    'between': _between,
+    'isnull': lambda s, v: s.isnull(),
+    'notnull': lambda s, v: s.notnull(),
+}
+
+
+# Formats tried, in order, when a datetime transform does not name one
+_DATETIME_FORMATS = ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%m/%d/%Y', '%d/%m/%Y']
+_DATETIME_SNIFF_ROWS = 100
+
+
+def _sniff_datetime_format(series: pd.Series) -> Optional[str]:
+    # First candidate format that parses every value of a small sample
+    sample = series.dropna().head(_DATETIME_SNIFF_ROWS)
+    if sample.empty:
+        return None
+    for candidate in _DATETIME_FORMATS:
+        try:
+            pd.to_datetime(sample, format=candidate)
+            return candidate
+        except (ValueError, TypeError):
+            continue
+    return None
+
+
+def _to_datetime(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
+    date_format = params.get("format")
+    if date_format:
+        return pd.to_datetime(series, format=date_format, cache=True)
+    if not (pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)):
+        return pd.to_datetime(series, cache=True)
+    
+    # A sniffed format parses in compiled code; values the sample did not
+    # represent fall back to per-value inference
+    date_format = _sniff_datetime_format(series)
+    if date_format:
+        try:
+            return pd.to_datetime(series, format=date_format, cache=True)
+        except (ValueError, TypeError):
+            pass
+    return pd.to_datetime(series, format='mixed', cache=True)
+
+
+def _to_categorical(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
+    categories = params.get("categories")
+    if categories:
+        return pd.Categorical(series, categories=categories)
+    return series.astype('category')
+
+
+def _uniform_edges(values: np.ndarray, bins: int) -> np.ndarray:
+    # Same equal-width edges pd.cut derives from an integer bin count
+    mn, mx = np.nanmin(values), np.nanmax(values)
+    if mn == mx:
+        mn -= 0.001 * abs(mn) if mn != 0 else 0.001
+        mx += 0.001 * abs(mx) if mx != 0 else 0.001
+        return np.linspace(mn, mx, bins + 1)
+    edges = np.linspace(mn, mx, bins + 1)
+    edges[0] -= (mx - mn) * 0.001
+    return edges
+
+
+def _bin(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
+    bins = params.get("bins")
+    if not bins:
+        return series
+    labels = params.get("labels")
+    
+    # Numeric columns without nulls are binned with a binary search over the
+    # edges; pd.cut handles everything else and reports invalid bins/labels
+    values = _numeric_values(series)
+    if values is not None:
+        values = values.astype(np.float64, copy=False)
+    if values is None or labels is False or np.isnan(values).all():
+        return pd.cut(series, bins=bins, labels=labels)
+    
+    edges = _uniform_edges(values, bins) if isinstance(bins, int) else np.asarray(bins, dtype=np.float64)
+    # Cutting an empty array yields exactly the categories pd.cut would use
+    categories = pd.cut(np.array([], dtype=np.float64), bins=edges if isinstance(bins, int) else bins, labels=labels).categories
+    
+    # (edges[i - 1], edges[i]] -> code i - 1; values outside every bin get -1
+    codes = np.digitize(values, edges, right=True) - 1
+    codes[(codes < 0) | (codes >= len(edges) - 1)] = -1
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories, ordered=True),
+        index=series.index,
+        name=series.name
+    )
+
+
+def _extract(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
+    pattern = params.get("pattern")
+    if not pattern:
+        return series
+    if isinstance(series.dtype, pd.ArrowDtype):
+        # ArrowDtype extract goes through pyarrow, which rejects compiled
+        # patterns and unnamed groups; StringDtype takes either
+        strings = series.astype(pd.StringDtype("pyarrow"))
+        return strings.str.extract(_compile_pattern(pattern), expand=False).astype(series.dtype)
+    return series.str.extract(_compile_pattern(pattern), expand=False)
+
+
+# Integer columns are widened before these ufuncs, so results neither wrap
+# around in narrow integer widths nor come back as float16
+_UFUNC_WIDENING = {
+    np.add: np.int64, np.subtract: np.int64, np.multiply: np.int64,
+    np.true_divide: np.float64, np.log: np.float64, np.exp: np.float64,
+}
+
+
+def _apply_ufunc(series: pd.Series, ufunc: Callable, *args: Any) -> pd.Series:
+    # Numeric columns without missing values run the ufunc on their NumPy
+    # values; anything else goes through the pandas ufunc
+    widened = _UFUNC_WIDENING.get(ufunc) if pd.api.types.is_integer_dtype(series.dtype) else None
+    arr = _numeric_values(series)
+    if arr is None:
+        if widened is not None and isinstance(series.dtype, pd.ArrowDtype):
+            series = series.astype(pd.ArrowDtype(pa.from_numpy_dtype(widened)))
+        elif widened is not None and isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            series = series.astype(pd.Int64Dtype() if widened is np.int64 else pd.Float64Dtype())
+        return ufunc(series, *args)
+    if widened is not None:
+        arr = arr.astype(widened, copy=False)
+    return pd.Series(_numeric_result(ufunc(arr, *args), series), index=series.index, name=series.name)
+
+
+# Filter operators numexpr can evaluate, mapped to its comparison syntax
+_NUMEXPR_OPS = {'=': '==', '==': '==', '!=': '!=', '>': '>', '<': '<', '>=': '>=', '<=': '<='}
+# Column dtypes numexpr works on natively
+_NUMEXPR_DTYPES = {np.dtype(np.int32), np.dtype(np.int64), np.dtype(np.float32), np.dtype(np.float64)}
+
+# Op codes understood by the fused math kernel
+_FUSED_MATH_OPS = {"add": 0, "subtract": 1, "multiply": 2, "divide": 3, "log": 4, "exp": 5, "round": 6}
+
+if HAS_NUMBA:
+    @numba.njit(cache=True, parallel=True, error_model='numpy')
+    def _fused_math_kernel(values: np.ndarray, codes: np.ndarray, operands: np.ndarray) -> np.ndarray:
+        # Apply every op to an element before moving on, so the column is
+        # read and written once however long the chain is
+        out = np.empty(values.shape[0], dtype=np.float64)
+        for i in numba.prange(values.shape[0]):
+            x = values[i]
+            for j in range(codes.shape[0]):
+                code = codes[j]
+                if code == 0:
+                    x = x + operands[j]
+                elif code == 1:
+                    x = x - operands[j]
+                elif code == 2:
+                    x = x * operands[j]
+                elif code == 3:
+                    x = x / operands[j]
+                elif code == 4:
+                    x = math.log(x)
+                elif code == 5:
+                    x = math.exp(x)
+                elif operands[j] >= 0:
+                    scale = 10.0 ** operands[j]
+                    x = np.rint(x * scale) / scale
+                else:
+                    scale = 10.0 ** -operands[j]
+                    x = np.rint(x / scale) * scale
+            out[i] = x
+        return out
+    
+    @numba.njit(cache=True, parallel=True)
+    def _grouped_reduce_kernel(codes: np.ndarray, values: np.ndarray, sums: np.ndarray,
+                               counts: np.ndarray, mins: np.ndarray, maxs: np.ndarray) -> None:
+        # Each block of rows accumulates into its own row of the partial
+        # arrays, so threads never write to the same group; codes < 0 are
+        # missing keys and NaN values are skipped like pandas does
+        nblocks = sums.shape[0]
+        n = codes.shape[0]
+        step = (n + nblocks - 1) // nblocks
+        for b in numba.prange(nblocks):
+            for i in range(b * step, min(n, (b + 1) * step)):
+                g = codes[i]
+                x = values[i]
+                if g < 0 or x != x:
+                    continue
+                sums[b, g] += x
+                if counts[b, g] == 0 or x < mins[b, g]:
+                    mins[b, g] = x
+                if counts[b, g] == 0 or x > maxs[b, g]:
+                    maxs[b, g] = x
+                counts[b, g] += 1
+
+
+# Transformations keyed by (type, operation); operation is None for types
+# without sub-operations
+_TRANSFORMS: Dict[Tuple[str, Optional[str]], Callable[[pd.Series, Dict[str, Any]], Any]] = {
+    ("datetime_format", None): _to_datetime,
+    ("numeric", None): lambda s, p: pd.to_numeric(s, errors=p.get("errors", "coerce")),
+    ("replace", None): lambda s, p: s.replace(p.get("to_replace"), p.get("value")),
+    ("categorical", None): _to_categorical,
+    ("bin", None): _bin,
+    ("string", "lower"): lambda s, p: s.str.lower(),
+    ("string", "upper"): lambda s, p: s.str.upper(),
+    ("string", "strip"): lambda s, p: s.str.strip(),
+    ("string", "extract"): _extract,
+    ("math", "add"): lambda s, p: _apply_ufunc(s, np.add, p.get("value")),
+    ("math", "subtract"): lambda s, p: _apply_ufunc(s, np.subtract, p.get("value")),
+    ("math", "multiply"): lambda s, p: _apply_ufunc(s, np.multiply, p.get("value")),
+    ("math", "divide"): lambda s, p: _apply_ufunc(s, np.true_divide, p.get("value")),
+    ("math", "log"): lambda s, p: _apply_ufunc(s, np.log),
+    ("math", "exp"): lambda s, p: _apply_ufunc(s, np.exp),
+    ("math", "round"): lambda s, p: _apply_ufunc(s, np.round, p.get("decimals", 0)),
+}
+_OPERATION_TRANSFORM_TYPES = {"string", "math"}
+
+# Transformations that can run over several columns in one DataFrame-level call
+_BATCHED_TRANSFORMS: Dict[Tuple[str, Optional[str]], Callable[[pd.DataFrame, Dict[str, Any]], pd.DataFrame]] = {
+    ("numeric", None): lambda f, p: f.apply(pd.to_numeric, errors=p.get("errors", "coerce")),
+    ("categorical", None): lambda f, p: f.astype(
+        pd.CategoricalDtype(categories=p["categories"]) if p.get("categories") else 'category'
+    ),
+    ("math", "add"): lambda f, p: f + p.get("value"),
+    ("math", "subtract"): lambda f, p: f - p.get("value"),
+    ("math", "multiply"): lambda f, p: f * p.get("value"),
+    ("math", "divide"): lambda f, p: f / p.get("value"),
+}
+
+# Aggregation names accepted on top of the pandas ones
+_AGG_ALIASES = {'avg': 'mean'}
+
+# Pivot aggregations are passed to pandas by name; "count" keeps counting
+# missing values like len() did, which is what "size" does
+_PIVOT_AGG_ALIASES = {**_AGG_ALIASES, 'count': 'size'}
+_PIVOT_AGGFUNCS = {'sum', 'mean', 'size', 'min', 'max', 'median', 'first', 'last'}
+
+# pandas aggregation names mapped to Polars expression methods
+_POLARS_AGGS = {
+    'sum': 'sum', 'mean': 'mean', 'median': 'median',
+    'min': 'min', 'max': 'max', 'count': 'count', 'nunique': 'n_unique',
+    'std': 'std', 'var': 'var', 'first': 'first', 'last': 'last',
+}
+_POLARS_JOIN_TYPES = {'inner': 'inner', 'left': 'left', 'right': 'right', 'outer': 'full'}
+
+# Aggregations that can be computed per chunk and combined: the partial
+# aggregations each needs, and how partials are reduced across chunks
+_CHUNKED_AGG_PARTS = {
+    'sum': ('sum',), 'count': ('count',), 'min': ('min',), 'max': ('max',),
+    'mean': ('sum', 'count'),
+}
+_CHUNKED_AGG_REDUCERS = {'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max'}
+
 class DataProcessor:
     """
     Processes DataFrames to prepare data for visualization.
@@ -34,10 +451,19 @@ class DataProcessor:
         if not filters:
             return df
             
-        filtered_df = df.copy()
-        original_row_count = len(filtered_df)
+        # Combine every condition into one row mask and slice the frame once
+        original_row_count = len(df)
+        mask = np.ones(original_row_count, dtype=bool)
+        
+        if HAS_NUMEXPR:
+            numeric_mask, filters = DataProcessor._numexpr_mask(df, filters)
+            if numeric_mask is not None:
+                np.logical_and(mask, numeric_mask, out=mask)
         
         for filter_condition in filters:
+            if not mask.any():
+                break
+            
             column = filter_condition.get('column')
             operator = filter_condition.get('operator')
             value = filter_condition.get('value')
@@ -47,56 +473,95 @@ class DataProcessor:
                 continue
                 
             try:
-                if operator == '=' or operator == '==':
-                    filtered_df = filtered_df[filtered_df[column] == value]
-                elif operator == '!=':
-                    filtered_df = filtered_df[filtered_df[column] != value]
-                elif operator == '>':
-                    filtered_df = filtered_df[filtered_df[column] > value]
-                elif operator == '<':
-                    filtered_df = filtered_df[filtered_df[column] < value]
-                elif operator == '>=':
-                    filtered_df = filtered_df[filtered_df[column] >= value]
-                elif operator == '<=':
-                    filtered_df = filtered_df[filtered_df[column] <= value]
-                elif operator.lower() == 'contains':
-                    filtered_df = filtered_df[filtered_df[column].astype(str).str.contains(str(value), na=False)]
-                elif operator.lower() == 'notcontains':
-                    filtered_df = filtered_df[~filtered_df[column].astype(str).str.contains(str(value), na=False)]
-                elif operator.lower() == 'startswith':
-                    filtered_df = filtered_df[filtered_df[column].astype(str).str.startswith(str(value), na=False)]
-                elif operator.lower() == 'endswith':
-                    filtered_df = filtered_df[filtered_df[column].astype(str).str.endswith(str(value), na=False)]
-                elif operator.lower() == 'in':
-                    if not isinstance(value, list):
-                        value = [value]
-                    filtered_df = filtered_df[filtered_df[column].isin(value)]
-                elif operator.lower() == 'notin':
-                    if not isinstance(value, list):
-                        value = [value]
-                    filtered_df = filtered_df[~filtered_df[column].isin(value)]
-                elif operator.lower() == 'between':
-                    if not isinstance(value, list) or len(value) != 2:
-                        raise ValueError("Between operator requires a list of two values [min, max]")
-                    filtered_df = filtered_df[(filtered_df[column] >= value[0]) & (filtered_df[column] <= value[1])]
-                elif operator.lower() == 'isnull':
-                    filtered_df = filtered_df[filtered_df[column].isnull()]
-                elif operator.lower() == 'notnull':
-                    filtered_df = filtered_df[filtered_df[column].notnull()]
-                else:
+                op = _FILTER_OPS.get(str(operator).lower())
+                if op is None:
                     logger.warning(f"Unsupported operator '{operator}', skipping filter")
+                    continue
+                condition = op(df[column], value)
+                np.logical_and(mask, DataProcessor._to_mask(condition), out=mask)
                     
             except Exception as e:
                 logger.error(f"Error applying filter on column '{column}': {str(e)}")
-                
+        
+        filtered_df = df[mask]
         new_row_count = len(filtered_df)
-        logger.info(f"Filtered data from {original_row_count} to {new_row_count} rows ({original_row_count - new_row_count} rows removed)")
+        logger.info("Filtered data from %d to %d rows (%d rows removed)", original_row_count, new_row_count, original_row_count - new_row_count)
         return filtered_df
     
+    @staticmethod
+    def _numexpr_mask(df: pd.DataFrame,
+                      filters: List[Dict[str, Any]]) -> Tuple[Optional[np.ndarray], List[Dict[str, Any]]]:
+        """
+        Evaluate the numeric comparison filters as one numexpr expression
+        
+        Args:
+            df: Input DataFrame
+            filters: Filter conditions as passed to filter_data
+            
+        Returns:
+            Tuple of (mask for the numeric conditions or None, conditions still
+            to be applied one by one)
+        """
+        terms, arrays, remaining = [], {}, []
+        for i, filter_condition in enumerate(filters):
+            column = filter_condition.get('column')
+            operator = str(filter_condition.get('operator')).lower()
+            value = filter_condition.get('value')
+            
+            bounds = value if operator == 'between' and isinstance(value, list) and len(value) == 2 else [value]
+            values = _numeric_values(df[column]) if column in df.columns else None
+            eligible = (
+                (operator in _NUMEXPR_OPS or (operator == 'between' and len(bounds) == 2))
+                and values is not None
+                and values.dtype in _NUMEXPR_DTYPES
+                and all(isinstance(bound, (int, float, np.number)) and not isinstance(bound, (bool, np.bool_))
+                        for bound in bounds)
+            )
+            if not eligible:
+                remaining.append(filter_condition)
+                continue
+            
+            name = f"c{i}"
+            arrays[name] = values
+            if operator == 'between':
+                arrays[f"{name}_lo"], arrays[f"{name}_hi"] = bounds
+                terms += [f"({name} >= {name}_lo)", f"({name} <= {name}_hi)"]
+            else:
+                arrays[f"{name}_v"] = value
+                terms.append(f"({name} {_NUMEXPR_OPS[operator]} {name}_v)")
+        
+        if len(terms) < NUMEXPR_MIN_COMPARISONS:
+            return None, filters
+        
+        try:
+            return numexpr.evaluate(" & ".join(terms), local_dict=arrays), remaining
+        except Exception as e:
+            logger.warning(f"numexpr evaluation failed, applying filters individually: {str(e)}")
+            return None, filters
+    
+    @staticmethod
+    def _to_mask(condition: Union[pd.Series, np.ndarray]) -> np.ndarray:
+        """
+        Convert a boolean condition to a NumPy mask, treating missing values
+        as False
+        
+        Args:
+            condition: Boolean Series (NumPy, nullable or Arrow-backed) or ndarray
+            
+        Returns:
+            Boolean ndarray
+        """
+        if isinstance(condition, np.ndarray):
+            return condition.astype(bool, copy=False)
+        return condition.to_numpy(dtype=bool, na_value=False)
+    
     @staticmethod
     def aggregate_data(df: pd.DataFrame, 
                        group_by: Union[str, List[str]], 
-                       aggregations: Dict[str, str]) -> pd.DataFrame:
+                       aggregations: Dict[str, str],
+                       engine: Optional[str] = None,
+                       chunksize: Optional[int] = None,
+                       sort: bool = False) -> pd.DataFrame:
         """
         Aggregate data by grouping and applying aggregation functions
         
@@ -105,6 +570,12 @@ class DataProcessor:
             group_by: Column(s) to group by
             aggregations: Dictionary mapping columns to aggregation functions
                 Example: {'sales': 'sum', 'price': 'mean'}
+            engine: 'pandas' or 'polars'; defaults to the MCP_BI_USE_POLARS setting
+            chunksize: Aggregate this many rows at a time and combine the
+                partial results, bounding peak memory (sum, count, min, max
+                and mean only)
+            sort: Whether to sort the result by the group keys; groups
+                otherwise appear in order of first occurrence
                 
         Returns:
             Aggregated DataFrame
@@ -126,30 +597,210 @@ class DataProcessor:
                 if col not in df.columns:
                     raise ValueError(f"Aggregation column '{col}' not found in DataFrame")
             
-            logger.info(f"Aggregating data by {group_by} with aggregations: {aggregations}")
-            original_row_count = len(df)
+            # Resolve aliases once, so every engine and path sees the same functions
+            aggregations = {
+                col: [DataProcessor._resolve_agg(func) for func in funcs] if isinstance(funcs, list)
+                else DataProcessor._resolve_agg(funcs)
+                for col, funcs in aggregations.items()
+            }
             
-            result = df.groupby(group_by).agg(aggregations).reset_index()
+            logger.info("Aggregating data by %s with aggregations: %s", group_by, aggregations)
+            original_row_count = len(df)
             
-            # Flatten multi-index columns if created by aggregation
-            if isinstance(result.columns, pd.MultiIndex):
-                result.columns = ['_'.join(col).strip('_') for col in result.columns.values]
+            result = None
+            if DataProcessor._resolve_engine(engine) == 'polars':
+                result = DataProcessor._aggregate_polars(df, group_by, aggregations, sort)
+            elif chunksize and len(df) > chunksize:
+                result = DataProcessor._aggregate_chunked(df, group_by, aggregations, chunksize, sort)
+            elif HAS_NUMBA and len(df) >= NUMBA_MIN_ROWS:
+                result = DataProcessor._aggregate_numba(df, group_by, aggregations, sort)
+            if result is None:
+                # Named aggregation yields flat columns: "<column>" for a single
+                # function, "<column>_<func>" for each function in a list
+                named = {}
+                for col, funcs in aggregations.items():
+                    if isinstance(funcs, list):
+                        named.update({f"{col}_{func}": pd.NamedAgg(column=col, aggfunc=func) for func in funcs})
+                    else:
+                        named[col] = pd.NamedAgg(column=col, aggfunc=funcs)
+                result = df.groupby(group_by, sort=sort, observed=True).agg(**named).reset_index()
                 
             new_row_count = len(result)
-            logger.info(f"Aggregated from {original_row_count} to {new_row_count} rows")
+            logger.info("Aggregated from %d to %d rows", original_row_count, new_row_count)
             return result
             
         except Exception as e:
             logger.error(f"Aggregation error: {str(e)}")
             raise
     
+    @staticmethod
+    def _resolve_agg(func: Any) -> Any:
+        """
+        Map an aggregation alias such as 'avg' to its pandas name
+        
+        Args:
+            func: Aggregation function or its name
+            
+        Returns:
+            The pandas aggregation name, or func unchanged
+        """
+        return _AGG_ALIASES.get(func.lower(), func) if isinstance(func, str) else func
+    
+    @staticmethod
+    def _aggregate_chunked(df: pd.DataFrame,
+                           group_by: List[str],
+                           aggregations: Dict[str, Any],
+                           chunksize: int,
+                           sort: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Aggregate chunk by chunk and reduce the partial results
+        
+        Args:
+            df: Input DataFrame
+            group_by: Columns to group by
+            aggregations: Dictionary mapping columns to aggregation functions
+            chunksize: Number of rows per chunk
+            sort: Whether to sort the result by the group keys
+            
+        Returns:
+            Aggregated DataFrame, or None when an aggregation cannot be
+            combined across chunks
+        """
+        unsupported = {col: func for col, func in aggregations.items()
+                       if not isinstance(func, str) or func.lower() not in _CHUNKED_AGG_PARTS}
+        if unsupported:
+            logger.warning(f"Aggregations {unsupported} cannot be chunked, aggregating in a single pass")
+            return None
+        
+        # Every partial result is named "<column>__<part>"
+        parts = {
+            f"{col}__{part}": (col, part)
+            for col, func in aggregations.items()
+            for part in _CHUNKED_AGG_PARTS[func.lower()]
+        }
+        
+        # Unsorted partials reduce to groups in order of first occurrence overall
+        partials = [
+            df.iloc[start:start + chunksize].groupby(group_by, sort=sort, observed=True).agg(**parts)
+            for start in range(0, len(df), chunksize)
+        ]
+        combined = pd.concat(partials).groupby(level=group_by, sort=sort, observed=True).agg(
+            {name: _CHUNKED_AGG_REDUCERS[part] for name, (_, part) in parts.items()}
+        )
+        
+        result = pd.DataFrame(index=combined.index)
+        for col, func in aggregations.items():
+            func = func.lower()
+            if func == 'mean':
+                result[col] = combined[f"{col}__sum"] / combined[f"{col}__count"]
+            else:
+                result[col] = combined[f"{col}__{func}"]
+        
+        logger.info("Aggregated %d chunks of up to %d rows", len(partials), chunksize)
+        return result.reset_index()
+    
+    @staticmethod
+    def _aggregate_numba(df: pd.DataFrame,
+                         group_by: List[str],
+                         aggregations: Dict[str, Any],
+                         sort: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Aggregate numeric columns by one key in a compiled parallel pass
+        
+        Args:
+            df: Input DataFrame
+            group_by: Columns to group by
+            aggregations: Dictionary mapping columns to aggregation functions
+            sort: Whether to sort the result by the group key
+            
+        Returns:
+            Aggregated DataFrame with the dtypes pandas would produce, or None
+            when the grouping or an aggregation is not supported (several or
+            categorical keys, too many groups, other functions or dtypes,
+            columns with missing values)
+        """
+        if len(group_by) != 1 or isinstance(df[group_by[0]].dtype, pd.CategoricalDtype):
+            return None
+        columns = {}
+        for col, func in aggregations.items():
+            columns[col] = _numeric_values(df[col])
+            if not isinstance(func, str) or func.lower() not in _CHUNKED_AGG_PARTS or columns[col] is None:
+                return None
+        
+        codes, uniques = pd.factorize(df[group_by[0]], sort=sort)
+        ngroups = len(uniques)
+        if ngroups > NUMBA_MAX_GROUPS:
+            return None
+        nblocks = min(numba.get_num_threads(), max(1, len(df) // 10_000))
+        
+        result = pd.DataFrame({group_by[0]: uniques})
+        for col, func in aggregations.items():
+            values = columns[col]
+            acc_dtype = np.float64 if values.dtype.kind == 'f' else np.int64
+            sums = np.zeros((nblocks, ngroups), dtype=acc_dtype)
+            counts = np.zeros((nblocks, ngroups), dtype=np.int64)
+            mins = np.zeros((nblocks, ngroups), dtype=values.dtype)
+            maxs = np.zeros((nblocks, ngroups), dtype=values.dtype)
+            _grouped_reduce_kernel(codes, values, sums, counts, mins, maxs)
+            
+            total = counts.sum(axis=0)
+            func = func.lower()
+            if func == 'count':
+                column = total
+            elif func == 'sum':
+                # Integer sums stay int64 as in pandas; narrow widths would wrap
+                column = sums.sum(axis=0)
+                if values.dtype.kind == 'f':
+                    column = column.astype(values.dtype)
+            elif func == 'mean':
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    column = sums.sum(axis=0) / total
+                if values.dtype == np.float32:
+                    column = column.astype(np.float32)
+            else:
+                # Blocks that saw no value of a group must not win the reduction
+                partials = mins if func == 'min' else maxs
+                if values.dtype.kind == 'f':
+                    fill = np.inf if func == 'min' else -np.inf
+                else:
+                    info = np.iinfo(values.dtype)
+                    fill = info.max if func == 'min' else info.min
+                reduce = np.min if func == 'min' else np.max
+                column = reduce(np.where(counts > 0, partials, fill), axis=0).astype(values.dtype)
+                if values.dtype.kind == 'f':
+                    column[total == 0] = np.nan
+            result[col] = _numeric_result(column, df[col])
+        
+        logger.info("Aggregated %d rows into %d groups in %d compiled blocks", len(df), ngroups, nblocks)
+        return result
+    
+    @staticmethod
+    def warm_up_kernels() -> None:
+        """
+        Compile the numba kernels for the common dtypes ahead of the first request
+        
+        Does nothing when numba is not installed.
+        """
+        if not HAS_NUMBA:
+            return
+        codes = np.zeros(1, dtype=np.int64)
+        for dtype in (np.float64, np.int64):
+            values = np.zeros(1, dtype=dtype)
+            acc_dtype = np.float64 if dtype is np.float64 else np.int64
+            _grouped_reduce_kernel(
+                codes, values, np.zeros((1, 1), dtype=acc_dtype), np.zeros((1, 1), dtype=np.int64),
+                np.zeros((1, 1), dtype=dtype), np.zeros((1, 1), dtype=dtype)
+            )
+        _fused_math_kernel(np.zeros(1), np.zeros(1, dtype=np.int64), np.zeros(1))
+    
     @staticmethod
     def join_data(left_df: pd.DataFrame, 
                  right_df: pd.DataFrame, 
                  left_on: Union[str, List[str]], 
                  right_on: Union[str, List[str]], 
                  join_type: str = 'inner',
-                 suffix: Tuple[str, str] = ('_x', '_y')) -> pd.DataFrame:
+                 suffix: Tuple[str, str] = ('_x', '_y'),
+                 engine: Optional[str] = None) -> pd.DataFrame:
         """
         Join two DataFrames
         
@@ -160,6 +811,7 @@ class DataProcessor:
             right_on: Column(s) from right DataFrame to join on
             join_type: Type of join ('inner', 'left', 'right', 'outer')
             suffix: Suffixes to apply to overlapping column names
+            engine: 'pandas' or 'polars'; defaults to the MCP_BI_USE_POLARS setting
             
         Returns:
             Joined DataFrame
@@ -173,8 +825,30 @@ class DataProcessor:
             left_rows = len(left_df)
             right_rows = len(right_df)
             
-            logger.info(f"Performing {join_type} join on {left_on} and {right_on}")
-            logger.info(f"Left table: {left_rows} rows, Right table: {right_rows} rows")
+            logger.info("Performing %s join on %s and %s", join_type, left_on, right_on)
+            logger.info("Left table: %d rows, Right table: %d rows", left_rows, right_rows)
+            
+            left_keys = [left_on] if isinstance(left_on, str) else list(left_on)
+            right_keys = [right_on] if isinstance(right_on, str) else list(right_on)
+            
+            if DataProcessor._resolve_engine(engine) == 'polars':
+                result = DataProcessor._join_polars(left_df, right_df, left_keys, right_keys, join_type, suffix)
+                if result is not None:
+                    logger.info("Join resulted in %d rows and %d columns", len(result), len(result.columns))
+                    return result
+            
+            if join_type in ('inner', 'left') and len(left_keys) == 1 and len(right_keys) == 1:
+                result = DataProcessor._join_sorted(left_df, right_df, left_keys[0], right_keys[0], join_type, suffix)
+                if result is not None:
+                    logger.info("Join resulted in %d rows and %d columns", len(result), len(result.columns))
+                    return result
+            
+            # Outer joins sort by key, and category codes would not sort like the strings
+            restore_dtypes: Dict[str, Any] = {}
+            if join_type != 'outer':
+                left_df, right_df, restore_dtypes = DataProcessor._factorize_join_keys(
+                    left_df, right_df, left_keys, right_keys
+                )
             
             result = pd.merge(
                 left_df, 
@@ -185,20 +859,133 @@ class DataProcessor:
                 suffixes=suffix
             )
             
-            logger.info(f"Join resulted in {len(result)} rows and {len(result.columns)} columns")
+            # Give the key columns back their original dtypes
+            restore_dtypes = {col: dtype for col, dtype in restore_dtypes.items() if col in result.columns}
+            if restore_dtypes:
+                result = result.astype(restore_dtypes)
+            
+            logger.info("Join resulted in %d rows and %d columns", len(result), len(result.columns))
             return result
             
         except Exception as e:
             logger.error(f"Join error: {str(e)}")
             raise
     
+    @staticmethod
+    def _join_sorted(left_df: pd.DataFrame,
+                     right_df: pd.DataFrame,
+                     left_key: str,
+                     right_key: str,
+                     join_type: str,
+                     suffix: Tuple[str, str]) -> Optional[pd.DataFrame]:
+        """
+        Merge-join two DataFrames whose single join keys are already sorted
+        
+        Joining two monotonic indexes runs pandas' linear merge join instead
+        of building a hash table. The output matches pd.merge, except that
+        several right rows matching one key keep their original order.
+        
+        Args:
+            left_df: Left DataFrame
+            right_df: Right DataFrame
+            left_key: Join column from the left DataFrame
+            right_key: Join column from the right DataFrame
+            join_type: 'inner' or 'left'
+            suffix: Suffixes to apply to overlapping column names
+            
+        Returns:
+            Joined DataFrame, or None when the keys are not both sorted
+        """
+        if left_key not in left_df.columns or right_key not in right_df.columns:
+            return None
+        left_keys, right_keys = left_df[left_key], right_df[right_key]
+        if left_keys.dtype != right_keys.dtype:
+            return None
+        if not (left_keys.is_monotonic_increasing and right_keys.is_monotonic_increasing):
+            return None
+        
+        left_df, right_df = left_df.reset_index(drop=True), right_df.reset_index(drop=True)
+        if len(right_df) and len(left_df):
+            # Trim both sides to the overlapping key range (only the right side for left joins)
+            lo = left_keys.searchsorted(right_keys.iloc[0], side='left')
+            hi = left_keys.searchsorted(right_keys.iloc[-1], side='right')
+            if join_type == 'inner':
+                left_df = left_df.iloc[lo:hi]
+            right_lo = right_keys.searchsorted(left_keys.iloc[0], side='left')
+            right_hi = right_keys.searchsorted(left_keys.iloc[-1], side='right')
+            right_df = right_df.iloc[right_lo:right_hi].reset_index(drop=True)
+        
+        _, left_indexer, right_indexer = pd.Index(left_df[left_key]).join(
+            pd.Index(right_df[right_key]), how=join_type, return_indexers=True
+        )
+        left_part = left_df if left_indexer is None else left_df.iloc[left_indexer]
+        # Reindexing by position turns -1 (no match) into an all-missing row
+        right_part = right_df if right_indexer is None else right_df.reindex(right_indexer)
+        
+        shared_key = left_key == right_key
+        if shared_key:
+            right_part = right_part.drop(columns=[right_key])
+        overlap = set(left_part.columns) & set(right_part.columns)
+        left_part = left_part.rename(columns={col: f"{col}{suffix[0]}" for col in overlap})
+        right_part = right_part.rename(columns={col: f"{col}{suffix[1]}" for col in overlap})
+        
+        logger.info("Keys are sorted, using merge join")
+        return pd.concat(
+            [left_part.reset_index(drop=True), right_part.reset_index(drop=True)], axis=1
+        )
+    
+    @staticmethod
+    def _factorize_join_keys(left_df: pd.DataFrame,
+                             right_df: pd.DataFrame,
+                             left_keys: List[str],
+                             right_keys: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, Any]]:
+        """
+        Encode string join keys as categoricals sharing one vocabulary, so
+        pd.merge joins on the integer codes instead of hashing strings
+        
+        Args:
+            left_df: Left DataFrame
+            right_df: Right DataFrame
+            left_keys: Join columns from the left DataFrame
+            right_keys: Join columns from the right DataFrame
+            
+        Returns:
+            Tuple of (left DataFrame, right DataFrame, original dtypes of the
+            encoded key columns)
+        """
+        original_dtypes: Dict[str, Any] = {}
+        encoded_left: Dict[str, pd.Categorical] = {}
+        encoded_right: Dict[str, pd.Categorical] = {}
+        
+        for left_key, right_key in zip(left_keys, right_keys):
+            if left_key not in left_df.columns or right_key not in right_df.columns:
+                continue
+            left_col, right_col = left_df[left_key], right_df[right_key]
+            if not (pd.api.types.is_object_dtype(left_col.dtype) or pd.api.types.is_string_dtype(left_col.dtype)):
+                continue
+            if left_col.dtype != right_col.dtype:
+                continue
+            
+            categories = pd.Index(pd.concat([left_col, right_col], ignore_index=True).dropna().unique())
+            key_dtype = pd.CategoricalDtype(categories=categories)
+            encoded_left[left_key] = left_col.astype(key_dtype)
+            encoded_right[right_key] = right_col.astype(key_dtype)
+            original_dtypes.setdefault(left_key, left_col.dtype)
+            original_dtypes.setdefault(right_key, right_col.dtype)
+        
+        if encoded_left:
+            left_df = left_df.assign(**encoded_left)
+            right_df = right_df.assign(**encoded_right)
+        return left_df, right_df, original_dtypes
+    
     @staticmethod
     def pivot_data(df: pd.DataFrame, 
                   index: Union[str, List[str]], 
                   columns: str, 
                   values: str,
                   aggfunc: Union[str, Callable] = 'mean',
-                  fill_value: Optional[Any] = None) -> pd.DataFrame:
+                  fill_value: Optional[Any] = None,
+                  engine: Optional[str] = None) -> pd.DataFrame:
         """
         Create a pivot table from DataFrame
         
@@ -209,52 +996,189 @@ class DataProcessor:
             values: Column containing values
             aggfunc: Aggregation function to apply
             fill_value: Value to use for missing values
+            engine: 'pandas' or 'polars'; defaults to the MCP_BI_USE_POLARS setting
             
         Returns:
             Pivot table as DataFrame
         """
         try:
-            # Convert string aggfunc to actual function
+            # Pass string aggfuncs through by name so pandas uses its compiled groupby reductions
             if isinstance(aggfunc, str):
-                if aggfunc.lower() == 'sum':
-                    agg_function = np.sum
-                elif aggfunc.lower() == 'mean' or aggfunc.lower() == 'avg':
-                    agg_function = np.mean
-                elif aggfunc.lower() == 'count':
-                    agg_function = len
-                elif aggfunc.lower() == 'min':
-                    agg_function = np.min
-                elif aggfunc.lower() == 'max':
-                    agg_function = np.max
-                elif aggfunc.lower() == 'median':
-                    agg_function = np.median
-                elif aggfunc.lower() == 'first':
-                    agg_function = lambda x: x.iloc[0]
-                elif aggfunc.lower() == 'last':
-                    agg_function = lambda x: x.iloc[-1]
-                else:
+                agg_function = _PIVOT_AGG_ALIASES.get(aggfunc.lower(), aggfunc.lower())
+                if agg_function not in _PIVOT_AGGFUNCS:
                     raise ValueError(f"Unsupported aggregation function: {aggfunc}")
             else:
                 agg_function = aggfunc
             
-            logger.info(f"Creating pivot table with index={index}, columns={columns}, values={values}")
+            logger.info("Creating pivot table with index=%s, columns=%s, values=%s", index, columns, values)
             
-            pivot_table = pd.pivot_table(
-                df, 
-                index=index, 
-                columns=columns, 
-                values=values, 
-                aggfunc=agg_function,
-                fill_value=fill_value
-            ).reset_index()
+            pivot_table = None
+            if DataProcessor._resolve_engine(engine) == 'polars':
+                pivot_table = DataProcessor._pivot_polars(df, index, columns, values, agg_function, fill_value)
+            if pivot_table is None:
+                pivot_table = pd.pivot_table(
+                    df, 
+                    index=index, 
+                    columns=columns, 
+                    values=values, 
+                    aggfunc=agg_function,
+                    fill_value=fill_value
+                ).reset_index()
             
-            logger.info(f"Pivot table created with shape {pivot_table.shape}")
+            logger.info("Pivot table created with shape %s", pivot_table.shape)
             return pivot_table
             
         except Exception as e:
             logger.error(f"Pivot error: {str(e)}")
             raise
     
+    @staticmethod
+    def _resolve_engine(engine: Optional[str]) -> str:
+        """
+        Pick the engine for aggregate/join/pivot operations
+        
+        Args:
+            engine: Requested engine, or None for the MCP_BI_USE_POLARS default
+            
+        Returns:
+            'pandas' or 'polars'
+        """
+        engine = (engine or ('polars' if USE_POLARS else 'pandas')).lower()
+        if engine not in ('pandas', 'polars'):
+            raise ValueError(f"Invalid engine '{engine}'. Expected 'pandas' or 'polars'")
+        if engine == 'polars' and not HAS_POLARS:
+            logger.warning("polars is not installed, falling back to pandas")
+            return 'pandas'
+        return engine
+    
+    @staticmethod
+    def _aggregate_polars(df: pd.DataFrame,
+                          group_by: List[str],
+                          aggregations: Dict[str, Any],
+                          sort: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Group and aggregate with Polars' parallel hash group-by
+        
+        Args:
+            df: Input DataFrame
+            group_by: Columns to group by
+            aggregations: Dictionary mapping columns to aggregation function
+                names (or lists of names)
+            sort: Whether to sort the result by the group keys
+            
+        Returns:
+            Aggregated DataFrame shaped like the pandas result, or None when an
+            aggregation has no Polars equivalent
+        """
+        exprs = []
+        for col, funcs in aggregations.items():
+            for func in (funcs if isinstance(funcs, list) else [funcs]):
+                method = _POLARS_AGGS.get(func) if isinstance(func, str) else None
+                if method is None:
+                    return None
+                expr = getattr(pl.col(col), method)()
+                # Lists of functions are flattened to "<column>_<func>" like the pandas path
+                exprs.append(expr.alias(f"{col}_{func}") if isinstance(funcs, list) else expr)
+        
+        # Match pandas: null keys are dropped and groups come back sorted or
+        # in order of first occurrence
+        columns = list(dict.fromkeys(group_by + list(aggregations)))
+        lazy = (
+            pl.from_pandas(df[columns]).lazy()
+            .drop_nulls(subset=group_by)
+            .group_by(group_by, maintain_order=not sort)
+            .agg(exprs)
+        )
+        if sort:
+            lazy = lazy.sort(group_by)
+        result = lazy.collect()
+        return result.to_pandas(use_pyarrow_extension_array=True)
+    
+    @staticmethod
+    def _join_polars(left_df: pd.DataFrame,
+                     right_df: pd.DataFrame,
+                     left_keys: List[str],
+                     right_keys: List[str],
+                     join_type: str,
+                     suffix: Tuple[str, str]) -> Optional[pd.DataFrame]:
+        """
+        Join two DataFrames with Polars' parallel hash join
+        
+        Args:
+            left_df: Left DataFrame
+            right_df: Right DataFrame
+            left_keys: Join columns from the left DataFrame
+            right_keys: Join columns from the right DataFrame
+            join_type: Type of join ('inner', 'left', 'right', 'outer')
+            suffix: Suffixes to apply to overlapping column names
+            
+        Returns:
+            Joined DataFrame with pandas-style column naming, or None when the
+            key layout is one pandas names differently
+        """
+        same_names = [left == right for left, right in zip(left_keys, right_keys)]
+        if len(left_keys) != len(right_keys) or (any(same_names) and not all(same_names)):
+            return None
+        
+        # pandas suffixes overlapping columns on both sides; Polars only on the right
+        shared_keys = set(left_keys) if all(same_names) else set()
+        overlap = (set(left_df.columns) & set(right_df.columns)) - shared_keys
+        if overlap & (set(left_keys) | set(right_keys)):
+            return None
+        
+        left = pl.from_pandas(left_df).rename({col: f"{col}{suffix[0]}" for col in overlap})
+        right = pl.from_pandas(right_df).rename({col: f"{col}{suffix[1]}" for col in overlap})
+        result = left.lazy().join(
+            right.lazy(),
+            left_on=left_keys,
+            right_on=right_keys,
+            how=_POLARS_JOIN_TYPES[join_type],
+            coalesce=bool(shared_keys)
+        ).collect()
+        return result.to_pandas(use_pyarrow_extension_array=True)
+    
+    @staticmethod
+    def _pivot_polars(df: pd.DataFrame,
+                      index: Union[str, List[str]],
+                      columns: str,
+                      values: str,
+                      aggfunc: Union[str, Callable],
+                      fill_value: Optional[Any]) -> Optional[pd.DataFrame]:
+        """
+        Build a pivot table with Polars
+        
+        Args:
+            df: Input DataFrame
+            index: Column(s) to use as index
+            columns: Column to use for pivot columns
+            values: Column containing values
+            aggfunc: Aggregation function name
+            fill_value: Value to use for missing values
+            
+        Returns:
+            Pivot table as DataFrame, or None when the aggregation has no
+            Polars equivalent
+        """
+        if not isinstance(aggfunc, str) or not isinstance(values, str):
+            return None
+        
+        index_cols = [index] if isinstance(index, str) else list(index)
+        result = (
+            pl.from_pandas(df[index_cols + [columns, values]])
+            .drop_nulls(subset=index_cols + [columns])
+            .pivot(
+                on=columns,
+                index=index_cols,
+                values=values,
+                aggregate_function='len' if aggfunc == 'size' else aggfunc,
+                sort_columns=True
+            )
+            .sort(index_cols)
+        )
+        if fill_value is not None:
+            result = result.with_columns(pl.exclude(index_cols).fill_null(fill_value))
+        return result.to_pandas(use_pyarrow_extension_array=True)
+    
     @staticmethod
     def sort_data(df: pd.DataFrame, 
                  sort_by: Union[str, List[str]], 
@@ -281,20 +1205,75 @@ class DataProcessor:
                 if col not in df.columns:
                     raise ValueError(f"Sort column '{col}' not found in DataFrame")
             
-            logger.info(f"Sorting data by {sort_by} (ascending={ascending})")
+            logger.info("Sorting data by %s (ascending=%s)", sort_by, ascending)
             return df.sort_values(by=sort_by, ascending=ascending)
             
         except Exception as e:
             logger.error(f"Sort error: {str(e)}")
             raise
     
+    @staticmethod
+    def prepare_for_visualization(df: pd.DataFrame,
+                                  x_axis: str,
+                                  y_axis: str,
+                                  options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Reduce a DataFrame to the rows a chart of y_axis by x_axis plots
+        
+        Args:
+            df: Input DataFrame
+            x_axis: Column to use for x-axis
+            y_axis: Column to use for y-axis
+            options: Visualization options; the ones applied here are
+                - filters: Filter conditions (see filter_data)
+                - aggregate: Aggregation of y_axis per x_axis value (sum, mean, count, ...)
+                - sort_by: Column to sort by (x_axis or y_axis)
+                - ascending: Sort order (default True)
+                - limit: Maximum number of rows to keep
+                
+        Returns:
+            Dictionary with the chart rows as JSON-compatible records under
+            "values"; dates are ISO strings and missing values None
+        """
+        options = options or {}
+        for col in (x_axis, y_axis):
+            if col not in df.columns:
+                raise ValueError(f"Column '{col}' not found in DataFrame")
+        
+        try:
+            frame = DataProcessor.filter_data(df, options.get('filters') or [])
+            frame = frame[list(dict.fromkeys([x_axis, y_axis]))]
+            
+            aggregate = options.get('aggregate')
+            if aggregate and x_axis != y_axis:
+                frame = DataProcessor.aggregate_data(frame, x_axis, {y_axis: aggregate})
+            
+            sort_by = options.get('sort_by')
+            if sort_by:
+                frame = DataProcessor.sort_data(frame, sort_by, options.get('ascending', True))
+            
+            limit = options.get('limit')
+            if limit:
+                frame = frame.head(int(limit))
+            
+            # to_json turns dates, NaN/NA and NumPy or Arrow scalars into JSON values in one pass
+            values = json.loads(frame.to_json(orient='records', date_format='iso'))
+            logger.info("Prepared %d rows for visualization of %s by %s", len(values), y_axis, x_axis)
+            return {"values": values}
+            
+        except Exception as e:
+            logger.error(f"Visualization data preparation error: {str(e)}")
+            raise
+    
     @staticmethod
     def clean_data(df: pd.DataFrame, 
                   drop_duplicates: bool = False,
                   drop_na: bool = False,
                   drop_columns: Optional[List[str]] = None,
                   rename_columns: Optional[Dict[str, str]] = None,
-                  fill_na: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+                  fill_na: Optional[Dict[str, Any]] = None,
+                  optimize_dtypes: bool = False,
+                  chunksize: Optional[int] = None) -> pd.DataFrame:
         """
         Clean DataFrame by removing duplicates, handling missing values, etc.
         
@@ -305,73 +1284,165 @@ class DataProcessor:
             drop_columns: List of columns to drop
             rename_columns: Dictionary mapping old column names to new ones
             fill_na: Dictionary mapping column names to values for filling NAs
+            optimize_dtypes: Whether to downcast numeric columns and convert
+                low-cardinality string columns to category
+            chunksize: Hash rows for duplicate detection this many at a time
             
         Returns:
             Cleaned DataFrame
         """
-        result_df = df.copy()
-        rows_before = len(result_df)
-        columns_before = len(result_df.columns)
-        
-        # Drop duplicate rows
-        if drop_duplicates:
-            result_df = result_df.drop_duplicates()
-            logger.info(f"Dropped {rows_before - len(result_df)} duplicate rows")
+        rows_before = len(df)
+        columns_before = len(df.columns)
         
-        # Drop rows with missing values
-        if drop_na:
-            result_df = result_df.dropna()
-            logger.info(f"Dropped rows with missing values, {rows_before - len(result_df)} rows removed")
-            
-        # Drop specified columns
+        # Column-level work first, as one selection and one rename, so the
+        # row-level passes below scan only the columns that are kept
+        kept_columns = list(df.columns)
         if drop_columns:
-            valid_columns = [col for col in drop_columns if col in result_df.columns]
+            valid_columns = [col for col in drop_columns if col in df.columns]
             if valid_columns:
-                result_df = result_df.drop(columns=valid_columns)
-                logger.info(f"Dropped columns: {valid_columns}")
+                kept_columns = [col for col in df.columns if col not in valid_columns]
+                logger.info("Dropped columns: %s", valid_columns)
             
             invalid_columns = [col for col in drop_columns if col not in df.columns]
             if invalid_columns:
                 logger.warning(f"Columns not found for dropping: {invalid_columns}")
         
-        # Rename columns
+        valid_renames = {}
         if rename_columns:
             # Filter out column names that don't exist
-            valid_renames = {old: new for old, new in rename_columns.items() if old in result_df.columns}
+            valid_renames = {old: new for old, new in rename_columns.items() if old in kept_columns}
             if valid_renames:
-                result_df = result_df.rename(columns=valid_renames)
-                logger.info(f"Renamed columns: {valid_renames}")
+                logger.info("Renamed columns: %s", valid_renames)
             
             invalid_renames = {old: new for old, new in rename_columns.items() if old not in df.columns}
             if invalid_renames:
                 logger.warning(f"Columns not found for renaming: {list(invalid_renames.keys())}")
         
-        # Fill missing values
+        result_df = df.loc[:, kept_columns] if len(kept_columns) < columns_before else DataProcessor._copy(df)
+        if valid_renames:
+            result_df = result_df.rename(columns=valid_renames)
+        
+        # Fill missing values before dropping rows, so filled rows are kept
         if fill_na:
             valid_fills = {col: val for col, val in fill_na.items() if col in result_df.columns}
             if valid_fills:
                 result_df = result_df.fillna(valid_fills)
-                logger.info(f"Filled missing values in columns: {list(valid_fills.keys())}")
+                logger.info("Filled missing values in columns: %s", list(valid_fills))
             
-            invalid_fills = {col: val for col, val in fill_na.items() if col not in df.columns}
+            invalid_fills = {col: val for col, val in fill_na.items() if col not in result_df.columns}
             if invalid_fills:
                 logger.warning(f"Columns not found for filling NAs: {list(invalid_fills.keys())}")
         
-        rows_after = len(result_df)
-        columns_after = len(result_df.columns)
+        # Drop rows with missing values
+        if drop_na:
+            rows = len(result_df)
+            result_df = result_df.dropna()
+            logger.info("Dropped rows with missing values, %d rows removed", rows - len(result_df))
+        
+        # Drop duplicate rows
+        if drop_duplicates:
+            rows = len(result_df)
+            if chunksize and len(result_df) > chunksize:
+                result_df = DataProcessor._drop_duplicates_chunked(result_df, chunksize)
+            else:
+                result_df = result_df.drop_duplicates()
+            logger.info("Dropped %d duplicate rows", rows - len(result_df))
         
-        logger.info(f"Data cleaning complete: {rows_before}x{columns_before} → {rows_after}x{columns_after}")
+        # Shrink dtypes once the frame has its final shape
+        if optimize_dtypes:
+            result_df = DataProcessor.optimize_dtypes(result_df)
+        
+        logger.info("Data cleaning complete: %dx%d → %dx%d", rows_before, columns_before, len(result_df), len(result_df.columns))
+        return result_df
+    
+    @staticmethod
+    def _drop_duplicates_chunked(df: pd.DataFrame, chunksize: int) -> pd.DataFrame:
+        """
+        Drop duplicate rows, hashing the frame one chunk at a time
+        
+        Rows are reduced to 64-bit hashes chunk by chunk; only rows whose hash
+        occurs more than once are compared in full, so the result is exact.
+        
+        Args:
+            df: Input DataFrame
+            chunksize: Number of rows hashed at a time
+            
+        Returns:
+            DataFrame without duplicate rows, keeping first occurrences
+        """
+        hashes = np.concatenate([
+            pd.util.hash_pandas_object(df.iloc[start:start + chunksize], index=False).to_numpy()
+            for start in range(0, len(df), chunksize)
+        ])
+        candidates = pd.Series(hashes).duplicated(keep=False).to_numpy()
+        
+        keep = np.ones(len(df), dtype=bool)
+        if candidates.any():
+            keep[candidates] = ~df[candidates].duplicated().to_numpy()
+        return df[keep]
+    
+    @staticmethod
+    def optimize_dtypes(df: pd.DataFrame, category_threshold: float = 0.5) -> pd.DataFrame:
+        """
+        Downcast numeric columns and convert low-cardinality string columns
+        to category
+        
+        Integers are downcast to the narrowest integer type holding their range;
+        floats only to float32 when every value survives the round trip.
+        
+        Args:
+            df: Input DataFrame
+            category_threshold: Maximum ratio of unique values to rows for a
+                string column to be converted to category
+            
+        Returns:
+            DataFrame with optimized dtypes
+        """
+        if df.empty:
+            return df
+        
+        result_df = DataProcessor._copy(df)
+        # Deep memory usage scans every string, so only measure it when it is logged
+        log_memory = logger.isEnabledFor(logging.INFO)
+        memory_before = result_df.memory_usage(deep=True).sum() if log_memory else 0
+        
+        for col in result_df.select_dtypes(include=['int64']).columns:
+            result_df[col] = pd.to_numeric(result_df[col], downcast='integer')
+        
+        for col in result_df.select_dtypes(include=['float64']).columns:
+            values = result_df[col].to_numpy()
+            narrowed = values.astype(np.float32)
+            if ((narrowed == values) | np.isnan(values)).all():
+                result_df[col] = narrowed
+        
+        row_count = len(result_df)
+        for col in result_df.select_dtypes(include=['object', 'string']).columns:
+            try:
+                if result_df[col].nunique(dropna=True) / row_count < category_threshold:
+                    result_df[col] = result_df[col].astype('category')
+                elif (HAS_PYARROW and result_df[col].dtype == object
+                      and pd.api.types.infer_dtype(result_df[col], skipna=True) == 'string'):
+                    # Arrow-backed strings take the pyarrow.compute path in filter_data
+                    result_df[col] = result_df[col].astype('string[pyarrow]')
+            except TypeError:
+                # Unhashable values (nested lists/dicts) cannot be categorized
+                continue
+        
+        if log_memory:
+            logger.info("Optimized dtypes: memory %s → %s bytes",
+                        f"{memory_before:,}", f"{result_df.memory_usage(deep=True).sum():,}")
         return result_df
     
     @staticmethod
     def transform_columns(df: pd.DataFrame,
-                         transformations: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+                         transformations: Dict[str, Union[Dict[str, Any], List[Dict[str, Any]]]]) -> pd.DataFrame:
         """
         Apply transformations to columns
         
         Args:
             df: Input DataFrame
-            transformations: Dictionary mapping column names to transformation configs:
+            transformations: Dictionary mapping column names to a transformation
+                config, or a list of configs applied in order:
                 {
                     "column_name": {
                         "type": "transformation_type",
@@ -388,97 +1459,190 @@ class DataProcessor:
                 - "math": Apply mathematical operations
                 - "string": Apply string operations
                 
+                Consecutive math transforms on large frames are fused into a
+                single compiled pass when numba is installed.
+                
         Returns:
             Transformed DataFrame
         """
-        result_df = df.copy()
+        result_df = DataProcessor._copy(df)
+        fuse_math = HAS_NUMBA and len(result_df) >= NUMBA_MIN_ROWS
         
-        for column, config in transformations.items():
+        # Columns sharing one single-step transformation are done together
+        batched = DataProcessor._apply_batched_transforms(result_df, transformations)
+        
+        for column, configs in transformations.items():
+            if column in batched:
+                continue
             if column not in result_df.columns:
                 logger.warning(f"Column '{column}' not found, skipping transformation")
                 continue
-                
-            transform_type = config.get("type", "").lower()
-            params = config.get("params", {})
             
-            try:
-                if transform_type == "datetime_format":
-                    # Convert to datetime
-                    date_format = params.get("format")
-                    if date_format:
-                        result_df[column] = pd.to_datetime(result_df[column], format=date_format)
-                    else:
-                        result_df[column] = pd.to_datetime(result_df[column], infer_datetime_format=True)
-                    
-                elif transform_type == "numeric":
-                    # Convert to numeric
-                    errors = params.get("errors", "coerce")
-                    result_df[column] = pd.to_numeric(result_df[column], errors=errors)
-                
-                elif transform_type == "replace":
-                    # Replace values
-                    to_replace = params.get("to_replace")
-                    value = params.get("value")
-                    result_df[column] = result_df[column].replace(to_replace, value)
+            if isinstance(configs, dict):
+                configs = [configs]
+            
+            # Resolve each config to (type, operation, params, transform)
+            steps = []
+            for config in configs:
+                transform_type = config.get("type", "").lower()
+                params = config.get("params", {})
                 
-                elif transform_type == "categorical":
-                    # Convert to categorical
-                    categories = params.get("categories")
-                    if categories:
-                        result_df[column] = pd.Categorical(result_df[column], categories=categories)
+                # String and math transformations dispatch on their sub-operation too
+                operation = params.get("operation", "").lower() if transform_type in _OPERATION_TRANSFORM_TYPES else None
+                transform = _TRANSFORMS.get((transform_type, operation))
+                if transform is None:
+                    if operation is None:
+                        logger.warning(f"Unsupported transformation type: {transform_type}")
                     else:
-                        result_df[column] = result_df[column].astype('category')
-                
-                elif transform_type == "bin":
-                    # Bin numeric data
-                    bins = params.get("bins")
-                    labels = params.get("labels")
-                    if bins:
-                        result_df[column] = pd.cut(result_df[column], bins=bins, labels=labels)
-                    
-                elif transform_type == "string":
-                    # String operations
-                    string_op = params.get("operation", "").lower()
-                    
-                    if string_op == "lower":
-                        result_df[column] = result_df[column].str.lower()
-                    elif string_op == "upper":
-                        result_df[column] = result_df[column].str.upper()
-                    elif string_op == "strip":
-                        result_df[column] = result_df[column].str.strip()
-                    elif string_op == "extract":
-                        pattern = params.get("pattern")
-                        if pattern:
-                            result_df[column] = result_df[column].str.extract(pattern, expand=False)
+                        logger.warning(f"Unsupported {transform_type} operation: {operation}")
+                    continue
+                steps.append((transform_type, operation, params, transform))
+            
+            i = 0
+            while i < len(steps):
+                # Try to fuse a run of consecutive math steps into one pass
+                if fuse_math and steps[i][0] == "math":
+                    j = i
+                    while j < len(steps) and steps[j][0] == "math":
+                        j += 1
+                    if j - i > 1:
+                        fused = DataProcessor._apply_fused_math(result_df[column], steps[i:j])
+                        if fused is not None:
+                            result_df[column] = fused
+                            operations = [step[1] for step in steps[i:j]]
+                            logger.info("Applied fused math transformation %s to column '%s'", operations, column)
+                            i = j
+                            continue
                 
-                elif transform_type == "math":
-                    # Mathematical operations
-                    math_op = params.get("operation", "").lower()
-                    value = params.get("value")
+                transform_type, _, params, transform = steps[i]
+                try:
+                    result_df[column] = transform(result_df[column], params)
+                    logger.info("Applied %s transformation to column '%s'", transform_type, column)
                     
-                    if math_op == "add":
-                        result_df[column] = result_df[column] + value
-                    elif math_op == "subtract":
-                        result_df[column] = result_df[column] - value
-                    elif math_op == "multiply":
-                        result_df[column] = result_df[column] * value
-                    elif math_op == "divide":
-                        result_df[column] = result_df[column] / value
-                    elif math_op == "log":
-                        result_df[column] = np.log(result_df[column])
-                    elif math_op == "exp":
-                        result_df[column] = np.exp(result_df[column])
-                    elif math_op == "round":
-                        decimals = params.get("decimals", 0)
-                        result_df[column] = result_df[column].round(decimals)
-                
-                else:
-                    logger.warning(f"Unsupported transformation type: {transform_type}")
+                except Exception as e:
+                    logger.error(f"Error transforming column '{column}' with {transform_type}: {str(e)}")
+                i += 1
+        
+        return result_df
+    
+    @staticmethod
+    def _apply_batched_transforms(result_df: pd.DataFrame,
+                                  transformations: Dict[str, Any]) -> List[str]:
+        """
+        Apply single-step transformations shared by several columns with one
+        DataFrame-level call per group, updating result_df in place
+        
+        Args:
+            result_df: DataFrame being transformed
+            transformations: Transformations as passed to transform_columns
+            
+        Returns:
+            Columns that were transformed
+        """
+        groups: Dict[Tuple[str, Optional[str], str], List[str]] = {}
+        for column, configs in transformations.items():
+            if isinstance(configs, list):
+                if len(configs) != 1:
                     continue
-                
-                logger.info(f"Applied {transform_type} transformation to column '{column}'")
-                
+                configs = configs[0]
+            if column not in result_df.columns or not isinstance(configs, dict):
+                continue
+            
+            transform_type = configs.get("type", "").lower()
+            params = configs.get("params", {})
+            operation = params.get("operation", "").lower() if transform_type in _OPERATION_TRANSFORM_TYPES else None
+            if (transform_type, operation) not in _BATCHED_TRANSFORMS:
+                continue
+            # Batched arithmetic must promote exactly like the per-column ufuncs
+            if transform_type == "math" and not (
+                    result_df[column].dtype.kind == 'f' or result_df[column].dtype == np.int64):
+                continue
+            try:
+                key = (transform_type, operation, json.dumps(params, sort_keys=True))
+            except TypeError:
+                continue
+            groups.setdefault(key, []).append(column)
+        
+        batched: List[str] = []
+        for (transform_type, operation, params_key), columns in groups.items():
+            if len(columns) < 2:
+                continue
+            started = time.perf_counter()
+            try:
+                result_df[columns] = _BATCHED_TRANSFORMS[(transform_type, operation)](
+                    result_df[columns], json.loads(params_key)
+                )
             except Exception as e:
-                logger.error(f"Error transforming column '{column}' with {transform_type}: {str(e)}")
+                # The per-column pass retries these and reports column-level errors
+                logger.debug("Batched %s transformation failed, retrying per column: %s", transform_type, e)
+                continue
+            batched.extend(columns)
+            logger.info("Applied %s transformation to columns %s", transform_type, columns)
+            logger.debug("Batched %s transformation of %d columns took %.4fs", transform_type, len(columns), time.perf_counter() - started)
+        return batched
+    
+    @staticmethod
+    def _copy(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Copy a DataFrame that is about to be modified column by column
         
-        return result_df
+        Args:
+            df: Input DataFrame
+            
+        Returns:
+            A shallow copy when pandas copies on write, a deep copy otherwise
+        """
+        return df.copy(deep=not DataProcessor._copy_on_write())
+    
+    @staticmethod
+    def _copy_on_write() -> bool:
+        """
+        Check whether pandas copy-on-write is active
+        
+        Returns:
+            True if shallow copies are protected from in-place writes
+        """
+        if int(pd.__version__.split('.')[0]) >= 3:
+            return True
+        return pd.get_option("mode.copy_on_write") is True
+    
+    @staticmethod
+    def _apply_fused_math(series: pd.Series, steps: List[Tuple[str, str, Dict[str, Any], Callable]]) -> Optional[pd.Series]:
+        """
+        Run a chain of math transforms over a column in one compiled pass
+        
+        Args:
+            series: Column to transform
+            steps: Math steps as (type, operation, params, transform) tuples
+            
+        Returns:
+            Transformed column, or None when the chain cannot be fused and
+            should be applied step by step
+        """
+        values = _numeric_values(series)
+        if values is None:
+            return None
+        
+        try:
+            codes = np.array([_FUSED_MATH_OPS[operation] for _, operation, _, _ in steps], dtype=np.int64)
+            operands = np.array([
+                params.get("decimals", 0) if operation == "round" else params.get("value", 0)
+                for _, operation, params, _ in steps
+            ], dtype=np.float64)
+            
+            # Run the chain on the first element to learn the result dtype;
+            # integer-valued chains keep exact integer arithmetic step by step
+            probe = series.iloc[:1]
+            for _, _, params, transform in steps:
+                probe = transform(probe.copy(), params)
+            if probe.dtype.kind != 'f':
+                return None
+            result_dtype = probe.dtype.numpy_dtype if isinstance(probe.dtype, pd.ArrowDtype) else probe.dtype
+            
+            result = _fused_math_kernel(values.astype(np.float64, copy=False), codes, operands)
+            result = _numeric_result(result.astype(result_dtype, copy=False), series)
+            return pd.Series(result, index=series.index, name=series.name)
+            
+        except Exception as e:
+            logger.warning(f"Could not fuse math transformations on column '{series.name}': {str(e)}")
+            return None
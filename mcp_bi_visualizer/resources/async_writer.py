@@ -0,0 +1,313 @@
+"""
+Background artifact writer for MCP BI Visualizer.
+Moves JSON artifact writes off the event loop onto a worker thread that
+drains queued writes in batches and syncs each batch to disk together.
+"""
+import os
+import json
+import queue
+import asyncio
+import logging
+import datetime
+import itertools
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Queue item: (filepath or None for a flush barrier, encoded payload, future)
+_WriteJob = Tuple[Optional[str], bytes, Future]
+
+# Files at least this large (typically rendered images) are dropped from the
+# page cache once synced, so they do not push out data that is read again
+UNCACHED_WRITE_BYTES = 1 << 20
+
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert the values orjson serializes natively for the stdlib encoder
+    
+    Args:
+        value: Value json cannot serialize
+    
+    Returns:
+        JSON-serializable equivalent
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if np is not None:
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode_json(payload: Dict[str, Any]) -> bytes:
+    """
+    Encode a payload as indented JSON bytes
+    
+    Uses orjson when installed; the stdlib fallback accepts the same numpy
+    and datetime values.
+    
+    Args:
+        payload: JSON-serializable payload
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=_ORJSON_OPTIONS)
+    return json.dumps(payload, indent=2, default=_json_default).encode("utf-8")
+
+
+def _remove_quietly(filepath: str) -> None:
+    """Remove a file, ignoring errors (e.g. it does not exist)."""
+    try:
+        os.remove(filepath)
+    except OSError:
+        pass
+
+
+class AsyncArtifactWriter:
+    """
+    Writes JSON artifacts on a daemon thread.
+    
+    Writes submitted in a burst are coalesced into batches of up to max_batch
+    files; each batch is written, then fsynced together along with the
+    directories it touched, before the submitters' futures resolve. Files are
+    written under a temporary name and renamed into place once synced, so a
+    destination path never holds a partial file.
+    """
+    
+    def __init__(self, max_batch: int = 32, flush_interval: float = 0.05):
+        """
+        Initialize the writer; the worker thread starts on first use
+        
+        Args:
+            max_batch: Maximum number of files written per batch
+            flush_interval: Seconds to wait for more writes before syncing a batch
+        """
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[_WriteJob]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._temp_ids = itertools.count()
+    
+    def submit_nowait(self, filepath: str, payload: Dict[str, Any]) -> Future:
+        """
+        Queue a JSON artifact for writing
+        
+        The payload is encoded immediately, so later changes to it do not
+        affect what is written.
+        
+        Args:
+            filepath: Destination path
+            payload: JSON-serializable payload
+        
+        Returns:
+            Future resolving to the filepath once the file is on disk
+        """
+        try:
+            data = _encode_json(payload)
+        except Exception as e:
+            future: Future = Future()
+            future.set_exception(e)
+            return future
+        return self.submit_bytes_nowait(filepath, data)
+    
+    def submit_bytes_nowait(self, filepath: str, data: bytes) -> Future:
+        """
+        Queue raw bytes (e.g. a rendered image) for writing
+        
+        Args:
+            filepath: Destination path
+            data: File contents
+        
+        Returns:
+            Future resolving to the filepath once the file is on disk
+        """
+        future: Future = Future()
+        self._ensure_started()
+        self._queue.put((filepath, data, future))
+        return future
+    
+    async def submit(self, filepath: str, payload: Dict[str, Any]) -> str:
+        """
+        Write a JSON artifact without blocking the event loop
+        
+        Args:
+            filepath: Destination path
+            payload: JSON-serializable payload
+        
+        Returns:
+            The filepath once the file is on disk
+        """
+        return await asyncio.wrap_future(self.submit_nowait(filepath, payload))
+    
+    async def submit_bytes(self, filepath: str, data: bytes) -> str:
+        """
+        Write raw bytes without blocking the event loop
+        
+        Args:
+            filepath: Destination path
+            data: File contents
+        
+        Returns:
+            The filepath once the file is on disk
+        """
+        return await asyncio.wrap_future(self.submit_bytes_nowait(filepath, data))
+    
+    async def flush(self) -> None:
+        """Wait until every write submitted so far is on disk."""
+        if self._thread is None:
+            return
+        future: Future = Future()
+        self._queue.put((None, b"", future))
+        await asyncio.wrap_future(future)
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Finish queued writes and stop the worker thread
+        
+        Args:
+            timeout: Seconds to wait for the worker to finish
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+    
+    def _ensure_started(self) -> None:
+        """Start the worker thread if it is not running."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+                self._thread.start()
+    
+    def _run(self) -> None:
+        """Worker loop: drain a batch, write it, sync it, resolve its futures."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            
+            batch: List[_WriteJob] = [job]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    job = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    break
+                if job is None:
+                    stop = True
+                    break
+                batch.append(job)
+            
+            self._write_batch(batch)
+            if stop:
+                return
+    
+    @staticmethod
+    def _write_file(filepath: str, data: bytes) -> int:
+        """
+        Write a file with unbuffered os.write calls
+        
+        Args:
+            filepath: Path to write to
+            data: File contents
+        
+        Returns:
+            Open file descriptor of the written file, for syncing
+        """
+        fd = os.open(filepath, _OPEN_FLAGS, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        except BaseException:
+            os.close(fd)
+            _remove_quietly(filepath)
+            raise
+        return fd
+    
+    def _write_batch(self, batch: List[_WriteJob]) -> None:
+        """
+        Write a batch of files, then fsync them and their directories once
+        
+        Args:
+            batch: Jobs to write; flush barriers resolve after the batch is synced
+        """
+        written: List[Tuple[int, str, _WriteJob]] = []
+        barriers: List[Future] = []
+        
+        for job in batch:
+            filepath, data, future = job
+            if filepath is None:
+                barriers.append(future)
+                continue
+            temp_path = f"{filepath}.{next(self._temp_ids)}.tmp"
+            try:
+                written.append((self._write_file(temp_path, data), temp_path, job))
+            except Exception as e:
+                logger.error(f"Error writing artifact {filepath}: {str(e)}")
+                future.set_exception(e)
+        
+        directories = set()
+        synced: List[Tuple[str, Future]] = []
+        for fd, temp_path, (filepath, data, future) in written:
+            try:
+                try:
+                    os.fsync(fd)
+                    if len(data) >= UNCACHED_WRITE_BYTES and hasattr(os, "posix_fadvise"):
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                finally:
+                    os.close(fd)
+                os.replace(temp_path, filepath)
+                directories.add(os.path.dirname(os.path.abspath(filepath)))
+                synced.append((filepath, future))
+            except Exception as e:
+                logger.error(f"Error syncing artifact {filepath}: {str(e)}")
+                _remove_quietly(temp_path)
+                future.set_exception(e)
+        
+        # Persist the new directory entries as well
+        for directory in directories:
+            try:
+                dir_fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(dir_fd)
+            except OSError:
+                pass
+            finally:
+                os.close(dir_fd)
+        
+        for filepath, future in synced:
+            future.set_result(filepath)
+        for future in barriers:
+            future.set_result(None)
+        
+        if written:
+            logger.debug(f"Wrote batch of {len(written)} artifacts")
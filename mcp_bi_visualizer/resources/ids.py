@@ -0,0 +1,63 @@
+"""
+Resource ID allocation for MCP BI Visualizer.
+Hands out random (version 4) UUID strings from per-thread pools that are
+refilled with a single os.urandom call per batch.
+"""
+import os
+import uuid
+import threading
+
+# UUIDs generated per os.urandom call
+UUID_BATCH_SIZE = 256
+
+
+class _UuidPool:
+    """Per-thread buffer of random bytes carved into version 4 UUIDs."""
+    
+    __slots__ = ('buf', 'idx')
+    
+    def __init__(self):
+        self.buf = b""
+        self.idx = UUID_BATCH_SIZE
+    
+    def next(self) -> str:
+        """
+        Take the next UUID from the pool, refilling it when exhausted
+        
+        Returns:
+            UUID string
+        """
+        if self.idx >= UUID_BATCH_SIZE:
+            self.buf = os.urandom(UUID_BATCH_SIZE * 16)
+            self.idx = 0
+        start = self.idx * 16
+        self.idx += 1
+        b = self.buf[start:start + 16]
+        # Set the version (4) and RFC 4122 variant bits, as uuid.uuid4() does
+        return str(uuid.UUID(bytes=b[:6] + bytes([(b[6] & 0x0f) | 0x40]) + b[7:8] + bytes([(b[8] & 0x3f) | 0x80]) + b[9:]))
+
+
+_local = threading.local()
+
+
+def _reset_after_fork() -> None:
+    # A forked child must not hand out the parent's remaining IDs
+    global _local
+    _local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def new_uuid() -> str:
+    """
+    Allocate a random resource ID
+    
+    Returns:
+        Version 4 UUID string
+    """
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = _local.pool = _UuidPool()
+    return pool.next()
@@ -2,15 +2,60 @@
 Resource Manager for MCP BI Visualizer.
 Manages connections, datasets, and visualizations as resources.
 """
-import uuid
+import asyncio
+import base64
+import gzip
+import hashlib
 import logging
-import json
 import os
-from datetime import datetime
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Union
 
+import pandas as pd
+import mcp.types as types
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from .async_writer import AsyncArtifactWriter
+from .ids import new_uuid
+from .transform_log import TransformationLog
+from .viz_index import VisualizationIndex
+
 logger = logging.getLogger(__name__)
 
+# Default number of datasets kept in memory
+MAX_DATASETS = 1024
+
+# Image format -> (file suffix, MIME type) of stored visualizations; SVG is
+# text and is stored gzip-compressed
+_IMAGE_FORMATS = {
+    "png": (".png", "image/png"),
+    "svg": (".svg.gz", "image/svg+xml"),
+    "pdf": (".pdf", "application/pdf"),
+}
+
+# URI scheme of the chart data files written by store_chart_data
+CHART_DATA_SCHEME = "chart-data://"
+
+
+def _read_text(filepath: str) -> str:
+    with open(filepath, encoding="utf-8") as f:
+        return f.read()
+
+
+def _read_bytes(filepath: str) -> bytes:
+    with open(filepath, "rb") as f:
+        return f.read()
+
+
 class ResourceManager:
     """
     Manages all resources for the MCP BI server, including:
@@ -19,24 +64,50 @@ class ResourceManager:
     - Visualizations and their configurations
     """
     
-    def __init__(self, storage_dir: str = "storage"):
+    def __init__(self, storage_dir: str = "storage", max_datasets: Optional[int] = MAX_DATASETS):
         """
         Initialize the resource manager with storage for persistent resources.
         
         Args:
             storage_dir: Directory to store persistent resources
+            max_datasets: Datasets kept in memory; the least recently used
+                dataset is evicted beyond this (None for no limit)
         """
         self.connections = {}  # Store active connections by ID
-        self.datasets = {}     # Store loaded datasets by ID
-        self.visualizations = {}  # Store generated visualizations by ID
+        self.datasets = OrderedDict()  # Store loaded datasets by ID, least recently used first
+        self.max_datasets = max_datasets
+        
+        # Sanitized connection records served by list_connections (built
+        # lazily for connections registered since the last listing)
+        self._safe_connections_view: Dict[str, Dict[str, Any]] = {}
+        self._unlisted_connections: List[str] = []
         
         # Ensure storage directories exist
         self.storage_dir = storage_dir
         self.viz_dir = os.path.join(storage_dir, "visualizations")
         self.data_dir = os.path.join(storage_dir, "datasets")
+        self.chart_data_dir = os.path.join(storage_dir, "chart_data")
         
         os.makedirs(self.viz_dir, exist_ok=True)
         os.makedirs(self.data_dir, exist_ok=True)
+        os.makedirs(self.chart_data_dir, exist_ok=True)
+        
+        # Visualization records and transformation histories persist across restarts
+        index_path = os.path.join(storage_dir, "index.db")
+        self.visualizations = VisualizationIndex(index_path)
+        self._transformations = TransformationLog(index_path)
+        
+        # MCP resource listing of the visualizations; None until built and
+        # after any visualization is added or removed
+        self._resource_listing: Optional[List[types.Resource]] = None
+        
+        # Artifact files are written off the event loop
+        self._writer = AsyncArtifactWriter()
+        
+        # Formatted timestamp of the current second, and the last timestamp
+        # handed out in microseconds
+        self._ts_cache = (-1, "")
+        self._ts_last_us = 0
         
         logger.info(f"Initialized Resource Manager with storage in {storage_dir}")
     
@@ -51,20 +122,16 @@ class ResourceManager:
         Returns:
             Connection ID
         """
-        connection_id = str(uuid.uuid4())
-        
-        # Create a sanitized version of connection params for logging (remove passwords)
-        safe_params = {k: v if k != 'password' else '********' 
-                      for k, v in connection_params.items()}
+        connection_id = new_uuid()
         
         self.connections[connection_id] = {
             "id": connection_id,
             "type": connection_type,
             "params": connection_params,
-            "safe_params": safe_params,
             "status": "created",
             "created_at": self._get_timestamp()
         }
+        self._unlisted_connections.append(connection_id)
         
         logger.info(f"Registered new {connection_type} connection with ID: {connection_id}")
         return connection_id
@@ -85,6 +152,9 @@ class ResourceManager:
             return False
             
         self.connections[connection_id]["status"] = status
+        safe_connection = self._safe_connections_view.get(connection_id)
+        if safe_connection is not None:
+            safe_connection["status"] = status
         
         if error:
             self.connections[connection_id]["error"] = error
@@ -111,16 +181,24 @@ class ResourceManager:
         Returns:
             List of connection information (without sensitive data)
         """
-        return [
-            {
-                "id": conn_id,
-                "type": conn["type"],
-                "params": conn.get("safe_params", {}),
-                "status": conn["status"],
-                "created_at": conn["created_at"]
-            }
-            for conn_id, conn in self.connections.items()
-        ]
+        if self._unlisted_connections:
+            for conn_id in self._unlisted_connections:
+                conn = self.connections.get(conn_id)
+                if conn is None:
+                    continue
+                # Sanitized version of connection params (remove passwords)
+                safe_params = {k: v if k != 'password' else '********'
+                               for k, v in conn["params"].items()}
+                self._safe_connections_view[conn_id] = {
+                    "id": conn_id,
+                    "type": conn["type"],
+                    "params": safe_params,
+                    "status": conn["status"],
+                    "created_at": conn["created_at"]
+                }
+            self._unlisted_connections.clear()
+        
+        return list(self._safe_connections_view.values())
     
     def register_dataset(self, data: Any, metadata: Dict[str, Any], 
                          source_connection_id: Optional[str] = None) -> str:
@@ -135,21 +213,26 @@ class ResourceManager:
         Returns:
             Dataset ID
         """
-        dataset_id = str(uuid.uuid4())
+        dataset_id = new_uuid()
         created_at = self._get_timestamp()
         
         # Prepare dataset record
         dataset_record = {
             "id": dataset_id,
-            "data": data,
             "metadata": metadata,
             "source_connection_id": source_connection_id,
             "transformations": [],
             "created_at": created_at
         }
+        self._store_dataset_data(dataset_record, data)
         
         # Store in memory
         self.datasets[dataset_id] = dataset_record
+        if self.max_datasets is not None:
+            while len(self.datasets) > self.max_datasets:
+                evicted_id, evicted = self.datasets.popitem(last=False)
+                self._discard_dataset_file(evicted)
+                logger.info(f"Evicted least recently used dataset {evicted_id}")
         
         # Log dataset creation
         row_count = len(data) if hasattr(data, "__len__") else "unknown"
@@ -173,11 +256,13 @@ class ResourceManager:
         if dataset_id not in self.datasets:
             return False
             
+        applied_at = self._get_timestamp()
         self.datasets[dataset_id]["transformations"].append({
             "type": transformation_type,
             "params": transformation_params,
-            "applied_at": self._get_timestamp()
+            "applied_at": applied_at
         })
+        self._transformations.append(dataset_id, transformation_type, transformation_params, applied_at)
         
         logger.info(f"Added {transformation_type} transformation to dataset {dataset_id}")
         return True
@@ -196,21 +281,96 @@ class ResourceManager:
         if dataset_id not in self.datasets:
             return False
             
-        self.datasets[dataset_id]["data"] = new_data
+        self._store_dataset_data(self.datasets[dataset_id], new_data)
+        self.datasets.move_to_end(dataset_id)
         logger.info(f"Updated dataset {dataset_id} with new data")
         return True
     
-    def get_dataset(self, dataset_id: str) -> Optional[Dict[str, Any]]:
+    def get_dataset(self, dataset_id: str, columns: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Get dataset by ID
         
         Args:
             dataset_id: The dataset ID
+            columns: Columns to read from a DataFrame stored on disk (all by default)
             
         Returns:
             Dataset or None if not found
         """
-        return self.datasets.get(dataset_id)
+        dataset = self.datasets.get(dataset_id)
+        if dataset is None:
+            return None
+        
+        self.datasets.move_to_end(dataset_id)
+        data_file = dataset.get("data_file")
+        if data_file is None:
+            return dataset
+        
+        # DataFrames live on disk; read them back through a memory map
+        if columns is not None:
+            # Index levels are stored as columns and must be read with the subset
+            columns = list(columns) + data_file["index_columns"]
+        data = feather.read_feather(data_file["path"], columns=columns, memory_map=True)
+        # Arrow does not record every pandas dtype (e.g. string[pyarrow] reads back as string)
+        dtypes = data_file["dtypes"]
+        changed = {col: dtypes[col] for col in data.columns if data[col].dtype != dtypes[col]}
+        if changed:
+            data = data.astype(changed)
+        
+        result = {k: v for k, v in dataset.items() if k != "data_file"}
+        result["data"] = data
+        return result
+    
+    def _store_dataset_data(self, dataset_record: Dict[str, Any], data: Any) -> None:
+        """
+        Attach data to a dataset record, moving DataFrames out of memory
+        
+        DataFrames are written to an uncompressed Feather file in data_dir so
+        the manager only holds metadata; other data, or DataFrames Arrow
+        cannot represent, stay in memory.
+        
+        Args:
+            dataset_record: The dataset record
+            data: The dataset
+        """
+        if HAS_PYARROW and isinstance(data, pd.DataFrame):
+            data_path = os.path.join(self.data_dir, f"{dataset_record['id']}.feather")
+            tmp_path = f"{data_path}.tmp"
+            try:
+                table = pa.Table.from_pandas(data)
+                feather.write_feather(table, tmp_path, compression="uncompressed")
+                os.replace(tmp_path, data_path)
+                dataset_record.pop("data", None)
+                dataset_record["data_file"] = {
+                    "path": data_path,
+                    "dtypes": data.dtypes,
+                    "index_columns": [
+                        col for col in table.schema.pandas_metadata["index_columns"] if isinstance(col, str)
+                    ]
+                }
+                return
+            except Exception as e:
+                logger.warning(f"Keeping dataset {dataset_record['id']} in memory: {str(e)}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        
+        self._discard_dataset_file(dataset_record)
+        dataset_record["data"] = data
+    
+    @staticmethod
+    def _discard_dataset_file(dataset_record: Dict[str, Any]) -> None:
+        """
+        Delete the on-disk data of a dataset record, if any
+        
+        Args:
+            dataset_record: The dataset record
+        """
+        data_file = dataset_record.pop("data_file", None)
+        if data_file is not None:
+            try:
+                os.remove(data_file["path"])
+            except FileNotFoundError:
+                pass
     
     def register_visualization(self, dataset_id: str, chart_type: str, 
                               config: Dict[str, Any], image_path: str) -> str:
@@ -226,18 +386,19 @@ class ResourceManager:
         Returns:
             Visualization ID
         """
-        viz_id = str(uuid.uuid4())
+        viz_id = new_uuid()
         created_at = self._get_timestamp()
         
-        # Prepare visualization record
-        self.visualizations[viz_id] = {
+        # Store visualization record
+        self.visualizations.add({
             "id": viz_id,
             "dataset_id": dataset_id,
             "chart_type": chart_type,
             "config": config,
             "image_path": image_path,
             "created_at": created_at
-        }
+        })
+        self._resource_listing = None
         
         logger.info(f"Registered {chart_type} visualization with ID: {viz_id}")
         return viz_id
@@ -254,6 +415,25 @@ class ResourceManager:
         """
         return self.visualizations.get(viz_id)
     
+    def delete_visualization(self, viz_id: str) -> bool:
+        """
+        Remove a visualization record
+        
+        Args:
+            viz_id: The visualization ID
+            
+        Returns:
+            True if removed, False if visualization not found
+        """
+        image_path = self.visualizations.delete(viz_id)
+        if image_path is None:
+            return False
+        self._resource_listing = None
+        self._release_image(image_path)
+        
+        logger.info(f"Deleted visualization {viz_id}")
+        return True
+    
     def list_visualizations(self, dataset_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List visualizations, optionally filtered by dataset
@@ -264,10 +444,29 @@ class ResourceManager:
         Returns:
             List of visualization information
         """
-        if not dataset_id:
-            return list(self.visualizations.values())
-            
-        return [v for v in self.visualizations.values() if v["dataset_id"] == dataset_id]
+        return self.visualizations.list(dataset_id or None)
+    
+    async def list_resources(self) -> List[types.Resource]:
+        """
+        List visualizations as MCP resources
+        
+        The listing is built once and reused until a visualization is
+        registered or removed.
+        
+        Returns:
+            List of MCP resources
+        """
+        if self._resource_listing is None:
+            self._resource_listing = [
+                types.Resource(
+                    uri=f"visualization://{viz['id']}",
+                    name=f"{viz['chart_type']} chart",
+                    description=f"{viz['chart_type']} chart created {viz['created_at']}",
+                    mimeType=self._image_mime_type(viz['image_path'])
+                )
+                for viz in self.visualizations.list()
+            ]
+        return list(self._resource_listing)
     
     def export_visualization_config(self, viz_id: str, filepath: Optional[str] = None) -> Optional[str]:
         """
@@ -280,6 +479,42 @@ class ResourceManager:
         Returns:
             Path to the exported file, or None if visualization not found
         """
+        future = self._queue_config_export(viz_id, filepath)
+        if future is None:
+            return None
+        filepath = future.result()
+        logger.info(f"Exported visualization {viz_id} configuration to {filepath}")
+        return filepath
+    
+    async def export_visualization_config_async(self, viz_id: str, filepath: Optional[str] = None) -> Optional[str]:
+        """
+        Export visualization configuration to a JSON file without blocking the event loop
+        
+        Args:
+            viz_id: The visualization ID
+            filepath: Optional custom filepath, otherwise one will be generated
+            
+        Returns:
+            Path to the exported file, or None if visualization not found
+        """
+        future = self._queue_config_export(viz_id, filepath)
+        if future is None:
+            return None
+        filepath = await asyncio.wrap_future(future)
+        logger.info(f"Exported visualization {viz_id} configuration to {filepath}")
+        return filepath
+    
+    def _queue_config_export(self, viz_id: str, filepath: Optional[str] = None) -> Optional[Future]:
+        """
+        Queue a visualization's configuration on the artifact writer
+        
+        Args:
+            viz_id: The visualization ID
+            filepath: Optional custom filepath, otherwise one will be generated
+            
+        Returns:
+            Future resolving to the exported path, or None if visualization not found
+        """
         viz = self.get_visualization(viz_id)
         if not viz:
             return None
@@ -289,21 +524,213 @@ class ResourceManager:
             filename = f"viz_config_{viz_id}.json"
             filepath = os.path.join(self.viz_dir, filename)
             
-        # Export configuration
-        with open(filepath, 'w') as f:
-            json.dump({
-                "id": viz["id"],
-                "chart_type": viz["chart_type"],
-                "config": viz["config"],
-                "created_at": viz["created_at"]
-            }, f, indent=2)
+        return self._writer.submit_nowait(filepath, {
+            "id": viz["id"],
+            "chart_type": viz["chart_type"],
+            "config": viz["config"],
+            "created_at": viz["created_at"]
+        })
+    
+    async def save_visualization(self, chart_type: str, spec: Dict[str, Any], image_data: bytes,
+                                 dataset_id: Optional[str] = None, format: str = "png") -> str:
+        """
+        Register a rendered visualization and persist its image and configuration
+        
+        Images are stored by content hash, so identical renderings share one
+        file and are only written once; SVGs are gzip-compressed. The image
+        and configuration are queued on the artifact writer together, so
+        they are written and synced in the same batch.
+        
+        Args:
+            chart_type: Type of chart (bar, line, pie, etc.)
+            spec: Vega-Lite specification of the chart
+            image_data: Rendered image bytes
+            dataset_id: Source dataset ID, if known
+            format: Format of the image (png, svg or pdf)
+            
+        Returns:
+            Visualization resource URI
+        """
+        suffix = _IMAGE_FORMATS[format][0]
+        digest = hashlib.sha256(image_data).hexdigest()
+        image_path = os.path.join(self.viz_dir, digest[:2], f"{digest}{suffix}")
+        viz_id = self.register_visualization(dataset_id, chart_type, spec, image_path)
+        
+        writes = [self.export_visualization_config_async(viz_id)]
+        if not await asyncio.to_thread(self._prepare_image_dir, image_path):
+            if format == "svg":
+                image_data = await asyncio.to_thread(gzip.compress, image_data, 6, mtime=0)
+            writes.append(self._writer.submit_bytes(image_path, image_data))
+        await asyncio.gather(*writes)
+        
+        return f"visualization://{viz_id}"
+    
+    async def store_chart_data(self, values: Any, float_format: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Store chart rows as a CSV file that Vega-Lite specs can reference by URL
+        
+        Files are named by content hash, so identical data is written once and
+        the URL changes whenever the data does. The URL is a chart-data://
+        resource URI that clients fetch through get_resource; specs passed to
+        the local renderer are pointed at the file with localize_spec.
+        
+        Args:
+            values: Chart rows as a list of dicts or a DataFrame
+            float_format: printf-style format for float columns, e.g. "%.7g"
             
-        logger.info(f"Exported visualization {viz_id} configuration to {filepath}")
-        return filepath
+        Returns:
+            Vega-Lite data reference ({"url": ..., "format": ...})
+        """
+        frame = values if isinstance(values, pd.DataFrame) else pd.DataFrame(values)
+        csv_data = (await asyncio.to_thread(frame.to_csv, index=False, float_format=float_format)).encode("utf-8")
+        digest = hashlib.sha256(csv_data).hexdigest()
+        data_path = os.path.join(self.chart_data_dir, f"{digest[:32]}.csv")
+        
+        if not await asyncio.to_thread(os.path.exists, data_path):
+            await self._writer.submit_bytes(data_path, csv_data)
+        
+        return {
+            "url": f"{CHART_DATA_SCHEME}{os.path.basename(data_path)}",
+            "format": {"type": "csv"}
+        }
+    
+    def chart_data_path(self, uri: str) -> Optional[str]:
+        """
+        Get the local file behind a chart data URI
+        
+        Args:
+            uri: URI returned by store_chart_data
+            
+        Returns:
+            Path of the CSV file, or None if uri is not a chart data URI
+        """
+        if not uri.startswith(CHART_DATA_SCHEME):
+            return None
+        name = uri[len(CHART_DATA_SCHEME):]
+        if os.path.basename(name) != name or not name.endswith(".csv"):
+            return None
+        return os.path.join(self.chart_data_dir, name)
+    
+    def localize_spec(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Point a spec's chart data URI at the local file, for rendering
+        
+        Args:
+            spec: Vega-Lite specification
+            
+        Returns:
+            The spec with its data URL rewritten to a file:// URL, or the
+            spec itself when its data is not stored chart data
+        """
+        data = spec.get("data")
+        path = self.chart_data_path(data.get("url", "")) if isinstance(data, dict) else None
+        if path is None:
+            return spec
+        return {**spec, "data": {**data, "url": f"file://{os.path.abspath(path)}"}}
+    
+    async def get_resource(self, uri: str) -> Union[types.TextResourceContents, types.BlobResourceContents]:
+        """
+        Read a visualization image or stored chart data by URI
+        
+        Args:
+            uri: visualization:// or chart-data:// URI
+            
+        Returns:
+            Resource contents; SVGs and CSVs as text, other images base64-encoded
+        """
+        data_path = self.chart_data_path(uri)
+        if data_path is not None:
+            try:
+                text = await asyncio.to_thread(_read_text, data_path)
+            except FileNotFoundError:
+                raise ValueError(f"Chart data not found: {uri}")
+            return types.TextResourceContents(uri=uri, mimeType="text/csv", text=text)
+        
+        viz = self.get_visualization(uri.removeprefix("visualization://")) if uri.startswith("visualization://") else None
+        if viz is None:
+            raise ValueError(f"Resource not found: {uri}")
+        mime_type = self._image_mime_type(viz["image_path"])
+        image_data = await asyncio.to_thread(_read_bytes, viz["image_path"])
+        if viz["image_path"].endswith(".gz"):
+            return types.TextResourceContents(uri=uri, mimeType=mime_type, text=gzip.decompress(image_data).decode("utf-8"))
+        return types.BlobResourceContents(uri=uri, mimeType=mime_type, blob=base64.b64encode(image_data).decode("ascii"))
+    
+    @staticmethod
+    def _prepare_image_dir(image_path: str) -> bool:
+        """
+        Create the directory of a content-addressed image
+        
+        Args:
+            image_path: Path to the image
+            
+        Returns:
+            True if the image already exists
+        """
+        if os.path.exists(image_path):
+            return True
+        os.makedirs(os.path.dirname(image_path), exist_ok=True)
+        return False
+    
+    @staticmethod
+    def _image_mime_type(image_path: str) -> str:
+        """
+        Get the MIME type of a stored visualization image
+        
+        Args:
+            image_path: Path to the image
+            
+        Returns:
+            MIME type of the image, judged by its file suffix
+        """
+        for suffix, mime_type in _IMAGE_FORMATS.values():
+            if image_path.endswith(suffix):
+                return mime_type
+        return "image/png"
+    
+    def _release_image(self, image_path: str) -> None:
+        """
+        Delete a content-addressed image once no visualization uses it
+        
+        Args:
+            image_path: Image path of a removed visualization
+        """
+        # Only images stored by save_visualization (viz_dir/<xx>/<hash>.<suffix>) are owned here
+        if os.path.dirname(os.path.dirname(image_path)) != self.viz_dir:
+            return
+        if self.visualizations.count_image_references(image_path):
+            return
+        try:
+            os.remove(image_path)
+        except FileNotFoundError:
+            pass
+    
+    async def flush(self) -> None:
+        """Wait until all pending artifact writes and transformation records are on disk."""
+        self._transformations.commit()
+        await self._writer.flush()
+    
+    def close(self) -> None:
+        """Finish queued artifact writes and close the visualization index and transformation log."""
+        self._writer.close()
+        self._transformations.close()
+        self.visualizations.close()
     
     def _get_timestamp(self) -> str:
-        """Get current timestamp as ISO format string."""
-        return datetime.now().isoformat()
+        """
+        Get current timestamp as ISO format string
+        
+        The date/time part is formatted once per second; timestamps are
+        strictly increasing, so records created in a burst stay ordered.
+        
+        Returns:
+            Local time in ISO format with microseconds
+        """
+        now_us = max(time.time_ns() // 1000, self._ts_last_us + 1)
+        self._ts_last_us = now_us
+        second, micros = divmod(now_us, 1_000_000)
+        if second != self._ts_cache[0]:
+            self._ts_cache = (second, datetime.fromtimestamp(second).isoformat())
+        return f"{self._ts_cache[1]}.{micros:06d}"
     
     def cleanup_resources(self, older_than_days: Optional[int] = None) -> Dict[str, int]:
         """
@@ -315,10 +742,35 @@ class ResourceManager:
         Returns:
             Count of resources cleaned up by type
         """
-        # Implementation would check dates and remove old resources
-        # For now just return placeholder counts
-        return {
+        removed = {
             "connections": 0,
             "datasets": 0,
             "visualizations": 0
         }
+        if older_than_days is None:
+            return removed
+        
+        cutoff = datetime.now() - timedelta(days=older_than_days)
+        
+        def expired(records: Dict[str, Dict[str, Any]]) -> List[str]:
+            return [record_id for record_id, record in records.items()
+                    if datetime.fromisoformat(record["created_at"]) < cutoff]
+        
+        for connection_id in expired(self.connections):
+            del self.connections[connection_id]
+            self._safe_connections_view.pop(connection_id, None)
+            removed["connections"] += 1
+        
+        for dataset_id in expired(self.datasets):
+            self._discard_dataset_file(self.datasets.pop(dataset_id))
+            removed["datasets"] += 1
+        
+        image_paths = self.visualizations.delete_older_than(cutoff.isoformat(timespec="microseconds"))
+        if image_paths:
+            self._resource_listing = None
+        for image_path in set(image_paths):
+            self._release_image(image_path)
+        removed["visualizations"] = len(image_paths)
+        
+        logger.info(f"Cleaned up resources older than {older_than_days} days: {removed}")
+        return removed
@@ -1,10 +1,22 @@
-import uuid
 import logging
 from typing import Dict, Any, Optional, List
 
+from .ids import new_uuid
+
 logger = logging.getLogger(__name__)
 
+# pop default that no stored memo content can be
+_MISSING = object()
+
 class MemoResourceManager:
+    """
+    Stores memo resources in memory.
+    
+    Every operation is a single in-memory dict operation without I/O, so the
+    server calls them directly on its event loop; they are not meant to be
+    called from other threads.
+    """
+    
     def __init__(self):
         self.memory = {}  # Store memo resources by ID
 
@@ -18,7 +30,7 @@ class MemoResourceManager:
         Returns:
             The ID of the created memo
         """
-        memo_id = str(uuid.uuid4())
+        memo_id = new_uuid()
         self.memory[memo_id] = content
         logger.info(f"Created memo with ID {memo_id}")
         return memo_id
@@ -42,7 +54,9 @@ class MemoResourceManager:
         Returns:
             A list of memo resource metadata
         """
-        return [{"id": memo_id, "content": content} for memo_id, content in self.memory.items()]
+        # list() copies the items in one step, so a memo created or deleted
+        # meanwhile cannot break the iteration
+        return [{"id": memo_id, "content": content} for memo_id, content in list(self.memory.items())]
 
     def delete_memo(self, memo_id: str) -> bool:
         """
@@ -54,8 +68,7 @@ class MemoResourceManager:
         Returns:
             True if the memo was deleted, False if not found
         """
-        if memo_id in self.memory:
-            del self.memory[memo_id]
-            logger.info(f"Deleted memo with ID {memo_id}")
-            return True
-        return False
\ No newline at end of file
+        if self.memory.pop(memo_id, _MISSING) is _MISSING:
+            return False
+        logger.info(f"Deleted memo with ID {memo_id}")
+        return True
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Transformation log for MCP BI Visualizer.
+Persists dataset transformation histories to SQLite, committing the
+transformations recorded within one event-loop tick in a single transaction.
+"""
+import json
+import sqlite3
+import asyncio
+import logging
+from typing import Any, Dict, List, Tuple
+
+from .async_writer import _encode_json
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transformations (
+    dataset_id TEXT,
+    type TEXT,
+    params TEXT,
+    applied_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_transformations_dataset ON transformations(dataset_id);
+"""
+
+
+class TransformationLog:
+    """
+    SQLite-backed log of applied transformations.
+    
+    Records are buffered and written together once the current event-loop
+    iteration finishes; outside an event loop they are written immediately.
+    """
+    
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the log database
+        
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self._db = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._pending: List[Tuple[str, str, str, str]] = []
+        self._commit_scheduled = False
+    
+    def append(self, dataset_id: str, transformation_type: str,
+               params: Dict[str, Any], applied_at: str) -> None:
+        """
+        Record a transformation
+        
+        Args:
+            dataset_id: The dataset ID
+            transformation_type: Type of transformation (filter, aggregate, etc.)
+            params: Parameters of the transformation
+            applied_at: ISO format timestamp
+        """
+        try:
+            encoded = _encode_json(params).decode("utf-8")
+        except Exception as e:
+            logger.warning(f"Not persisting {transformation_type} transformation of dataset {dataset_id}: {str(e)}")
+            return
+        self._pending.append((dataset_id, transformation_type, encoded, applied_at))
+        
+        if self._commit_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.commit()
+            return
+        loop.call_soon(self.commit)
+        self._commit_scheduled = True
+    
+    def commit(self) -> None:
+        """Write all buffered transformations in one transaction."""
+        self._commit_scheduled = False
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        try:
+            self._db.execute("BEGIN")
+            self._db.executemany("INSERT INTO transformations VALUES (?, ?, ?, ?)", rows)
+            self._db.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._db.in_transaction:
+                self._db.execute("ROLLBACK")
+            logger.error(f"Error persisting {len(rows)} transformations: {str(e)}")
+    
+    def history(self, dataset_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the persisted transformation history of a dataset
+        
+        Args:
+            dataset_id: The dataset ID
+        
+        Returns:
+            Transformations in the order they were applied
+        """
+        self.commit()
+        rows = self._db.execute(
+            "SELECT type, params, applied_at FROM transformations WHERE dataset_id = ? ORDER BY rowid",
+            (dataset_id,)
+        )
+        return [
+            {"type": transformation_type, "params": json.loads(params), "applied_at": applied_at}
+            for transformation_type, params, applied_at in rows
+        ]
+    
+    def close(self) -> None:
+        """Write buffered transformations and close the database connection."""
+        self.commit()
+        self._db.close()
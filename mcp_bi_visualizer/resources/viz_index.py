@@ -0,0 +1,155 @@
+"""
+Visualization index for MCP BI Visualizer.
+Keeps visualization metadata in a SQLite file so it survives restarts and
+can be looked up by dataset or age without scanning every record.
+"""
+import json
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+from .async_writer import _encode_json
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS viz (
+    id TEXT PRIMARY KEY,
+    dataset_id TEXT,
+    chart_type TEXT,
+    config TEXT,
+    image_path TEXT,
+    created_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_viz_dataset ON viz(dataset_id);
+CREATE INDEX IF NOT EXISTS idx_viz_created_at ON viz(created_at);
+CREATE INDEX IF NOT EXISTS idx_viz_image_path ON viz(image_path);
+"""
+
+_COLUMNS = "id, dataset_id, chart_type, config, image_path, created_at"
+
+
+class VisualizationIndex:
+    """
+    SQLite-backed store of visualization records.
+    
+    Records are returned as dicts with the same keys ResourceManager has
+    always used; the chart configuration is stored as JSON.
+    """
+    
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the index database
+        
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self._db = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+    
+    def add(self, record: Dict[str, Any]) -> None:
+        """
+        Store a visualization record
+        
+        Args:
+            record: Visualization record (id, dataset_id, chart_type, config,
+                image_path, created_at)
+        """
+        self._db.execute(
+            f"INSERT INTO viz ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+            (record["id"], record["dataset_id"], record["chart_type"],
+             _encode_json(record["config"]).decode("utf-8"),
+             record["image_path"], record["created_at"])
+        )
+    
+    def get(self, viz_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a visualization record by ID
+        
+        Args:
+            viz_id: The visualization ID
+        
+        Returns:
+            Visualization record or None if not found
+        """
+        row = self._db.execute(f"SELECT {_COLUMNS} FROM viz WHERE id = ?", (viz_id,)).fetchone()
+        return self._to_record(row) if row is not None else None
+    
+    def list(self, dataset_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List visualization records in registration order
+        
+        Args:
+            dataset_id: If provided, only return visualizations for this dataset
+        
+        Returns:
+            Visualization records
+        """
+        if dataset_id is None:
+            rows = self._db.execute(f"SELECT {_COLUMNS} FROM viz ORDER BY rowid")
+        else:
+            rows = self._db.execute(
+                f"SELECT {_COLUMNS} FROM viz WHERE dataset_id = ? ORDER BY rowid", (dataset_id,)
+            )
+        return [self._to_record(row) for row in rows]
+    
+    def count_image_references(self, image_path: str) -> int:
+        """
+        Count the visualizations that use an image file
+        
+        Args:
+            image_path: Path to the image
+        
+        Returns:
+            Number of visualization records with this image path
+        """
+        return self._db.execute("SELECT COUNT(*) FROM viz WHERE image_path = ?", (image_path,)).fetchone()[0]
+    
+    def delete(self, viz_id: str) -> Optional[str]:
+        """
+        Remove a visualization record
+        
+        Args:
+            viz_id: The visualization ID
+        
+        Returns:
+            Image path of the removed visualization, or None if not found
+        """
+        row = self._db.execute("SELECT image_path FROM viz WHERE id = ?", (viz_id,)).fetchone()
+        if row is None:
+            return None
+        self._db.execute("DELETE FROM viz WHERE id = ?", (viz_id,))
+        return row[0]
+    
+    def delete_older_than(self, cutoff: str) -> List[str]:
+        """
+        Remove visualizations created before a timestamp
+        
+        Args:
+            cutoff: ISO format timestamp
+        
+        Returns:
+            Image paths of the removed visualizations
+        """
+        with self._db:
+            self._db.execute("BEGIN")
+            image_paths = [row[0] for row in self._db.execute(
+                "SELECT image_path FROM viz WHERE created_at < ?", (cutoff,)
+            )]
+            self._db.execute("DELETE FROM viz WHERE created_at < ?", (cutoff,))
+        return image_paths
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+    
+    @staticmethod
+    def _to_record(row: tuple) -> Dict[str, Any]:
+        viz_id, dataset_id, chart_type, config, image_path, created_at = row
+        return {
+            "id": viz_id,
+            "dataset_id": dataset_id,
+            "chart_type": chart_type,
+            "config": json.loads(config),
+            "image_path": image_path,
+            "created_at": created_at
+        }
@@ -1,6 +1,9 @@
 import asyncio
+import logging
 import os
 import json
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 
 import mcp.types as types
@@ -14,26 +17,220 @@ from .visualization.renderer import VisualizationRenderer
 from .resources.manager import ResourceManager
 from .resources.memo import MemoResourceManager  # Import MemoResourceManager
 
+logger = logging.getLogger(__name__)
+
+# Charts with more rows than this reference their data from a file instead
+# of embedding it in the spec
+INLINE_DATA_MAX_ROWS = 1000
+
+# Rendered SVGs larger than this (e.g. dense scatter plots) are rasterized to
+# PNG instead, which is smaller and cheaper for clients to display
+SVG_MAX_BYTES = 1 << 20
+
+# Number of loaded data files kept for reuse across tool calls
+DATA_CACHE_SIZE = 32
+
+# Chart values are written with float32 precision; more digits only make the
+# spec or data file bigger without changing the rendered chart
+CHART_SIGNIFICANT_DIGITS = 7
+
+# Wider frames are previewed with only their first and last columns
+PREVIEW_MAX_COLUMNS = 50
+
+# File extension -> data format
+_EXTENSION_FORMATS = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".json": "json",
+    ".jsonl": "json",
+    ".ndjson": "json",
+    ".xlsx": "excel",
+    ".xls": "excel",
+}
+
+# Prompt definitions are constant, so they are built once at import
+PROMPTS = [
+    types.Prompt(
+        name="create-dashboard",
+        description="Create a BI dashboard from your data",
+        arguments=[
+            types.PromptArgument(
+                name="data_source",
+                description="Path or URL to your data",
+                required=True
+            ),
+            types.PromptArgument(
+                name="business_question",
+                description="Business question to answer with visualizations",
+                required=True
+            )
+        ]
+    ),
+    types.Prompt(
+        name="analyze-trends",
+        description="Analyze trends in time-series data",
+        arguments=[
+            types.PromptArgument(
+                name="data_source",
+                description="Path or URL to your data",
+                required=True
+            ),
+            types.PromptArgument(
+                name="time_column",
+                description="Column containing time/date information",
+                required=True
+            ),
+            types.PromptArgument(
+                name="value_column",
+                description="Column containing values to analyze",
+                required=True
+            )
+        ]
+    )
+]
+
+
+# Prompt name -> template of the prompt's user message, filled from the
+# prompt's arguments
+_PROMPT_TEMPLATES = {
+    "create-dashboard": (
+        "I want to create a BI dashboard to answer this business question: '{business_question}'. "
+        "Please help me analyze the data from {data_source} and create appropriate visualizations."
+    ),
+    "analyze-trends": (
+        "I want to analyze trends in my time-series data from {data_source}. "
+        "Please analyze the '{time_column}' column as my time dimension and the '{value_column}' column as my values."
+    ),
+}
+_PROMPT_ARGUMENTS = {prompt.name: tuple(arg.name for arg in prompt.arguments) for prompt in PROMPTS}
+
+
+@dataclass
+class LoadedData:
+    """A loaded DataFrame with the summary the load_data tool reports."""
+    
+    data: Any  # None when only the summary was read
+    rows: int
+    columns: List[str]
+    preview: List[Dict[str, Any]]
+
+
+def _round_floats(values: Any) -> Any:
+    """
+    Round the float fields of chart rows to CHART_SIGNIFICANT_DIGITS digits
+    
+    Args:
+        values: Chart rows as a list of dicts; anything else is returned as is
+        
+    Returns:
+        Rows with shortened floats
+    """
+    if not isinstance(values, list):
+        return values
+    float_format = f".{CHART_SIGNIFICANT_DIGITS}g"
+    return [
+        {key: float(format(value, float_format)) if type(value) is float else value
+         for key, value in row.items()}
+        if isinstance(row, dict) else row
+        for row in values
+    ]
+
+
+def _preview_records(data: Any, preview_rows: int) -> List[Dict[str, Any]]:
+    """
+    Build the preview rows of a DataFrame
+    
+    Args:
+        data: DataFrame to preview
+        preview_rows: Number of rows to include
+        
+    Returns:
+        The first rows as records, limited to the first and last
+        PREVIEW_MAX_COLUMNS / 2 columns for wide frames
+    """
+    head = data.head(preview_rows)
+    if len(head.columns) > PREVIEW_MAX_COLUMNS:
+        half = PREVIEW_MAX_COLUMNS // 2
+        head = head.iloc[:, list(range(half)) + list(range(len(head.columns) - half, len(head.columns)))]
+    return head.to_dict(orient="records")
+
+
+def _read_source(source: str, format: str = "auto", preview_rows: int = 5,
+                 summary_only: bool = False) -> LoadedData:
+    """
+    Load data with the DataLoader reader for its source and summarize it
+    
+    Args:
+        source: Path or URL to the data
+        format: Data format (auto, csv, json, excel); auto uses the file extension
+        preview_rows: Number of rows to include in the preview
+        summary_only: Whether a CSV file may be summarized by streaming it
+            instead of loading it; other sources are always loaded
+        
+    Returns:
+        Loaded data with its row count, column names and preview rows
+    """
+    if source.startswith(("http://", "https://")):
+        data, _ = DataLoader.load_from_api(source)
+    else:
+        if format == "auto":
+            format = _EXTENSION_FORMATS.get(os.path.splitext(source)[1].lower(), "csv")
+        
+        if format == "csv":
+            read_kwargs = {"sep": "\t"} if source.lower().endswith(".tsv") else {}
+            if summary_only:
+                rows, preview = DataLoader.preview_csv(
+                    source, preview_rows, delimiter=read_kwargs.get("sep", ",")
+                )
+                return LoadedData(
+                    data=None,
+                    rows=rows,
+                    columns=list(preview.columns),
+                    preview=_preview_records(preview, preview_rows)
+                )
+            data, _ = DataLoader.load_from_csv(source, **read_kwargs)
+        elif format == "json":
+            data, _ = DataLoader.load_from_json(source)
+        elif format == "excel":
+            data, _ = DataLoader.load_from_excel(source)
+        else:
+            raise ValueError(f"Unsupported data format for {source}: {format}")
+    
+    return LoadedData(
+        data=data,
+        rows=len(data),
+        columns=list(data.columns),
+        preview=_preview_records(data, preview_rows)
+    )
+
+
 class BiVisualizerServer:
     """
     MCP server for generating BI visualizations from data.
     """
     
-    def __init__(self, name: str = "mcp-bi-visualizer"):
+    def __init__(self, name: str = "mcp-bi-visualizer", storage_dir: str = "storage"):
         """
         Initialize the BI Visualizer MCP server.
         
         Args:
             name: Name of the MCP server
+            storage_dir: Directory to store persistent resources
         """
         self.app = Server(name)
         self.data_loader = DataLoader()
         self.data_processor = DataProcessor()
         self.vega_generator = VegaLiteGenerator()
         self.renderer = VisualizationRenderer()
-        self.resource_manager = ResourceManager()
+        self.resource_manager = ResourceManager(storage_dir=storage_dir)
         self.memo_manager = MemoResourceManager()  # Initialize MemoResourceManager
         
+        # Loaded data files by (path, mtime, size, format), least recently used first
+        self._data_cache: OrderedDict = OrderedDict()
+        
+        # Bounds the charts create_visualizations builds at once
+        self._render_slots = asyncio.Semaphore(os.cpu_count() or 1)
+        
         # Register MCP handlers
         self.register_tools()
         self.register_resources()
@@ -55,14 +252,14 @@ class BiVisualizerServer:
             Returns:
                 Dictionary with data information and preview
             """
-            data = await self.data_loader.load(source, format)
-            preview = data.head(5).to_dict() if hasattr(data, 'head') else data[:5]
+            # The frame itself is only loaded once a chart needs it
+            loaded = await self._load(source, format, summary_only=True)
             
             return {
                 "success": True,
-                "rows": len(data),
-                "columns": list(data.columns) if hasattr(data, 'columns') else list(data[0].keys()),
-                "preview": preview
+                "rows": loaded.rows,
+                "columns": loaded.columns,
+                "preview": loaded.preview
             }
         
         @self.app.tool()
@@ -71,7 +268,8 @@ class BiVisualizerServer:
             chart_type: str,
             x_axis: str,
             y_axis: str,
-            options: Optional[Dict[str, Any]] = None
+            options: Optional[Dict[str, Any]] = None,
+            format: str = "svg"
         ) -> Dict[str, Any]:
             """
             Create a visualization from the given data.
@@ -81,37 +279,66 @@ class BiVisualizerServer:
                 chart_type: Type of chart (bar, line, scatter, pie, etc.)
                 x_axis: Column to use for x-axis
                 y_axis: Column to use for y-axis
-                options: Additional visualization options
+                options: Additional visualization options, e.g. title,
+                    filters, sort_by, limit, or aggregate to reduce y_axis
+                    per x_axis value (sum, mean, count, min, max)
+                format: Image format (svg or png); very large SVGs are
+                    rendered as PNG instead
                 
             Returns:
                 Dictionary with visualization URI and metadata
             """
-            # Load data
-            data = await self.data_loader.load(data_source)
+            return await self._create_visualization(data_source, chart_type, x_axis, y_axis, options, format)
+        
+        @self.app.tool()
+        async def create_visualizations(charts: List[Dict[str, Any]], format: str = "svg") -> List[Dict[str, Any]]:
+            """
+            Create several visualizations concurrently, e.g. for a dashboard.
             
-            # Process data for visualization
-            processed_data = self.data_processor.prepare_for_visualization(
-                data, x_axis, y_axis, options
-            )
+            Args:
+                charts: Chart requests, each with the arguments of
+                    create_visualization (data_source, chart_type, x_axis,
+                    y_axis and optional options)
+                format: Image format of every chart (svg or png)
+                
+            Returns:
+                One result per chart, in request order; failed charts have
+                success False and an error message
+            """
+            # Load each distinct source once before the charts fan out
+            sources = {chart["data_source"] for chart in charts}
+            await asyncio.gather(*(self._load(source) for source in sources), return_exceptions=True)
             
-            # Generate Vega-Lite spec
-            vega_spec = self.vega_generator.create_chart(
-                chart_type, processed_data, x_axis, y_axis, options
-            )
+            async def build(chart: Dict[str, Any]) -> Dict[str, Any]:
+                async with self._render_slots:
+                    return await self._build_spec(
+                        chart["data_source"], chart["chart_type"], chart["x_axis"],
+                        chart["y_axis"], chart.get("options")
+                    )
             
-            # Render visualization
-            image_data = await self.renderer.render(vega_spec, format="png")
+            # Build every spec, then render them all in one batch
+            outcomes: List[Any] = await asyncio.gather(*(build(chart) for chart in charts), return_exceptions=True)
+            built = [i for i, outcome in enumerate(outcomes) if not isinstance(outcome, Exception)]
+            images = await self._render_images([outcomes[i] for i in built], format)
             
-            # Save as resource
-            resource_uri = await self.resource_manager.save_visualization(
-                chart_type, vega_spec, image_data
-            )
+            async def save(i: int, image: Any) -> None:
+                if isinstance(image, Exception):
+                    outcomes[i] = image
+                    return
+                try:
+                    outcomes[i] = await self._save_visualization(charts[i]["chart_type"], outcomes[i], *image)
+                except Exception as e:
+                    outcomes[i] = e
             
-            return {
-                "success": True,
-                "visualization_uri": resource_uri,
-                "spec": vega_spec
-            }
+            await asyncio.gather(*(save(i, image) for i, image in zip(built, images)))
+            
+            results = []
+            for chart, outcome in zip(charts, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error creating {chart.get('chart_type')} visualization: {str(outcome)}")
+                    outcome = {"success": False, "error": str(outcome)}
+                results.append(outcome)
+            return results
         
         @self.app.tool()
         async def add_insight(visualization_uri: str, insight: str) -> Dict[str, Any]:
@@ -131,6 +358,160 @@ class BiVisualizerServer:
                 "message": "Insight added to memo"
             }
     
+    async def _create_visualization(self, data_source: str, chart_type: str, x_axis: str, y_axis: str,
+                                    options: Optional[Dict[str, Any]] = None,
+                                    format: str = "svg") -> Dict[str, Any]:
+        """
+        Load data, build its chart spec, render it and save it as a resource
+        
+        Args:
+            data_source: Path or URL to the data
+            chart_type: Type of chart (bar, line, scatter, pie, etc.)
+            x_axis: Column to use for x-axis
+            y_axis: Column to use for y-axis
+            options: Additional visualization options
+            format: Image format (svg or png)
+            
+        Returns:
+            Dictionary with visualization URI and metadata
+        """
+        vega_spec = await self._build_spec(data_source, chart_type, x_axis, y_axis, options)
+        
+        # Render visualization
+        image = (await self._render_images([vega_spec], format))[0]
+        if isinstance(image, Exception):
+            raise image
+        
+        return await self._save_visualization(chart_type, vega_spec, *image)
+    
+    async def _render_images(self, vega_specs: List[Dict[str, Any]], format: str) -> List[Any]:
+        """
+        Render chart specs in one batch, rasterizing SVGs over SVG_MAX_BYTES
+        
+        Args:
+            vega_specs: Vega-Lite specifications
+            format: Requested image format (svg or png)
+            
+        Returns:
+            (image bytes, format) per spec in order, or the exception of a
+            failed render
+        """
+        # Stored chart data is read from disk by the local renderer only
+        vega_specs = [self.resource_manager.localize_spec(spec) for spec in vega_specs]
+        images = await self.renderer.render_batch(vega_specs, format=format, return_exceptions=True)
+        results = [image if isinstance(image, Exception) else (image, format) for image in images]
+        
+        if format == "svg":
+            oversized = [i for i, image in enumerate(images)
+                         if not isinstance(image, Exception) and len(image) > SVG_MAX_BYTES]
+            if oversized:
+                pngs = await self.renderer.render_batch(
+                    [vega_specs[i] for i in oversized], format="png", return_exceptions=True
+                )
+                for i, png in zip(oversized, pngs):
+                    results[i] = png if isinstance(png, Exception) else (png, "png")
+        return results
+    
+    async def _build_spec(self, data_source: str, chart_type: str, x_axis: str, y_axis: str,
+                          options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Load data and build its Vega-Lite chart spec
+        
+        Args:
+            data_source: Path or URL to the data
+            chart_type: Type of chart (bar, line, scatter, pie, etc.)
+            x_axis: Column to use for x-axis
+            y_axis: Column to use for y-axis
+            options: Additional visualization options
+            
+        Returns:
+            Vega-Lite specification
+        """
+        # Load data
+        data = (await self._load(data_source)).data
+        
+        # Process data for visualization; pandas work on large frames would
+        # otherwise stall every other tool call
+        processed_data = await asyncio.to_thread(
+            self.data_processor.prepare_for_visualization, data, x_axis, y_axis, options
+        )
+        
+        # Keep large data out of the spec
+        if len(processed_data['values']) > INLINE_DATA_MAX_ROWS:
+            processed_data = await self.resource_manager.store_chart_data(
+                processed_data['values'], float_format=f"%.{CHART_SIGNIFICANT_DIGITS}g"
+            )
+        else:
+            processed_data = {**processed_data, 'values': _round_floats(processed_data['values'])}
+        
+        # Generate Vega-Lite spec
+        return self.vega_generator.create_chart(
+            chart_type, processed_data, x_axis, y_axis, options
+        )
+    
+    async def _save_visualization(self, chart_type: str, vega_spec: Dict[str, Any],
+                                  image_data: bytes, format: str = "png") -> Dict[str, Any]:
+        """
+        Save a rendered chart as a visualization resource
+        
+        Args:
+            chart_type: Type of chart (bar, line, scatter, pie, etc.)
+            vega_spec: Vega-Lite specification of the chart
+            image_data: Rendered image bytes
+            format: Format of the image (svg or png)
+            
+        Returns:
+            Dictionary with visualization URI and metadata
+        """
+        # Save as resource
+        resource_uri = await self.resource_manager.save_visualization(
+            chart_type, vega_spec, image_data, format=format
+        )
+        
+        return {
+            "success": True,
+            "visualization_uri": resource_uri,
+            "format": format,
+            "spec": vega_spec
+        }
+    
+    async def _load(self, source: str, format: str = "auto", summary_only: bool = False) -> LoadedData:
+        """
+        Load data from a file or URL, reusing unchanged data loaded by earlier calls
+        
+        Files are reused while their modification time and size match; URLs
+        while their ETag or Last-Modified header does, and are always fetched
+        when the server sends neither.
+        
+        Args:
+            source: Path or URL to the data
+            format: Data format (auto, csv, json, excel)
+            summary_only: Whether a summary without the data is enough; CSV
+                files are then streamed instead of loaded
+            
+        Returns:
+            Loaded data and its summary
+        """
+        if source.startswith(("http://", "https://")):
+            validator = await asyncio.to_thread(DataLoader.get_api_validator, source)
+            if validator is None:
+                return await asyncio.to_thread(_read_source, source, format)
+            key = (source, validator, format)
+        else:
+            stats = await asyncio.to_thread(os.stat, source)
+            key = (source, stats.st_mtime_ns, stats.st_size, format)
+        
+        loaded = self._data_cache.get(key)
+        if loaded is not None and (loaded.data is not None or summary_only):
+            self._data_cache.move_to_end(key)
+            return loaded
+        
+        loaded = await asyncio.to_thread(_read_source, source, format, summary_only=summary_only)
+        self._data_cache[key] = loaded
+        if len(self._data_cache) > DATA_CACHE_SIZE:
+            self._data_cache.popitem(last=False)
+        return loaded
+    
     def register_resources(self):
         """Register MCP resources."""
         
@@ -168,45 +549,7 @@ class BiVisualizerServer:
             Returns:
                 List of MCP prompts
             """
-            return [
-                types.Prompt(
-                    name="create-dashboard",
-                    description="Create a BI dashboard from your data",
-                    arguments=[
-                        types.PromptArgument(
-                            name="data_source",
-                            description="Path or URL to your data",
-                            required=True
-                        ),
-                        types.PromptArgument(
-                            name="business_question",
-                            description="Business question to answer with visualizations",
-                            required=True
-                        )
-                    ]
-                ),
-                types.Prompt(
-                    name="analyze-trends",
-                    description="Analyze trends in time-series data",
-                    arguments=[
-                        types.PromptArgument(
-                            name="data_source",
-                            description="Path or URL to your data",
-                            required=True
-                        ),
-                        types.PromptArgument(
-                            name="time_column",
-                            description="Column containing time/date information",
-                            required=True
-                        ),
-                        types.PromptArgument(
-                            name="value_column",
-                            description="Column containing values to analyze",
-                            required=True
-                        )
-                    ]
-                )
-            ]
+            return PROMPTS
         
         @self.app.get_prompt()
         async def get_prompt(name: str, arguments: Optional[Dict[str, str]] = None) -> types.GetPromptResult:
@@ -220,46 +563,31 @@ class BiVisualizerServer:
             Returns:
                 Prompt result with messages
             """
-            if name == "create-dashboard":
-                data_source = arguments.get("data_source", "")
-                business_question = arguments.get("business_question", "")
-                
-                return types.GetPromptResult(
-                    messages=[
-                        types.Message(
-                            role="user",
-                            content=types.TextContent(
-                                type="text",
-                                text=f"I want to create a BI dashboard to answer this business question: '{business_question}'. "
-                                     f"Please help me analyze the data from {data_source} and create appropriate visualizations."
-                            )
-                        )
-                    ]
-                )
+            template = _PROMPT_TEMPLATES.get(name)
+            if template is None:
+                raise ValueError(f"Unknown prompt: {name}")
             
-            elif name == "analyze-trends":
-                data_source = arguments.get("data_source", "")
-                time_column = arguments.get("time_column", "")
-                value_column = arguments.get("value_column", "")
-                
-                return types.GetPromptResult(
-                    messages=[
-                        types.Message(
-                            role="user",
-                            content=types.TextContent(
-                                type="text",
-                                text=f"I want to analyze trends in my time-series data from {data_source}. "
-                                     f"Please analyze the '{time_column}' column as my time dimension and the '{value_column}' column as my values."
-                            )
-                        )
-                    ]
-                )
+            arguments = arguments or {}
+            text = template.format_map({arg: arguments.get(arg, "") for arg in _PROMPT_ARGUMENTS[name]})
             
-            raise ValueError(f"Unknown prompt: {name}")
+            return types.GetPromptResult(
+                messages=[
+                    types.Message(
+                        role="user",
+                        content=types.TextContent(
+                            type="text",
+                            text=text
+                        )
+                    )
+                ]
+            )
     
     def register_memo_tools(self):
         """Register Memo-related MCP tools."""
         
+        # Memo operations are in-memory and non-blocking, so they run on the
+        # event loop rather than in an executor
+        
         @self.app.tool()
         async def create_memo(content: str) -> Dict[str, Any]:
             """
@@ -328,12 +656,32 @@ class BiVisualizerServer:
     
     async def run(self):
         """Run the MCP server."""
-        async with stdio_server() as streams:
-            await self.app.run(
-                streams[0],
-                streams[1],
-                self.app.create_initialization_options()
-            )
+        # Compile the numba kernels while the client connects
+        warm_up = asyncio.get_running_loop().run_in_executor(None, DataProcessor.warm_up_kernels)
+        warm_up.add_done_callback(self._log_warm_up_failure)
+        try:
+            async with stdio_server() as streams:
+                await self.app.run(
+                    streams[0],
+                    streams[1],
+                    self.app.create_initialization_options()
+                )
+        finally:
+            # Don't exit with exported artifacts still queued
+            await self.resource_manager.flush()
+            await self.renderer.close()
+            self.resource_manager.close()
+
+    @staticmethod
+    def _log_warm_up_failure(future: asyncio.Future) -> None:
+        """
+        Log a failed kernel warm-up; the kernels then compile on first use
+        
+        Args:
+            future: Future of the warm-up run
+        """
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Could not compile numba kernels ahead of time: {str(future.exception())}")
 
 async def main():
     """Main entry point for the server."""
@@ -1,67 +1,360 @@
 import asyncio
+import base64
+import hashlib
 import subprocess
 import json
 import os
-import tempfile
 import logging
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Union
+
+try:
+    import vl_convert as vlc
+    HAS_VL_CONVERT = True
+except ImportError:
+    HAS_VL_CONVERT = False
+
+try:
+    import orjson
+    _SPEC_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Node script that keeps vega/vega-lite loaded between renders
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vega_worker.js")
+
+# vega-lite command-line converter per image format
+_CLI_COMMANDS = {
+    "png": "vl2png",
+    "svg": "vl2svg",
+    "pdf": "vl2pdf",
+}
+
+# Image formats the Node worker renders; others go to the command-line tools
+_WORKER_FORMATS = frozenset({"png", "svg"})
+
+# Number of rendered images kept for repeat renders of the same spec
+RENDER_CACHE_SIZE = 128
+
+# Largest response line (a base64-encoded image) accepted from the worker
+WORKER_LINE_LIMIT = 64 * 1024 * 1024
+
+def _encode_spec(payload: Dict[str, Any], canonical: bool = False) -> bytes:
+    """
+    Encode a specification (or a worker request holding one) as compact JSON
+    
+    Uses orjson when installed, which also serializes numpy values directly.
+    
+    Args:
+        payload: Object to encode
+        canonical: Whether to sort keys so equal specs encode identically
+        
+    Returns:
+        UTF-8 encoded JSON on a single line
+    """
+    if orjson is not None:
+        option = _SPEC_OPTIONS | orjson.OPT_SORT_KEYS if canonical else _SPEC_OPTIONS
+        return orjson.dumps(payload, default=str, option=option)
+    return json.dumps(payload, sort_keys=canonical, separators=(",", ":"), default=str).encode("utf-8")
+
+def _render_vl_convert(vega_spec: Dict[str, Any], format: str) -> bytes:
+    """
+    Render a Vega-Lite specification in-process with vl-convert
+    
+    Args:
+        vega_spec: Vega-Lite specification as a dictionary
+        format: Image format to produce ('png', 'svg' or 'pdf')
+        
+    Returns:
+        Binary image data as bytes
+    """
+    if format == "svg":
+        return vlc.vegalite_to_svg(vega_spec).encode("utf-8")
+    if format == "pdf":
+        return vlc.vegalite_to_pdf(vega_spec)
+    return vlc.vegalite_to_png(vega_spec)
+
+class _WorkerExited(Exception):
+    """The render worker exited before answering a request."""
+
 class VisualizationRenderer:
+    def __init__(self, worker_script: str = WORKER_SCRIPT, cache_size: int = RENDER_CACHE_SIZE):
+        """
+        Initialize the renderer; the Node worker starts on the first render.
+        
+        Args:
+            worker_script: Path to the Node render worker script
+            cache_size: Number of rendered images kept for repeat renders (0 disables caching)
+        """
+        self.worker_script = worker_script
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._lock = asyncio.Lock()
+        self._next_id = 0
+        self._worker_answered = False
+        self._worker_unavailable = False
+    
     async def render(self, vega_spec: Dict[str, Any], format: str = "png") -> bytes:
         """
-        Render a Vega-Lite specification to an image using a command-line tool.
+        Render a Vega-Lite specification to an image.
+        
+        Repeat renders of the same spec and format are served from an LRU
+        cache keyed by a hash of the canonical spec JSON.
         
         Args:
             vega_spec: Vega-Lite specification as a dictionary
             format: Image format to produce, e.g., 'png'
+        
+        Returns:
+            Binary image data as bytes
+        """
+        return (await self.render_batch([vega_spec], format))[0]
+    
+    async def render_batch(self, vega_specs: List[Dict[str, Any]], format: str = "png",
+                           return_exceptions: bool = False) -> List[Union[bytes, Exception]]:
+        """
+        Render several Vega-Lite specifications in one round trip.
+        
+        Specs that are not cached are rendered together: pipelined through a
+        single write to the Node worker, or concurrently with vl-convert or
+        the command-line tool. Identical specs are rendered once.
+        
+        Args:
+            vega_specs: Vega-Lite specifications as dictionaries
+            format: Image format to produce, e.g., 'png'
+            return_exceptions: Whether a failed render returns its exception
+                in place of the image instead of raising it
+        
+        Returns:
+            Binary image data per specification, in order
+        """
+        results: List[Any] = [None] * len(vega_specs)
+        misses: Dict[Any, List[int]] = {}
+        for i, vega_spec in enumerate(vega_specs):
+            if self.cache_size <= 0:
+                misses[i] = [i]
+                continue
+            canonical = _encode_spec(vega_spec, canonical=True)
+            key = f"{format}:{hashlib.blake2b(canonical, digest_size=16).hexdigest()}"
+            image_data = self._cache.get(key)
+            if image_data is not None:
+                self._cache.move_to_end(key)
+                logger.debug("Served Vega-Lite rendering from cache")
+                results[i] = image_data
+            else:
+                misses.setdefault(key, []).append(i)
+        
+        if misses:
+            keys = list(misses)
+            specs = [vega_specs[misses[key][0]] for key in keys]
+            try:
+                if len(specs) == 1:
+                    rendered: List[Any] = [await self._render(specs[0], format)]
+                else:
+                    rendered = await self._render_many(specs, format)
+            except Exception as e:
+                # e.g. the worker died mid-batch; every pending spec failed with it
+                rendered = [e] * len(specs)
             
+            for key, image_data in zip(keys, rendered):
+                if self.cache_size > 0 and not isinstance(image_data, Exception):
+                    self._cache[key] = image_data
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+                for i in misses[key]:
+                    results[i] = image_data
+        
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+    
+    async def _render(self, vega_spec: Dict[str, Any], format: str) -> bytes:
+        """
+        Render a Vega-Lite specification to an image, bypassing the cache.
+        
+        Args:
+            vega_spec: Vega-Lite specification as a dictionary
+            format: Image format to produce
+        
         Returns:
             Binary image data as bytes
         """
+        image_data = (await self._render_many([vega_spec], format))[0]
+        if isinstance(image_data, Exception):
+            raise image_data
+        return image_data
+    
+    async def _render_many(self, vega_specs: List[Dict[str, Any]], format: str) -> List[Union[bytes, Exception]]:
+        """
+        Render Vega-Lite specifications to images, bypassing the cache.
+        
+        Uses vl-convert in-process when it is installed. Otherwise PNG and SVG
+        renders go to a long-lived Node worker so vega and vega-lite are only
+        loaded once; PDFs, and every render when the worker cannot be
+        started, use the vega-lite command-line tools.
+        
+        Args:
+            vega_specs: Vega-Lite specifications as dictionaries
+            format: Image format to produce
+        
+        Returns:
+            Binary image data, or the exception of a failed render, per specification
+        """
+        if HAS_VL_CONVERT and format in _CLI_COMMANDS:
+            results = await asyncio.gather(
+                *(asyncio.to_thread(_render_vl_convert, vega_spec, format) for vega_spec in vega_specs),
+                return_exceptions=True
+            )
+            logger.info(f"Rendered {len(vega_specs)} Vega-Lite specs with vl-convert")
+            return results
+        
+        if format in _WORKER_FORMATS and not self._worker_unavailable:
+            async with self._lock:
+                proc = await self._ensure_worker()
+                if proc is not None:
+                    try:
+                        return await self._render_worker(proc, vega_specs, format)
+                    except _WorkerExited:
+                        self._proc = None
+                        if not self._worker_answered:
+                            # e.g. vega is not installed where Node can find it
+                            logger.warning("Render worker failed to start, using vl2png")
+                            self._worker_unavailable = True
+                        else:
+                            raise RuntimeError("Render worker exited unexpectedly.")
+        
+        return await asyncio.gather(
+            *(self._render_cli(vega_spec, format) for vega_spec in vega_specs),
+            return_exceptions=True
+        )
+    
+    async def close(self) -> None:
+        """Stop the Node worker."""
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        proc.stdin.close()
         try:
-            # Write spec to a temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as spec_file:
-                json.dump(vega_spec, spec_file)
-                spec_file.flush()
-                spec_path = spec_file.name
-            
-            # Prepare output image path
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{format}") as out_file:
-                out_path = out_file.name
-            
-            # Use vega-lite CLI (ensure vega-lite or vega-cli is installed)
-            cmd = [
-                "npx", 
-                "vl2png",  # provided by vega-lite-cli
-                spec_path,
-                "--output", 
-                out_path
-            ]
-            
-            logger.info(f"Running command: {' '.join(cmd)}")
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+    
+    async def _ensure_worker(self) -> Optional[asyncio.subprocess.Process]:
+        """
+        Start the Node worker if it is not running.
+        
+        Returns:
+            The worker process, or None if Node is not available
+        """
+        if self._proc is not None and self._proc.returncode is None:
+            return self._proc
+        
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                "node", self.worker_script,
+                stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                limit=WORKER_LINE_LIMIT
             )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode != 0:
-                logger.error(f"Renderer error: {stderr.decode('utf-8', errors='ignore')}")
-                raise RuntimeError("Rendering process failed.")
-            
-            # Read output file data
-            with open(out_path, "rb") as img_file:
-                image_data = img_file.read()
-            
-            logger.info("Vega-Lite rendering completed successfully.")
-            return image_data
-        
-        finally:
-            # Clean up temp files
-            if os.path.exists(spec_path):
-                os.remove(spec_path)
-            if os.path.exists(out_path):
-                os.remove(out_path)
\ No newline at end of file
+        except OSError as e:
+            logger.warning(f"Render worker unavailable, using vl2png: {str(e)}")
+            self._worker_unavailable = True
+            self._proc = None
+            return None
+        
+        self._worker_answered = False
+        logger.info(f"Started render worker (pid {self._proc.pid})")
+        return self._proc
+    
+    async def _render_worker(self, proc: asyncio.subprocess.Process,
+                             vega_specs: List[Dict[str, Any]], format: str) -> List[Union[bytes, Exception]]:
+        """
+        Render specifications on the Node worker.
+        
+        All requests are written at once; the worker renders them
+        concurrently and answers each as it finishes.
+        
+        Args:
+            proc: The worker process
+            vega_specs: Vega-Lite specifications as dictionaries
+            format: Image format to produce
+        
+        Returns:
+            Binary image data, or the exception of a failed render, per specification
+        """
+        first_id = self._next_id + 1
+        self._next_id += len(vega_specs)
+        request_ids = range(first_id, self._next_id + 1)
+        try:
+            proc.stdin.write(b"".join(
+                _encode_spec({"id": request_id, "spec": vega_spec, "format": format}) + b"\n"
+                for request_id, vega_spec in zip(request_ids, vega_specs)
+            ))
+            await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            raise _WorkerExited()
+        
+        responses: Dict[int, Dict[str, Any]] = {}
+        while len(responses) < len(vega_specs):
+            line = await proc.stdout.readline()
+            if not line:
+                raise _WorkerExited()
+            self._worker_answered = True
+            response = _json_loads(line)
+            # Skip answers to earlier requests whose callers were cancelled
+            if response.get("id") in request_ids:
+                responses[response["id"]] = response
+        
+        results: List[Union[bytes, Exception]] = []
+        for request_id in request_ids:
+            response = responses[request_id]
+            if "error" in response:
+                logger.error(f"Renderer error: {response['error']}")
+                results.append(RuntimeError("Rendering process failed."))
+            else:
+                results.append(base64.b64decode(response["data"]))
+        
+        logger.info(f"Rendered {len(vega_specs)} Vega-Lite specs on the render worker")
+        return results
+    
+    async def _render_cli(self, vega_spec: Dict[str, Any], format: str = "png") -> bytes:
+        """
+        Render a Vega-Lite specification to an image using a command-line tool.
+        
+        The spec is piped to the tool's stdin and the image read from its
+        stdout, so no temporary files are involved.
+        
+        Args:
+            vega_spec: Vega-Lite specification as a dictionary
+            format: Image format to produce, e.g., 'png'
+        
+        Returns:
+            Binary image data as bytes
+        """
+        # Use vega-lite CLI (ensure vega-lite or vega-cli is installed); with no
+        # file arguments it reads stdin and writes stdout
+        cmd = ["npx", _CLI_COMMANDS.get(format, "vl2png")]
+        
+        logger.info(f"Running command: {' '.join(cmd)}")
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        image_data, stderr = await process.communicate(input=_encode_spec(vega_spec))
+        
+        if process.returncode != 0:
+            logger.error(f"Renderer error: {stderr.decode('utf-8', errors='ignore')}")
+            raise RuntimeError("Rendering process failed.")
+        
+        logger.info("Vega-Lite rendering completed successfully.")
+        return image_data
@@ -1,10 +1,27 @@
+import re
 from typing import Any, Dict, List, Optional
 
+# ISO dates as written by DataProcessor.prepare_for_visualization
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?")
+
 class VegaLiteGenerator:
     """
     Generates Vega-Lite specifications for different types of visualizations.
     """
     
+    # Fixed part of every specification; "config" holds the defaults of the
+    # options of the same name
+    _BASE_SPEC = {"$schema": "https://vega.github.io/schema/vega-lite/v5.json"}
+    _DEFAULT_CONFIG = {"background": "white", "font": "Arial"}
+    
+    # Chart type -> name of the method that builds its mark and encoding
+    _CHART_BUILDERS = {
+        'bar': '_create_bar_chart',
+        'line': '_create_line_chart',
+        'scatter': '_create_scatter_chart',
+        'pie': '_create_pie_chart',
+    }
+    
     def create_chart(
         self, 
         chart_type: str, 
@@ -18,7 +35,9 @@ class VegaLiteGenerator:
         
         Args:
             chart_type: Type of chart (bar, line, scatter, pie, etc.)
-            data: Processed data ready for visualization
+            data: Processed data ready for visualization; either inline rows
+                ({"values": [...]}) or a reference to a data file
+                ({"url": ..., "format": {...}})
             x_axis: Column to use for x-axis
             y_axis: Column to use for y-axis
             options: Additional visualization options
@@ -26,35 +45,114 @@ class VegaLiteGenerator:
         Returns:
             Vega-Lite specification as a dictionary
         """
+        builder = self._CHART_BUILDERS.get(chart_type.lower())
+        if builder is None:
+            raise ValueError(f"Unsupported chart type: {chart_type}")
         options = options or {}
         
-        # Basic Vega-Lite template
+        # Reference externally stored data instead of embedding the rows
+        if 'url' in data:
+            spec_data = {"url": data['url'], "format": data.get('format', {"type": "csv"})}
+        else:
+            spec_data = {"values": data['values']}
+        
+        # Basic Vega-Lite template; config is copied so specs never share it
+        config = self._DEFAULT_CONFIG.copy()
+        config.update((key, options[key]) for key in self._DEFAULT_CONFIG if key in options)
         spec = {
-            "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
-            "data": {
-                "values": data['values']
-            },
+            **self._BASE_SPEC,
+            "data": spec_data,
             "width": options.get('width', 600),
             "height": options.get('height', 400),
             "title": options.get('title', f"{y_axis} by {x_axis}"),
-            "config": {
-                "background": options.get('background', "white"),
-                "font": options.get('font', "Arial"),
-            }
+            "config": config
         }
         
         # Add chart-specific encoding
-        if chart_type.lower() == 'bar':
-            spec.update(self._create_bar_chart(data, x_axis, y_axis, options))
-        elif chart_type.lower() == 'line':
-            spec.update(self._create_line_chart(data, x_axis, y_axis, options))
-        elif chart_type.lower() == 'scatter':
-            spec.update(self._create_scatter_chart(data, x_axis, y_axis, options))
-        elif chart_type.lower() == 'pie':
-            spec.update(self._create_pie_chart(data, x_axis, y_axis, options))
-        else:
-            raise ValueError(f"Unsupported chart type: {chart_type}")
+        spec.update(getattr(self, builder)(data, x_axis, y_axis, options))
         
         return spec
     
-    # Chart generation methods omitted for brevity...
+    @staticmethod
+    def _field_type(data: Dict[str, Any], field: str, default: str) -> str:
+        """
+        Infer the Vega-Lite type of a field from the first inline value
+        
+        Args:
+            data: Chart data as passed to create_chart
+            field: Field name
+            default: Type used when the data is referenced by URL or the
+                field has no values
+            
+        Returns:
+            'quantitative', 'temporal' or 'nominal'
+        """
+        for row in data.get('values') or []:
+            value = row.get(field)
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                return "nominal"
+            if isinstance(value, (int, float)):
+                return "quantitative"
+            if isinstance(value, str) and _ISO_DATE.match(value):
+                return "temporal"
+            return "nominal"
+        return default
+    
+    def _axis_encoding(self, data: Dict[str, Any], x_axis: str, y_axis: str,
+                       options: Dict[str, Any], x_default: str) -> Dict[str, Any]:
+        """
+        Encoding of the x and y fields; options x_type / y_type override the inferred types
+        
+        Args:
+            data: Chart data as passed to create_chart
+            x_axis: Column to use for x-axis
+            y_axis: Column to use for y-axis
+            options: Visualization options
+            x_default: Type of x_axis when it cannot be inferred
+            
+        Returns:
+            Vega-Lite encoding
+        """
+        return {
+            "x": {"field": x_axis, "type": options.get('x_type') or self._field_type(data, x_axis, x_default)},
+            "y": {"field": y_axis, "type": options.get('y_type') or self._field_type(data, y_axis, "quantitative")},
+            "tooltip": [{"field": x_axis}, {"field": y_axis}]
+        }
+    
+    def _create_bar_chart(self, data: Dict[str, Any], x_axis: str, y_axis: str,
+                          options: Dict[str, Any]) -> Dict[str, Any]:
+        """Mark and encoding of a bar chart; options: color"""
+        return {
+            "mark": {"type": "bar", "color": options.get('color', "#4c78a8")},
+            "encoding": self._axis_encoding(data, x_axis, y_axis, options, "nominal")
+        }
+    
+    def _create_line_chart(self, data: Dict[str, Any], x_axis: str, y_axis: str,
+                           options: Dict[str, Any]) -> Dict[str, Any]:
+        """Mark and encoding of a line chart; options: color, point"""
+        return {
+            "mark": {"type": "line", "color": options.get('color', "#4c78a8"), "point": options.get('point', False)},
+            "encoding": self._axis_encoding(data, x_axis, y_axis, options, "ordinal")
+        }
+    
+    def _create_scatter_chart(self, data: Dict[str, Any], x_axis: str, y_axis: str,
+                              options: Dict[str, Any]) -> Dict[str, Any]:
+        """Mark and encoding of a scatter plot; options: color, size"""
+        return {
+            "mark": {"type": "point", "color": options.get('color', "#4c78a8"), "size": options.get('size', 30)},
+            "encoding": self._axis_encoding(data, x_axis, y_axis, options, "quantitative")
+        }
+    
+    def _create_pie_chart(self, data: Dict[str, Any], x_axis: str, y_axis: str,
+                          options: Dict[str, Any]) -> Dict[str, Any]:
+        """Mark and encoding of a pie chart: one slice per x_axis value sized by y_axis"""
+        return {
+            "mark": {"type": "arc", "innerRadius": options.get('inner_radius', 0)},
+            "encoding": {
+                "theta": {"field": y_axis, "type": "quantitative"},
+                "color": {"field": x_axis, "type": "nominal"},
+                "tooltip": [{"field": x_axis}, {"field": y_axis}]
+            }
+        }
@@ -0,0 +1,52 @@
+// Long-lived Vega-Lite render worker for VisualizationRenderer.
+// Loads vega and vega-lite once, then renders one request per stdin line:
+//   {"id": 1, "spec": {...}, "format": "png" | "svg"}
+// and answers with one stdout line per request:
+//   {"id": 1, "data": "<base64 image>"} or {"id": 1, "error": "..."}
+"use strict";
+
+const readline = require("readline");
+
+// Resolve modules from the server's working directory as well as global paths
+function load(name) {
+  return require(require.resolve(name, { paths: [process.cwd(), __dirname] }));
+}
+
+const vega = load("vega");
+const vegaLite = load("vega-lite");
+
+async function render(spec, format) {
+  if (format !== "png" && format !== "svg") {
+    throw new Error(`Unsupported format: ${format}`);
+  }
+  const view = new vega.View(vega.parse(vegaLite.compile(spec).spec), { renderer: "none" });
+  try {
+    if (format === "svg") {
+      return Buffer.from(await view.toSVG(), "utf8");
+    }
+    const canvas = await view.toCanvas();
+    return canvas.toBuffer("image/png");
+  } finally {
+    view.finalize();
+  }
+}
+
+const lines = readline.createInterface({ input: process.stdin });
+
+lines.on("line", async (line) => {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (err) {
+    process.stdout.write(JSON.stringify({ id: null, error: `Invalid request: ${err.message}` }) + "\n");
+    return;
+  }
+  try {
+    const image = await render(request.spec, request.format || "png");
+    process.stdout.write(JSON.stringify({ id: request.id, data: image.toString("base64") }) + "\n");
+  } catch (err) {
+    process.stdout.write(JSON.stringify({ id: request.id, error: String(err && err.message || err) }) + "\n");
+  }
+});
+
+lines.on("close", () => process.exit(0));
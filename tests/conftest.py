@@ -0,0 +1,11 @@
+import pytest_asyncio
+from mcp_bi_visualizer.server import BiVisualizerServer
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def server(tmp_path_factory):
+    # One server for the whole session; starting it dominates test time
+    server = BiVisualizerServer(storage_dir=str(tmp_path_factory.mktemp("storage")))
+    await server.app.start()
+    yield server
+    await server.app.stop()
+    server.resource_manager.close()
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+from mcp_bi_visualizer.data.loader import DataLoader
+
+def test_compress_downcasts_numeric_columns():
+    df = pd.DataFrame({
+        "small": [1, 2, 3, 4],
+        "unsigned": [0, 200, 100, 50],
+        "wide": [-70000, 0, 5, 7],
+        "exact": [0.5, 1.5, np.nan, 2.0],
+        "inexact": [0.1, 0.2, 0.3, 0.4]
+    })
+
+    result = DataLoader._compress(df)
+
+    assert result["small"].dtype == np.int8
+    assert result["unsigned"].dtype == np.uint8
+    assert result["wide"].dtype == np.int32
+    assert result["exact"].dtype == np.float32
+    assert result["inexact"].dtype == np.float64
+
+def test_compress_converts_low_cardinality_strings():
+    df = pd.DataFrame({
+        "region": ["north", "south", "north", "north", "north"],
+        "id": ["a", "b", "c", "d", "e"]
+    })
+
+    result = DataLoader._compress(df)
+
+    assert isinstance(result["region"].dtype, pd.CategoricalDtype)
+    assert not isinstance(result["id"].dtype, pd.CategoricalDtype)
+
+def test_json_path_supports_indexes_and_wildcards():
+    doc = {"pages": [{"rows": [{"a": 1}, {"a": 2}]}, {"rows": [{"a": 3}]}]}
+
+    first_page = DataLoader._extract_json_path(doc, DataLoader._compile_json_path("pages.0.rows"))
+    all_rows = DataLoader._extract_json_path(doc, DataLoader._compile_json_path("pages.[*].rows"))
+
+    assert first_page == [{"a": 1}, {"a": 2}]
+    assert all_rows == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+def test_preview_csv_counts_rows_without_loading(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id,name\n" + "".join(f"{i},n{i}\n" for i in range(1000)) + "last,row\n")
+
+    row_count, preview = DataLoader.preview_csv(str(path), preview_rows=3)
+
+    assert row_count == 1001
+    assert list(preview.columns) == ["id", "name"]
+    assert preview["id"].tolist() == [0, 1, 2]
+
+    unnamed = tmp_path / "unnamed.csv"
+    unnamed.write_text(",value\n0,a\n1,b\n")
+    row_count, preview = DataLoader.preview_csv(str(unnamed))
+    assert row_count == 2
+    assert list(preview.columns) == ["Unnamed: 0", "value"]
+
+def test_default_csv_load_matches_pandas_reader(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b,c,d\n1,,2024-01-01,x\n2,y,2024-01-02,\n")
+
+    df, _ = DataLoader.load_from_csv(str(path), compress=False)
+    expected = pd.read_csv(path, dtype_backend="pyarrow")
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert df["b"].isna().tolist() == [True, False]
+
+def test_default_csv_load_supports_later_transformations(tmp_path):
+    from mcp_bi_visualizer.data.processor import DataProcessor
+
+    path = tmp_path / "sales.csv"
+    path.write_text("city,sales\nParis,1\nRome,2\n,3\n")
+
+    df, metadata = DataLoader.load_from_csv(str(path))
+    expected = pd.read_csv(path)
+
+    assert metadata["compressed"] is False
+    scaled = DataProcessor.transform_columns(df, {"sales": [
+        {"type": "math", "params": {"operation": "multiply", "value": 100}},
+        {"type": "math", "params": {"operation": "add", "value": 200}}
+    ]})
+    assert scaled["sales"].tolist() == (expected["sales"] * 100 + 200).tolist()
+    logged = DataProcessor.transform_columns(df, {"sales": {"type": "math", "params": {"operation": "log"}}})
+    np.testing.assert_allclose(logged["sales"].to_numpy(dtype=float), np.log(expected["sales"]), rtol=1e-12)
+
+    filled = DataProcessor.clean_data(df, fill_na={"city": "Unknown"})
+    assert filled["city"].tolist() == expected["city"].fillna("Unknown").tolist()
+    replaced = DataProcessor.transform_columns(df, {"city": {"type": "replace", "params": {"to_replace": "Rome", "value": "Roma"}}})
+    assert replaced["city"].tolist()[:2] == ["Paris", "Roma"]
@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+import pytest
+from mcp_bi_visualizer.data.processor import DataProcessor
+
+def test_filter_data_combines_conditions():
+    df = pd.DataFrame({
+        "value": [1, 2, 3, 4, None],
+        "label": ["x", "y", "xy", "z", None]
+    })
+
+    result = DataProcessor.filter_data(df, [
+        {"column": "value", "operator": ">", "value": 1},
+        {"column": "label", "operator": "contains", "value": "y"},
+        {"column": "missing", "operator": "=", "value": 1}
+    ])
+
+    assert result.index.tolist() == [1, 2]
+
+def test_filter_data_treats_missing_values_as_no_match():
+    df = pd.DataFrame({"value": [1, None, 3]}).convert_dtypes(dtype_backend="pyarrow")
+
+    result = DataProcessor.filter_data(df, [{"column": "value", "operator": "between", "value": [1, 3]}])
+
+    assert result["value"].tolist() == [1, 3]
+
+def test_clean_data_optimizes_dtypes():
+    df = pd.DataFrame({
+        "count": [1, 2, 3, 4, 5],
+        "ratio": [0.5, 0.25, 1.0, 2.0, 4.0],
+        "price": [0.1, 0.2, 0.3, 0.4, 0.5],
+        "region": ["north", "south", "north", "north", "north"]
+    })
+
+    result = DataProcessor.clean_data(df, optimize_dtypes=True)
+
+    assert result["count"].dtype == np.int8
+    assert result["ratio"].dtype == np.float32
+    assert result["price"].dtype == np.float64
+    assert isinstance(result["region"].dtype, pd.CategoricalDtype)
+    assert df["count"].dtype == np.int64
+
+def test_join_data_on_string_keys_matches_plain_merge():
+    left = pd.DataFrame({"id": ["a", "b", "c", None], "v": [1, 2, 3, 4]})
+    right = pd.DataFrame({"id": ["c", "a", "d", None], "w": [10, 20, 30, 40]})
+
+    result = DataProcessor.join_data(left, right, "id", "id", join_type="left")
+
+    pd.testing.assert_frame_equal(result, pd.merge(left, right, on="id", how="left"))
+
+def test_aggregate_data_chunked_matches_single_pass():
+    df = pd.DataFrame({
+        "region": ["n", "s", "n", "e", "s", "n", "e"],
+        "sales": [1, 2, 3, 4, 5, 6, 7],
+        "price": [1.0, 2.0, np.nan, 4.0, 5.0, 6.0, 7.5]
+    })
+    aggregations = {"sales": "sum", "price": "mean"}
+
+    result = DataProcessor.aggregate_data(df, "region", aggregations, chunksize=3)
+
+    pd.testing.assert_frame_equal(result, DataProcessor.aggregate_data(df, "region", aggregations))
+
+def test_clean_data_chunked_drop_duplicates():
+    df = pd.DataFrame({"a": [1, 2, 1, 3, 2, 1], "b": ["x", "y", "x", "z", "w", "x"]})
+
+    result = DataProcessor.clean_data(df, drop_duplicates=True, chunksize=2)
+
+    pd.testing.assert_frame_equal(result, df.drop_duplicates())
+
+def test_join_data_on_sorted_keys_matches_plain_merge():
+    left = pd.DataFrame({"day": [1, 2, 3, 5, 8], "v": [10, 20, 30, 50, 80]})
+    right = pd.DataFrame({"day": [2, 3, 4, 5], "v": [0.2, 0.3, 0.4, 0.5]})
+
+    for join_type in ("inner", "left"):
+        result = DataProcessor.join_data(left, right, "day", "day", join_type=join_type)
+
+        pd.testing.assert_frame_equal(result, pd.merge(left, right, on="day", how=join_type))
+
+def test_transform_columns_bin_matches_pd_cut():
+    df = pd.DataFrame({"score": [1.0, 4.5, np.nan, 7.0, 10.0, -3.0]})
+
+    for params in ({"bins": 3}, {"bins": [0, 5, 10], "labels": ["low", "high"]}):
+        result = DataProcessor.transform_columns(df, {"score": {"type": "bin", "params": params}})
+
+        expected = pd.cut(df["score"], bins=params["bins"], labels=params.get("labels"))
+        pd.testing.assert_series_equal(result["score"], expected)
+
+def test_compiled_aggregation_matches_pandas():
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "key": rng.choice(["a", "b", "c", None], 200_000),
+        "count": rng.integers(-5, 5, 200_000).astype(np.int16),
+        "small": rng.integers(100, 128, 200_000).astype(np.int8),
+        "amount": np.where(rng.random(200_000) < 0.3, np.nan, rng.random(200_000))
+    })
+
+    for func in ["sum", "mean", "count", "min", "max"]:
+        aggregations = {"count": func, "small": func, "amount": func}
+        result = DataProcessor._aggregate_numba(df, ["key"], aggregations)
+        expected = df.groupby("key", sort=False).agg(
+            **{col: pd.NamedAgg(column=col, aggfunc=func) for col in aggregations}
+        ).reset_index()
+        pd.testing.assert_frame_equal(result, expected, check_dtype=True, rtol=1e-9)
+
+def test_prepare_for_visualization_filters_aggregates_and_sorts():
+    df = pd.DataFrame({
+        "region": ["n", "s", "n", "e", "s"],
+        "sales": [1.0, 2.0, 3.0, None, 5.0],
+        "day": pd.to_datetime(["2024-01-01"] * 5)
+    })
+
+    result = DataProcessor.prepare_for_visualization(df, "region", "sales", {
+        "filters": [{"column": "region", "operator": "!=", "value": "e"}],
+        "aggregate": "sum",
+        "sort_by": "sales",
+        "ascending": False,
+        "limit": 1
+    })
+    assert result == {"values": [{"region": "s", "sales": 7.0}]}
+
+    result = DataProcessor.prepare_for_visualization(df.head(4), "day", "sales")
+    assert result["values"][0] == {"day": "2024-01-01T00:00:00.000", "sales": 1.0}
+    assert result["values"][3]["sales"] is None
+
+def test_extract_transform_works_on_arrow_strings():
+    df = pd.DataFrame({"code": ["a12", "b3", None]}).convert_dtypes(dtype_backend="pyarrow")
+
+    result = DataProcessor.transform_columns(df, {"code": [
+        {"type": "string", "params": {"operation": "extract", "pattern": r"(\d+)"}}
+    ]})
+
+    assert result["code"].tolist()[:2] == ["12", "3"]
+    assert result["code"].isna().tolist() == [False, False, True]
+
+def test_transform_columns_keeps_arrow_numeric_columns_arrow_backed():
+    df = pd.DataFrame({"value": [1, 5, 10, 20], "score": [0.5, 1.5, 2.5, 3.5]}).convert_dtypes(dtype_backend="pyarrow")
+
+    result = DataProcessor.transform_columns(df, {
+        "value": {"type": "bin", "params": {"bins": 2}},
+        "score": {"type": "math", "params": {"operation": "multiply", "value": 2}}
+    })
+
+    assert result["value"].astype(str).tolist() == pd.cut(df["value"], bins=2).astype(str).tolist()
+    assert result["score"].dtype == df["score"].dtype
+    assert result["score"].tolist() == [1.0, 3.0, 5.0, 7.0]
+
+def test_prepare_for_visualization_aggregates_with_compiled_kernel(monkeypatch):
+    from mcp_bi_visualizer.data import processor
+
+    calls = []
+    def aggregate_numba(df, group_by, aggregations, sort=False):
+        calls.append((group_by, aggregations))
+        return None
+
+    monkeypatch.setattr(processor, "HAS_NUMBA", True)
+    monkeypatch.setattr(processor, "NUMBA_MIN_ROWS", 1)
+    monkeypatch.setattr(DataProcessor, "_aggregate_numba", staticmethod(aggregate_numba))
+    df = pd.DataFrame({"region": ["n", "s", "n"], "sales": [1, 2, 3]})
+
+    result = DataProcessor.prepare_for_visualization(df, "region", "sales", {"aggregate": "sum"})
+
+    assert calls == [(["region"], {"sales": "sum"})]
+    assert result == {"values": [{"region": "n", "sales": 4}, {"region": "s", "sales": 2}]}
+
+def test_math_transforms_widen_narrow_integer_columns():
+    df = pd.DataFrame({"value": np.array([1, 2, 3], dtype=np.int8)})
+    expected = df["value"].astype(np.int64)
+
+    for operation, value, expected_values in [
+        ("multiply", 100, expected * 100),
+        ("add", 200, expected + 200),
+        ("log", None, np.log(expected.astype(np.float64))),
+        ("exp", None, np.exp(expected.astype(np.float64))),
+    ]:
+        result = DataProcessor.transform_columns(df, {"value": {"type": "math", "params": {"operation": operation, "value": value}}})
+        pd.testing.assert_series_equal(result["value"], expected_values.rename("value"))
+
+def test_aggregate_data_accepts_avg_on_every_path():
+    df = pd.DataFrame({"region": ["n", "s", "n", "s"], "sales": [1.0, 2.0, 3.0, 6.0]})
+    expected = df.groupby("region", sort=False).agg(sales=("sales", "mean")).reset_index()
+
+    single = DataProcessor.aggregate_data(df, "region", {"sales": "avg"})
+    chunked = DataProcessor.aggregate_data(df, "region", {"sales": "avg"}, chunksize=3)
+
+    pd.testing.assert_frame_equal(single, expected)
+    pd.testing.assert_frame_equal(chunked, expected)
+
+def test_in_filter_with_many_values_matches_isin():
+    df = pd.DataFrame({
+        "code": pd.array(["k1", "k5", None, "x", "k1499"], dtype="string[pyarrow]"),
+        "value": [1.0, np.nan, 3.0, 1500.0, 7.0]
+    })
+    codes = [f"k{i}" for i in range(1500)] + [None]
+    values = list(range(1500)) + [np.nan]
+
+    for column, wanted in [("code", codes), ("value", values)]:
+        result = DataProcessor.filter_data(df, [{"column": column, "operator": "in", "value": wanted}])
+        pd.testing.assert_frame_equal(result, df[df[column].isin(wanted).fillna(False).astype(bool)])
+
+def test_datetime_transform_matches_pandas_inference():
+    us_dates = pd.Series(["03/15/2024", None, "12/01/2023"])
+    iso_then_times = pd.Series(["2024-01-01"] * 150 + ["2024-05-01 10:30:00"])
+
+    for series, expected in [
+        (us_dates, pd.to_datetime(us_dates)),
+        (iso_then_times, pd.to_datetime(iso_then_times, format="mixed")),
+    ]:
+        result = DataProcessor.transform_columns(pd.DataFrame({"day": series}), {"day": {"type": "datetime_format"}})
+        pd.testing.assert_series_equal(result["day"], expected.rename("day"))
+
+def test_shared_transformations_match_per_column_pandas():
+    df = pd.DataFrame({
+        "a": ["1", "x", "3"], "b": ["4", "5", None],
+        "c": ["n", "s", "n"], "d": ["e", "e", None],
+        "e": [1, 2, 3], "f": [0.5, 1.5, np.nan]
+    })
+    numeric = {"type": "numeric"}
+    categorical = {"type": "categorical", "params": {"categories": ["n", "s", "e"]}}
+    multiply = {"type": "math", "params": {"operation": "multiply", "value": 3}}
+
+    result = DataProcessor.transform_columns(df, {
+        "a": numeric, "b": numeric, "c": categorical, "d": categorical, "e": multiply, "f": multiply
+    })
+
+    for col in ["a", "b"]:
+        pd.testing.assert_series_equal(result[col], pd.to_numeric(df[col], errors="coerce"))
+    for col in ["c", "d"]:
+        pd.testing.assert_series_equal(result[col], df[col].astype(pd.CategoricalDtype(["n", "s", "e"])))
+    for col in ["e", "f"]:
+        pd.testing.assert_series_equal(result[col], df[col] * 3)
+
+def test_pivot_count_first_and_last_match_pandas():
+    df = pd.DataFrame({
+        "region": ["n", "n", "n", "s", "s"],
+        "month": ["jan", "jan", "jan", "jan", "feb"],
+        "sales": [np.nan, 2.0, np.nan, 4.0, 5.0]
+    })
+
+    for aggfunc, expected_aggfunc in [("count", len), ("first", "first"), ("last", "last")]:
+        result = DataProcessor.pivot_data(df, "region", "month", "sales", aggfunc=aggfunc)
+        expected = pd.pivot_table(df, index="region", columns="month", values="sales",
+                                  aggfunc=expected_aggfunc).reset_index()
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    assert DataProcessor.pivot_data(df, "region", "month", "sales", aggfunc="first").loc[0, "jan"] == 2.0
@@ -0,0 +1,85 @@
+import asyncio
+from mcp_bi_visualizer.visualization.renderer import VisualizationRenderer
+
+class CountingRenderer(VisualizationRenderer):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    async def _render(self, vega_spec, format):
+        self.calls += 1
+        return f"{format}:{self.calls}".encode()
+
+def test_render_caches_by_canonical_spec_and_format():
+    renderer = CountingRenderer(cache_size=2)
+
+    async def render_all():
+        return [
+            await renderer.render({"mark": "bar", "width": 100}),
+            await renderer.render({"width": 100, "mark": "bar"}),
+            await renderer.render({"mark": "bar", "width": 100}, format="svg"),
+            await renderer.render({"mark": "line"}),
+            await renderer.render({"mark": "bar", "width": 100}),
+        ]
+
+    results = asyncio.run(render_all())
+
+    assert results == [b"png:1", b"png:1", b"svg:2", b"png:3", b"png:4"]
+
+class BatchRenderer(VisualizationRenderer):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    async def _render_many(self, vega_specs, format):
+        self.batches.append(len(vega_specs))
+        return [
+            RuntimeError("Rendering process failed.") if spec.get("mark") == "bad" else spec["mark"].encode()
+            for spec in vega_specs
+        ]
+
+def test_render_batch_renders_distinct_uncached_specs_together():
+    renderer = BatchRenderer()
+
+    async def render_all():
+        first = await renderer.render_batch(
+            [{"mark": "bar"}, {"mark": "line"}, {"mark": "bar"}, {"mark": "bad"}], return_exceptions=True
+        )
+        second = await renderer.render_batch([{"mark": "line"}, {"mark": "area"}, {"mark": "pie"}])
+        return first, second
+
+    first, second = asyncio.run(render_all())
+
+    assert first[:3] == [b"bar", b"line", b"bar"]
+    assert isinstance(first[3], RuntimeError)
+    assert second == [b"line", b"area", b"pie"]
+    assert renderer.batches == [3, 2]
+
+class CliRenderer(VisualizationRenderer):
+    async def _ensure_worker(self):
+        raise AssertionError("PDF renders must not go to the Node worker")
+
+    async def _render_cli(self, vega_spec, format="png"):
+        return f"{format}:{vega_spec['mark']}".encode()
+
+def test_pdf_renders_use_the_command_line_tool(monkeypatch):
+    from mcp_bi_visualizer.visualization import renderer as renderer_module
+
+    monkeypatch.setattr(renderer_module, "HAS_VL_CONVERT", False)
+    renderer = CliRenderer()
+
+    results = asyncio.run(renderer.render_batch([{"mark": "bar"}, {"mark": "line"}], format="pdf"))
+
+    assert results == [b"pdf:bar", b"pdf:line"]
+
+class CrashingRenderer(VisualizationRenderer):
+    async def _render_many(self, vega_specs, format):
+        raise RuntimeError("Render worker exited unexpectedly.")
+
+def test_render_batch_reports_a_worker_crash_for_every_spec():
+    renderer = CrashingRenderer()
+
+    results = asyncio.run(renderer.render_batch([{"mark": "bar"}, {"mark": "line"}], return_exceptions=True))
+
+    assert [str(result) for result in results] == ["Render worker exited unexpectedly."] * 2
+    assert not renderer._cache
@@ -0,0 +1,268 @@
+import asyncio
+import base64
+import gzip
+import io
+import json
+import os
+import pandas as pd
+import pytest
+from mcp_bi_visualizer.resources.manager import ResourceManager
+
+def test_export_visualization_config_writes_json(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    viz_id = manager.register_visualization("ds", "bar", {"mark": "bar"}, "chart.png")
+
+    async def export():
+        paths = await asyncio.gather(*[manager.export_visualization_config_async(viz_id) for _ in range(3)])
+        await manager.flush()
+        return paths
+
+    paths = asyncio.run(export())
+
+    with open(paths[0]) as f:
+        exported = json.load(f)
+    assert exported["id"] == viz_id
+    assert exported["config"] == {"mark": "bar"}
+    assert asyncio.run(manager.export_visualization_config_async("missing")) is None
+
+    path = manager.export_visualization_config(viz_id, str(tmp_path / "config.json"))
+    with open(path) as f:
+        assert json.load(f) == exported
+    assert manager.export_visualization_config("missing") is None
+
+def test_list_views_track_registrations(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    conn_id = manager.register_connection("database", {"host": "db", "password": "secret"})
+    manager.update_connection_status(conn_id, "connected")
+    viz_a = manager.register_visualization("ds1", "bar", {}, "a.png")
+    manager.register_visualization("ds2", "line", {}, "b.png")
+    viz_c = manager.register_visualization("ds1", "pie", {}, "c.png")
+
+    [conn] = manager.list_connections()
+    assert conn["params"] == {"host": "db", "password": "********"}
+    assert conn["status"] == "connected"
+    assert [v["id"] for v in manager.list_visualizations("ds1")] == [viz_a, viz_c]
+    assert manager.list_visualizations("missing") == []
+
+def test_delete_visualization_updates_dataset_index(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    viz_a = manager.register_visualization("ds1", "bar", {}, "a.png")
+    viz_b = manager.register_visualization("ds1", "pie", {}, "b.png")
+
+    assert manager.delete_visualization(viz_a)
+    assert not manager.delete_visualization(viz_a)
+    assert [v["id"] for v in manager.list_visualizations("ds1")] == [viz_b]
+    assert manager.delete_visualization(viz_b)
+    assert manager.list_visualizations("ds1") == []
+
+def test_cleanup_resources_removes_expired_records(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    old_conn = manager.register_connection("file", {"path": "a.csv"})
+    new_conn = manager.register_connection("file", {"path": "b.csv"})
+    old_viz = manager.register_visualization("ds", "bar", {}, "a.png")
+    manager.connections[old_conn]["created_at"] = "2000-01-01T00:00:00.000000"
+    manager.visualizations._db.execute("UPDATE viz SET created_at = '2000-01-01T00:00:00.000000' WHERE id = ?", (old_viz,))
+
+    assert manager.cleanup_resources() == {"connections": 0, "datasets": 0, "visualizations": 0}
+    assert manager.cleanup_resources(older_than_days=1) == {"connections": 1, "datasets": 0, "visualizations": 1}
+    assert [c["id"] for c in manager.list_connections()] == [new_conn]
+    assert manager.list_visualizations("ds") == []
+
+def test_list_connections_includes_connections_registered_after_listing(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    first = manager.register_connection("file", {"path": "a.csv"})
+    assert [c["id"] for c in manager.list_connections()] == [first]
+
+    second = manager.register_connection("database", {"password": "secret"})
+    manager.update_connection_status(first, "closed")
+
+    assert [(c["id"], c["status"]) for c in manager.list_connections()] == [(first, "closed"), (second, "created")]
+    assert manager.list_connections()[1]["params"] == {"password": "********"}
+    assert manager.get_connection(second)["params"] == {"password": "secret"}
+
+def test_register_dataset_evicts_least_recently_used(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path), max_datasets=2)
+    ds_a = manager.register_dataset([1], {})
+    ds_b = manager.register_dataset([2], {})
+    manager.get_dataset(ds_a)
+    ds_c = manager.register_dataset([3], {})
+
+    assert list(manager.datasets) == [ds_a, ds_c]
+    assert manager.get_dataset(ds_b) is None
+
+def test_save_visualization_writes_image_and_config(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+
+    uri = asyncio.run(manager.save_visualization("bar", {"mark": "bar"}, b"\x89PNG", dataset_id="ds"))
+
+    viz = manager.get_visualization(uri.removeprefix("visualization://"))
+    with open(viz["image_path"], "rb") as f:
+        assert f.read() == b"\x89PNG"
+    with open(tmp_path / "visualizations" / f"viz_config_{viz['id']}.json") as f:
+        assert json.load(f)["config"] == {"mark": "bar"}
+
+def test_visualizations_persist_across_restarts(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    viz_id = manager.register_visualization("ds", "line", {"mark": "line", "width": 400}, "chart.png")
+
+    reopened = ResourceManager(storage_dir=str(tmp_path))
+
+    assert reopened.get_visualization(viz_id)["config"] == {"mark": "line", "width": 400}
+    assert [v["id"] for v in reopened.list_visualizations("ds")] == [viz_id]
+    assert reopened.get_visualization("missing") is None
+
+def test_transformations_recorded_in_one_tick_are_persisted(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    dataset_id = manager.register_dataset([1, 2], {})
+
+    async def transform():
+        manager.add_transformation(dataset_id, "filter", {"column": "a"})
+        manager.add_transformation(dataset_id, "sort", {"by": ["a"]})
+        await asyncio.sleep(0)
+
+    asyncio.run(transform())
+
+    history = ResourceManager(storage_dir=str(tmp_path))._transformations.history(dataset_id)
+    assert [(t["type"], t["params"]) for t in history] == [("filter", {"column": "a"}), ("sort", {"by": ["a"]})]
+    assert history == manager.get_dataset(dataset_id)["transformations"]
+
+def test_identical_images_share_one_file_until_last_reference_is_deleted(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+
+    async def save():
+        first = await manager.save_visualization("bar", {"mark": "bar"}, b"\x89PNG same")
+        second = await manager.save_visualization("bar", {"mark": "bar"}, b"\x89PNG same")
+        return first.removeprefix("visualization://"), second.removeprefix("visualization://")
+
+    first, second = asyncio.run(save())
+    image_path = manager.get_visualization(first)["image_path"]
+
+    assert manager.get_visualization(second)["image_path"] == image_path
+    manager.delete_visualization(first)
+    assert os.path.exists(image_path)
+    manager.delete_visualization(second)
+    assert not os.path.exists(image_path)
+
+def test_dataframe_datasets_are_stored_on_disk(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    df = pd.DataFrame({"region": ["n", "s", None], "sales": [1.5, 2.0, None]}, index=[10, 11, 12])
+    df = df.convert_dtypes(dtype_backend="pyarrow")
+
+    dataset_id = manager.register_dataset(df, {"source": "test"})
+
+    assert "data" not in manager.datasets[dataset_id]
+    pd.testing.assert_frame_equal(manager.get_dataset(dataset_id)["data"], df)
+    pd.testing.assert_frame_equal(manager.get_dataset(dataset_id, columns=["sales"])["data"], df[["sales"]])
+    manager.update_dataset(dataset_id, [{"region": "n"}])
+    assert manager.get_dataset(dataset_id)["data"] == [{"region": "n"}]
+    assert os.listdir(tmp_path / "datasets") == []
+
+def test_store_chart_data_writes_csv_once_per_content(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    rows = [{"month": "jan", "sales": 10}, {"month": "feb", "sales": 12}]
+
+    async def store():
+        refs = [await manager.store_chart_data(rows), await manager.store_chart_data(pd.DataFrame(rows))]
+        await manager.flush()
+        return refs
+
+    first, second = asyncio.run(store())
+
+    assert first == second
+    assert first["format"] == {"type": "csv"}
+    assert first["url"].startswith("chart-data://")
+    contents = asyncio.run(manager.get_resource(first["url"]))
+    assert contents.mime_type == "text/csv"
+    pd.testing.assert_frame_equal(pd.read_csv(io.StringIO(contents.text)), pd.DataFrame(rows), check_dtype=False)
+
+    spec = {"mark": "bar", "data": first}
+    local = manager.localize_spec(spec)
+    assert spec["data"]["url"] == first["url"]
+    pd.testing.assert_frame_equal(pd.read_csv(local["data"]["url"].removeprefix("file://")), pd.DataFrame(rows), check_dtype=False)
+
+def test_resource_listing_is_rebuilt_after_visualizations_change(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    first_id = manager.register_visualization("ds", "bar", {}, str(tmp_path / "a.png"))
+
+    first = asyncio.run(manager.list_resources())
+    assert [str(resource.uri) for resource in first] == [f"visualization://{first_id}"]
+    assert asyncio.run(manager.list_resources()) == first
+
+    second_id = manager.register_visualization("ds", "line", {}, str(tmp_path / "b.png"))
+    manager.delete_visualization(first_id)
+
+    assert [str(resource.uri) for resource in asyncio.run(manager.list_resources())] == [f"visualization://{second_id}"]
+
+def test_svg_visualizations_are_stored_compressed(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    svg = b"<svg xmlns='http://www.w3.org/2000/svg'></svg>"
+
+    async def save():
+        uri = await manager.save_visualization("bar", {"mark": "bar"}, svg, format="svg")
+        await manager.flush()
+        return uri
+
+    viz_id = asyncio.run(save()).removeprefix("visualization://")
+    image_path = manager.get_visualization(viz_id)["image_path"]
+
+    assert image_path.endswith(".svg.gz")
+    with open(image_path, "rb") as f:
+        assert gzip.decompress(f.read()) == svg
+    assert asyncio.run(manager.list_resources())[0].mime_type == "image/svg+xml"
+
+def test_artifact_writer_leaves_no_partial_file_on_error(tmp_path, monkeypatch):
+    from mcp_bi_visualizer.resources import async_writer
+
+    writer = async_writer.AsyncArtifactWriter()
+    target = tmp_path / "image.png"
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(async_writer.os, "fsync", failing_fsync)
+    with pytest.raises(OSError):
+        asyncio.run(writer.submit_bytes(str(target), b"png"))
+    monkeypatch.undo()
+
+    assert os.listdir(tmp_path) == []
+    assert asyncio.run(writer.submit_bytes(str(target), b"png")) == str(target)
+    assert target.read_bytes() == b"png"
+    writer.close()
+
+def test_get_resource_returns_visualization_images(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    svg = b"<svg xmlns='http://www.w3.org/2000/svg'></svg>"
+
+    async def save():
+        uris = [await manager.save_visualization("bar", {}, svg, format="svg"),
+                await manager.save_visualization("bar", {}, b"png", format="png")]
+        await manager.flush()
+        return [await manager.get_resource(uri) for uri in uris]
+
+    svg_contents, png_contents = asyncio.run(save())
+
+    assert svg_contents.text == svg.decode()
+    assert base64.b64decode(png_contents.blob) == b"png"
+    with pytest.raises(ValueError):
+        asyncio.run(manager.get_resource("chart-data://../index.db"))
+
+def test_close_persists_the_index_and_transformation_log(tmp_path):
+    manager = ResourceManager(storage_dir=str(tmp_path))
+    viz_id = manager.register_visualization("ds", "bar", {}, str(tmp_path / "a.png"))
+    dataset_id = manager.register_dataset([{"region": "n"}], {})
+    manager.add_transformation(dataset_id, "filter", {"column": "region"})
+    manager.close()
+
+    reopened = ResourceManager(storage_dir=str(tmp_path))
+    assert reopened.get_visualization(viz_id)["chart_type"] == "bar"
+    assert [t["type"] for t in reopened._transformations.history(dataset_id)] == ["filter"]
+    reopened.close()
+
+def test_delete_memo_reports_memos_with_empty_content():
+    from mcp_bi_visualizer.resources.memo import MemoResourceManager
+
+    memos = MemoResourceManager()
+    memo_id = memos.create_memo(None)
+
+    assert memos.delete_memo(memo_id) is True
+    assert memos.delete_memo(memo_id) is False
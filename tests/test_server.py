@@ -1,19 +1,4 @@
 import pytest
-import asyncio
-from mcp_bi_visualizer.server import BiVisualizerServer
-
-@pytest.fixture
-def event_loop():
-    loop = asyncio.get_event_loop()
-    yield loop
-    loop.close()
-
-@pytest.fixture
-async def server():
-    server = BiVisualizerServer()
-    await server.app.start()
-    yield server
-    await server.app.stop()
 
 @pytest.mark.asyncio
 async def test_server_initialization(server):
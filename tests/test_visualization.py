@@ -1,19 +1,5 @@
 import pytest
-import asyncio
-from mcp_bi_visualizer.server import BiVisualizerServer
-
-@pytest.fixture
-def event_loop():
-    loop = asyncio.get_event_loop()
-    yield loop
-    loop.close()
-
-@pytest.fixture
-async def server():
-    server = BiVisualizerServer()
-    await server.app.start()
-    yield server
-    await server.app.stop()
+from mcp_bi_visualizer.visualization.vega_lite import VegaLiteGenerator
 
 @pytest.mark.asyncio
 async def test_create_visualization(server):
@@ -52,4 +38,16 @@ async def test_add_insight(server):
 
     # Assertions
     assert result["success"] is True
-    assert result["message"] == "Insight added to memo"
\ No newline at end of file
+    assert result["message"] == "Insight added to memo"
+
+
+def test_create_chart_infers_field_types_from_values():
+    data = {"values": [{"day": "2024-01-01T00:00:00.000", "sales": 3.5}]}
+    spec = VegaLiteGenerator().create_chart("Line", data, "day", "sales", {"title": "Sales"})
+
+    assert spec["mark"]["type"] == "line"
+    assert spec["encoding"]["x"] == {"field": "day", "type": "temporal"}
+    assert spec["encoding"]["y"] == {"field": "sales", "type": "quantitative"}
+    assert spec["title"] == "Sales"
+    with pytest.raises(ValueError):
+        VegaLiteGenerator().create_chart("heatmap", data, "day", "sales")